@@ -0,0 +1,180 @@
+# 1. Importando bibliotecas padrao
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+from typing import Dict, Any, List
+
+# 2. Importando blibliotecas de terceiros
+import numpy as np
+
+# 5. Importando modulos locais
+from core import cache, boards_sync
+from handlers import boards_handler
+from utils import fake_boards
+
+# Parametros do benchmark
+BENCHMARK_SIZES = (1_000, 10_000, 100_000)
+BENCHMARK_REPETITIONS = 20
+BENCHMARK_PROJECT = "Sonar"
+BENCHMARK_PERCENTILES = (50, 95, 99)
+
+# Uma pergunta representativa por familia de consulta
+BENCHMARK_QUERIES = {
+    'visao_geral': "sonar visão geral",
+    'quantidade_tipo': "sonar quantos bugs existem",
+    'lista_tipo': "sonar listar bugs",
+    'a_fazer': "sonar tarefas a fazer",
+    'em_andamento': "sonar tarefas em andamento",
+    'atrasadas': "sonar tarefas atrasadas",
+    'mais_tarefas': "sonar quem tem mais tarefas",
+    'hierarquia': "sonar hierarquia das user stories",
+    'colaborador': "sonar tarefas da ana souza",
+    'colaborador_estado': "sonar tarefas em andamento do bruno lima",
+    'cliente': "sonar cliente com mais atividades",
+    'prazo_semana': "sonar o que vence esta semana",
+    'alterados': "sonar itens alterados nos últimos 7 dias",
+    'burndown': "sonar burndown",
+    'throughput': "sonar throughput",
+    'mudancas': "sonar o que mudou desde ontem",
+}
+
+
+async def run_size(quantidade: int, repeticoes: int, seed: int) -> Dict[str, Any]:
+    """
+    Mede todas as familias de consulta em um Board sintetico.
+
+    args:
+        quantidade: int de itens do Board
+        repeticoes: int de medicoes por familia (frias e quentes)
+        seed: int da semente do gerador
+
+    retorna dict com tempo de carga e, por familia, percentis de latencia (ms) e pico de memoria (bytes)
+    """
+
+    servico = fake_boards.FakeAzureBoardsService(BENCHMARK_PROJECT, fake_boards.generate_work_items(quantidade, seed))
+    agente_cache = cache.CacheAgent()
+    handler = boards_handler.BoardsHandler(
+        agente_cache, boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico)
+    )
+
+    inicio = time.perf_counter()
+    await handler.answer_with_boards(BENCHMARK_QUERIES['visao_geral'])
+    carga_ms = (time.perf_counter() - inicio) * 1000
+
+    resultados = {}
+    for familia, pergunta in BENCHMARK_QUERIES.items():
+        frias, quentes = [], []
+        for _ in range(repeticoes):
+            _drop_answers(agente_cache, handler)
+            frias.append(await _timed(handler, pergunta))
+        for _ in range(repeticoes):
+            quentes.append(await _timed(handler, pergunta))
+
+        _drop_answers(agente_cache, handler)
+        tracemalloc.start()
+        await handler.answer_with_boards(pergunta)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        resultados[familia] = {
+            'cold_ms': _percentiles(frias),
+            'warm_ms': _percentiles(quentes),
+            'peak_memory_bytes': pico,
+        }
+
+    await agente_cache.stop()
+    await handler.SyncAgent.fetcher.close()
+    return {'items': quantidade, 'load_ms': round(carga_ms, 3), 'queries': resultados}
+
+
+async def run(tamanhos: List[int], repeticoes: int, seed: int) -> Dict[str, Any]:
+    """
+    Executa o benchmark para varios tamanhos de Board.
+
+    args:
+        tamanhos: list de int de itens por Board
+        repeticoes: int de medicoes por familia
+        seed: int da semente do gerador
+
+    retorna dict serializavel em JSON com os resultados
+    """
+
+    resultados = []
+    for quantidade in tamanhos:
+        with contextlib.redirect_stdout(io.StringIO()):
+            resultados.append(await run_size(quantidade, repeticoes, seed))
+    return {'benchmark': "boards", 'seed': seed, 'repetitions': repeticoes, 'results': resultados}
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Ponto de entrada de linha de comando (python -m benchmarks.boards_benchmark).
+
+    args:
+        argv: list de argumentos (padrao sys.argv)
+
+    retorna int do codigo de saida
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark sintetico das consultas de AzureBoards.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(BENCHMARK_SIZES))
+    parser.add_argument("--repetitions", type=int, default=BENCHMARK_REPETITIONS)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="arquivo JSON de saida (padrao stdout)")
+    args = parser.parse_args(argv)
+
+    relatorio = asyncio.run(run(args.sizes, args.repetitions, args.seed))
+    texto = json.dumps(relatorio, indent=2, ensure_ascii=False)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+        _print_summary(relatorio)
+    else:
+        print(texto)
+    return 0
+
+
+async def _timed(handler: boards_handler.BoardsHandler, pergunta: str) -> float:
+    """Medindo a latencia (ms) de uma pergunta."""
+
+    inicio = time.perf_counter()
+    await handler.answer_with_boards(pergunta)
+    return (time.perf_counter() - inicio) * 1000
+
+
+def _drop_answers(agente_cache: cache.CacheAgent, handler: boards_handler.BoardsHandler) -> None:
+    """Descartando as respostas memorizadas, para medir a renderizacao."""
+
+    entry = agente_cache.boards_cache.get_entry(handler._boards_cache_key(BENCHMARK_PROJECT))
+    for nome in [nome for nome in (entry or {}).get('derived', {}) if nome.startswith("answers")]:
+        del entry['derived'][nome]
+
+
+def _percentiles(amostras: List[float]) -> Dict[str, float]:
+    """Calculando os percentis de latencia de uma lista de amostras."""
+
+    valores = np.percentile(amostras, BENCHMARK_PERCENTILES)
+    return {f"p{p}": round(float(v), 3) for p, v in zip(BENCHMARK_PERCENTILES, valores)}
+
+
+def _print_summary(relatorio: Dict[str, Any]) -> None:
+    """Imprimindo um resumo legivel dos resultados."""
+
+    for resultado in relatorio['results']:
+        print(f"📊 {resultado['items']} itens (carga {resultado['load_ms']:.0f} ms)")
+        for familia, medidas in resultado['queries'].items():
+            print(
+                f"   {familia:<20} frio p50 {medidas['cold_ms']['p50']:>9.3f} ms  "
+                f"p99 {medidas['cold_ms']['p99']:>9.3f} ms  quente p50 {medidas['warm_ms']['p50']:>7.3f} ms  "
+                f"pico {medidas['peak_memory_bytes'] / 1024 / 1024:>6.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
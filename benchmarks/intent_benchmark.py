@@ -0,0 +1,184 @@
+# 1. Importando bibliotecas padrao
+import argparse
+import json
+import random
+import sys
+import time
+from types import SimpleNamespace
+from typing import Dict, Any, List, Tuple
+
+# 4. Importando constantes
+from src.services.constants import (
+    # Padroes
+    ADMIN_COMMANDS, BOARDS_COMMANDS, LEARNING_TRIGGERS, LIST_PATTERNS,
+    FILE_KEYWORDS, ACTION_KEYWORDS, CASUAL_WORDS, GREETING_WORDS,
+)
+
+# 5. Importando modulos locais
+from core import intent_router
+from core.intent_router import FILE_SCORE_CACHE_SIZE
+
+# Parametros do benchmark
+BENCHMARK_MESSAGES = 20_000
+BENCHMARK_USERS = 200
+BENCHMARK_UNIQUE_RATIO = 0.3
+BENCHMARK_SESSION_RATIO = 0.05
+
+FILLER_WORDS = ("por favor", "preciso", "do projeto", "da reunião", "de ontem", "sobre vendas", "para amanhã", "agora")
+FILE_NAMES = ("Relatorio_Final.pdf", "Manifesto_Tribo_Sonar_Labs.docx", "orcamento.xlsx", "apresentacao.pptx")
+
+
+def generate_messages(quantidade: int, usuarios: int, seed: int,
+                      repetidas: bool = True) -> Tuple[List[str], List[str]]:
+    """
+    Gera mensagens sinteticas deterministicas a partir das listas de palavras-chave.
+
+    args:
+        quantidade: int de mensagens
+        usuarios: int de usuarios distintos
+        seed: int da semente aleatoria
+        repetidas: se True, as mensagens sao sorteadas de BENCHMARK_UNIQUE_RATIO textos distintos (com repeticoes);
+            se False, todas as mensagens sao distintas
+
+    retorna tupla (list de mensagens, list de user_ids)
+    """
+
+    gerador = random.Random(seed)
+    fontes = [
+        list(ADMIN_COMMANDS.keys()), list(BOARDS_COMMANDS), list(LEARNING_TRIGGERS), list(LIST_PATTERNS),
+        list(FILE_KEYWORDS) + list(ACTION_KEYWORDS), list(CASUAL_WORDS), list(GREETING_WORDS), list(FILE_NAMES),
+    ]
+    fontes = [fonte for fonte in fontes if fonte]
+
+    unicas = []
+    total_unicas = max(1, int(quantidade * BENCHMARK_UNIQUE_RATIO)) if repetidas else quantidade
+    for posicao in range(total_unicas):
+        partes = [gerador.choice(gerador.choice(fontes)) for _ in range(gerador.randint(1, 3))]
+        partes += gerador.sample(FILLER_WORDS, gerador.randint(0, 3))
+        gerador.shuffle(partes)
+        if not repetidas:
+            partes.append(f"ref {posicao}")
+        unicas.append(" ".join(partes))
+
+    mensagens = [gerador.choice(unicas) for _ in range(quantidade)] if repetidas else unicas
+    user_ids = [f"user-{gerador.randrange(usuarios)}" for _ in range(quantidade)]
+    return mensagens, user_ids
+
+
+def run(quantidade: int, usuarios: int, seed: int) -> Dict[str, Any]:
+    """
+    Mede a vazao da classificacao mensagem a mensagem (sem deduplicacao) e de classify_batch (deduplicacao de
+    textos repetidos), em um corpus com repeticoes e em um corpus sem repeticoes, conferindo que as intencoes
+    sao identicas.
+
+    args:
+        quantidade: int de mensagens
+        usuarios: int de usuarios distintos
+        seed: int da semente aleatoria
+
+    retorna dict serializavel em JSON com os resultados
+    """
+
+    corpora = {}
+    for corpus, repetidas in (("repeated", True), ("unique", False)):
+        mensagens, user_ids = generate_messages(quantidade, usuarios, seed, repetidas)
+        corpora[corpus] = _compare_modes(mensagens, user_ids, seed)
+
+    return {
+        'benchmark': "intent_routing",
+        'messages': quantidade,
+        'seed': seed,
+        'identical': all(resultado['identical'] for resultado in corpora.values()),
+        'corpora': corpora,
+    }
+
+
+def _compare_modes(mensagens: List[str], user_ids: List[str], seed: int) -> Dict[str, Any]:
+    """
+    Classifica um corpus mensagem a mensagem (baseline sem deduplicacao) e com classify_batch.
+
+    args:
+        mensagens: list de mensagens
+        user_ids: list de user_ids das mensagens
+        seed: int da semente aleatoria do estado de sessao
+
+    retorna dict com vazao de cada modo, speedup e distribuicao das intencoes
+    """
+
+    quantidade = len(mensagens)
+    gerador = random.Random(seed)
+    sessao = sorted(set(user_ids))
+    boards = SimpleNamespace(modo_analise_boards={u: True for u in sessao if gerador.random() < BENCHMARK_SESSION_RATIO})
+    geral = SimpleNamespace(aprendizado_manual_ativo={u: True for u in sessao if gerador.random() < BENCHMARK_SESSION_RATIO})
+
+    resultados = {}
+    intents = {}
+    for modo in ("per_message", "batch"):
+        # Baseline sem nenhuma deduplicacao: nem o cache do FileScorer reaproveita textos repetidos
+        scorer = intent_router.FileScorer(max_entries=0 if modo == "per_message" else FILE_SCORE_CACHE_SIZE)
+        router = intent_router.IntentRouter(boards, geral, file_scorer=scorer)
+
+        inicio = time.perf_counter()
+        if modo == "batch":
+            intents[modo] = router.classify_batch(mensagens, user_ids)
+        else:
+            intents[modo] = [router._detect_intent(m, u) for m, u in zip(mensagens, user_ids)]
+        segundos = time.perf_counter() - inicio
+
+        resultados[modo] = {
+            'seconds': round(segundos, 4),
+            'messages_per_second': round(quantidade / segundos, 1),
+            'file_scorer': scorer.get_stats(),
+        }
+
+    distribuicao = {}
+    for intent in intents['batch']:
+        distribuicao[intent] = distribuicao.get(intent, 0) + 1
+
+    return {
+        'messages': quantidade,
+        'unique_messages': len(set(mensagens)),
+        'identical': intents['batch'] == intents['per_message'],
+        'speedup': round(resultados['per_message']['seconds'] / resultados['batch']['seconds'], 2),
+        'intents': distribuicao,
+        'results': resultados,
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Ponto de entrada de linha de comando (python -m benchmarks.intent_benchmark).
+
+    args:
+        argv: list de argumentos (padrao sys.argv)
+
+    retorna int do codigo de saida (1 se as intencoes em lote divergirem)
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark de vazao da classificacao de intencoes.")
+    parser.add_argument("--messages", type=int, default=BENCHMARK_MESSAGES)
+    parser.add_argument("--users", type=int, default=BENCHMARK_USERS)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="arquivo JSON de saida (padrao stdout)")
+    args = parser.parse_args(argv)
+
+    relatorio = run(args.messages, args.users, args.seed)
+    texto = json.dumps(relatorio, indent=2, ensure_ascii=False)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+        for corpus, resultado in relatorio['corpora'].items():
+            print(
+                f"📊 {corpus}: {resultado['messages']} mensagens ({resultado['unique_messages']} distintas): "
+                f"{resultado['results']['per_message']['messages_per_second']:.0f} msg/s "
+                f"-> lote deduplicado {resultado['results']['batch']['messages_per_second']:.0f} msg/s "
+                f"({resultado['speedup']}x, idênticas: {resultado['identical']})"
+            )
+    else:
+        print(texto)
+    return 0 if relatorio['identical'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
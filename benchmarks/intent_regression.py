@@ -0,0 +1,237 @@
+# 1. Importando bibliotecas padrao
+import argparse
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+from typing import Dict, Any, List
+
+# 2. Importando blibliotecas de terceiros
+import numpy as np
+
+# 5. Importando modulos locais
+from core import intent_router
+
+# Parametros do harness
+# Os rotulos do corpus e o baseline de qualidade foram gerados com as constantes de src.services.constants
+# disponiveis no ambiente de desenvolvimento; regrave o baseline (--update-baseline) ao alterar as constantes.
+# Vazao e latencia dependem da maquina: so sao medidas e comparadas com --check-timing, contra um baseline
+# gravado na mesma maquina (--update-baseline --check-timing).
+REGRESSION_DIR = os.path.dirname(os.path.abspath(__file__))
+REGRESSION_CORPUS = os.path.join(REGRESSION_DIR, "intent_corpus.jsonl")
+REGRESSION_BASELINE = os.path.join(REGRESSION_DIR, "intent_baseline.json")
+REGRESSION_REPETITIONS = 200
+REGRESSION_QUALITY_TOLERANCE = 0.0
+REGRESSION_THROUGHPUT_TOLERANCE = 0.25
+REGRESSION_LATENCY_TOLERANCE = 0.5
+
+
+def load_corpus(caminho: str = REGRESSION_CORPUS) -> List[Dict[str, str]]:
+    """
+    Carrega o corpus rotulado (JSONL com 'message', 'intent' e 'session' opcional: 'boards' ou 'learning').
+
+    args:
+        caminho: String do arquivo do corpus
+
+    retorna list de dicts com as mensagens rotuladas
+    """
+
+    with open(caminho, "r", encoding="utf-8") as arquivo:
+        return [json.loads(linha) for linha in arquivo if linha.strip()]
+
+
+def build_router(corpus: List[Dict[str, str]]) -> intent_router.IntentRouter:
+    """
+    Monta um IntentRouter com o estado de sessao dos Handlers simulado a partir do corpus.
+
+    args:
+        corpus: list de mensagens rotuladas
+
+    retorna IntentRouter com FileScorer proprio (sem cache compartilhado)
+    """
+
+    boards = SimpleNamespace(modo_analise_boards={})
+    geral = SimpleNamespace(aprendizado_manual_ativo={})
+
+    for posicao, exemplo in enumerate(corpus):
+        if exemplo.get('session') == "boards":
+            boards.modo_analise_boards[_user_id(posicao)] = True
+        elif exemplo.get('session') == "learning":
+            geral.aprendizado_manual_ativo[_user_id(posicao)] = True
+
+    return intent_router.IntentRouter(boards, geral, file_scorer=intent_router.FileScorer())
+
+
+def run(corpus: List[Dict[str, str]], repeticoes: int) -> Dict[str, Any]:
+    """
+    Classifica o corpus com _detect_intent, medindo qualidade por intencao e, se houver repeticoes, vazao e
+    latencia. Cada passada cronometrada comeca com o cache do FileScorer vazio (medida a frio, sem reaproveitar
+    as passadas anteriores); a vazao usa a mediana das passadas, menos sensivel a ruido da maquina.
+
+    args:
+        corpus: list de mensagens rotuladas
+        repeticoes: int de passadas completas pelo corpus para as medidas de tempo (0 para nao medir)
+
+    retorna dict serializavel em JSON com precisao/recall por intencao, msgs/s e p99 (None sem medida) e erros
+    """
+
+    router = build_router(corpus)
+    previstas = [router._detect_intent(exemplo['message'], _user_id(posicao)) for posicao, exemplo in enumerate(corpus)]
+
+    latencias = []
+    passadas = []
+    for _ in range(repeticoes):
+        router.FileScorer.clear()
+        inicio = time.perf_counter()
+        for posicao, exemplo in enumerate(corpus):
+            antes = time.perf_counter_ns()
+            router._detect_intent(exemplo['message'], _user_id(posicao))
+            latencias.append(time.perf_counter_ns() - antes)
+        passadas.append(time.perf_counter() - inicio)
+
+    return {
+        'benchmark': "intent_regression",
+        'messages': len(corpus),
+        'repetitions': repeticoes,
+        'accuracy': round(sum(p == e['intent'] for p, e in zip(previstas, corpus)) / len(corpus), 4),
+        'intents': _per_intent_metrics([e['intent'] for e in corpus], previstas),
+        'messages_per_second': round(len(corpus) / float(np.median(passadas)), 1) if passadas else None,
+        'p99_us': round(float(np.percentile(latencias, 99)) / 1000, 3) if latencias else None,
+        'errors': [
+            {'message': e['message'], 'expected': e['intent'], 'got': p}
+            for p, e in zip(previstas, corpus) if p != e['intent']
+        ],
+    }
+
+
+def compare(relatorio: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """
+    Compara um relatorio com o baseline armazenado. Vazao e latencia so sao comparadas quando medidas no
+    relatorio e presentes no baseline (ambos gravados na mesma maquina).
+
+    args:
+        relatorio: dict retornado por run
+        baseline: dict de um relatorio anterior
+
+    retorna list de Strings descrevendo cada regressao (vazia se nao houver)
+    """
+
+    regressoes = []
+
+    for intent, anteriores in baseline['intents'].items():
+        atuais = relatorio['intents'].get(intent, {'precision': 0.0, 'recall': 0.0})
+        for metrica in ("precision", "recall"):
+            if atuais[metrica] < anteriores[metrica] - REGRESSION_QUALITY_TOLERANCE:
+                regressoes.append(f"{intent} {metrica}: {anteriores[metrica]:.3f} -> {atuais[metrica]:.3f}")
+
+    if relatorio['messages_per_second'] is None or baseline.get('messages_per_second') is None:
+        return regressoes
+
+    if relatorio['messages_per_second'] < baseline['messages_per_second'] * (1 - REGRESSION_THROUGHPUT_TOLERANCE):
+        regressoes.append(
+            f"vazão: {baseline['messages_per_second']:.0f} -> {relatorio['messages_per_second']:.0f} msg/s"
+        )
+
+    if relatorio['p99_us'] > baseline['p99_us'] * (1 + REGRESSION_LATENCY_TOLERANCE):
+        regressoes.append(f"p99: {baseline['p99_us']:.1f} -> {relatorio['p99_us']:.1f} µs")
+
+    return regressoes
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Ponto de entrada de linha de comando (python -m benchmarks.intent_regression).
+
+    args:
+        argv: list de argumentos (padrao sys.argv)
+
+    retorna int do codigo de saida (1 se houver regressao em relacao ao baseline ou se o baseline nao existir)
+    """
+
+    parser = argparse.ArgumentParser(description="Regressão e vazão da classificação de intenções.")
+    parser.add_argument("--corpus", default=REGRESSION_CORPUS)
+    parser.add_argument("--baseline", default=REGRESSION_BASELINE)
+    parser.add_argument("--repetitions", type=int, default=REGRESSION_REPETITIONS)
+    parser.add_argument("--check-timing", action="store_true",
+                        help="mede e compara vazao e p99 (numeros dependentes da maquina)")
+    parser.add_argument("--update-baseline", action="store_true", help="grava o resultado atual como baseline")
+    parser.add_argument("--output", help="arquivo JSON de saida do relatorio")
+    args = parser.parse_args(argv)
+
+    relatorio = run(load_corpus(args.corpus), args.repetitions if args.check_timing else 0)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+    _print_summary(relatorio)
+
+    if args.update_baseline:
+        chaves = ("intents", "messages_per_second", "p99_us") if args.check_timing else ("intents",)
+        with open(args.baseline, "w", encoding="utf-8") as arquivo:
+            json.dump({chave: relatorio[chave] for chave in chaves}, arquivo, indent=2, ensure_ascii=False)
+        print(f"💾 Baseline gravado em {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"❌ Baseline ausente ({args.baseline}); grave um com --update-baseline")
+        return 1
+
+    with open(args.baseline, "r", encoding="utf-8") as arquivo:
+        regressoes = compare(relatorio, json.load(arquivo))
+
+    for regressao in regressoes:
+        print(f"❌ Regressão: {regressao}")
+    if not regressoes:
+        print("✅ Sem regressões em relação ao baseline")
+    return 1 if regressoes else 0
+
+
+def _user_id(posicao: int) -> str:
+    """Montando o user_id simulado de uma mensagem do corpus."""
+
+    return f"corpus-{posicao}"
+
+
+def _per_intent_metrics(esperadas: List[str], previstas: List[str]) -> Dict[str, Dict[str, float]]:
+    """
+    Calcula precisao e recall de cada intencao.
+
+    args:
+        esperadas: list de intencoes rotuladas
+        previstas: list de intencoes detectadas
+
+    retorna dict {intencao: {'precision', 'recall', 'support'}}
+    """
+
+    metricas = {}
+    for intent in sorted(set(esperadas) | set(previstas)):
+        acertos = sum(e == intent and p == intent for e, p in zip(esperadas, previstas))
+        total_previstas = previstas.count(intent)
+        total_esperadas = esperadas.count(intent)
+        metricas[intent] = {
+            'precision': round(acertos / total_previstas, 4) if total_previstas else 0.0,
+            'recall': round(acertos / total_esperadas, 4) if total_esperadas else 0.0,
+            'support': total_esperadas,
+        }
+    return metricas
+
+
+def _print_summary(relatorio: Dict[str, Any]) -> None:
+    """Imprimindo um resumo legivel dos resultados."""
+
+    tempos = "" if relatorio['messages_per_second'] is None else (
+        f", {relatorio['messages_per_second']:.0f} msg/s, p99 {relatorio['p99_us']:.1f} µs"
+    )
+    print(f"📊 {relatorio['messages']} mensagens rotuladas: acurácia {relatorio['accuracy']:.3f}{tempos}")
+    for intent, medidas in relatorio['intents'].items():
+        print(
+            f"   {intent:<10} precisão {medidas['precision']:.3f}  recall {medidas['recall']:.3f}  "
+            f"({medidas['support']} exemplos)"
+        )
+    for erro in relatorio['errors']:
+        print(f"   ✗ '{erro['message']}': esperado {erro['expected']}, obtido {erro['got']}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,5 @@
 # 5. Importando modulos locais
-from core import cache, responder
+from core import cache, cache_backends, cache_warmer, boards_history, responder, tracing
 from utils import helpers
 from handlers import general_handler, boards_handler, file_handler
 from config import promts
@@ -7,13 +7,45 @@ from config import promts
 class Sofia:
     """Sistema de IA conversacional Sofia - Assistente inteligente para gestão de conhecimento"""
  
-    def __init__(self) -> None:
-        self.CacheAgent = cache.CacheAgent()
+    def __init__(self, disk_cache_dir: str = None, shared_cache_url: str = None, enable_warmup: bool = False,
+                 history_dir: str = None) -> None:
+        boards_backend = cache_backends.create_shared_backend(shared_cache_url) if shared_cache_url else None
+        self.CacheAgent = cache.CacheAgent(disk_cache_dir=disk_cache_dir, boards_backend=boards_backend)
         self.Helper = helpers.Helper()
         self.PromptAgent = promts.PromptAgent(self.Helper)
 
-        self.BoardsHandler = boards_handler.BoardsHandler(self.CacheAgent)
+        self.BoardsHandler = boards_handler.BoardsHandler(self.CacheAgent, History=boards_history.BoardsHistory(history_dir))
         self.GeneralHandler = general_handler.GeneralHandler(self.CacheAgent, self.Helper, self.PromptAgent)
         self.FileHandler = file_handler.FileHandler(self.Helper, self.GeneralHandler)
 
-        self.Responder = responder.Responder(self.Helper, self.GeneralHandler, self.BoardsHandler, self.FileHandler)   
\ No newline at end of file
+        self.Tracer = tracing.Tracer()
+        self.Responder = responder.Responder(self.Helper, self.GeneralHandler, self.BoardsHandler, self.FileHandler,
+                                             self.Tracer)
+
+        self.CacheWarmer = cache_warmer.CacheWarmer(self.CacheAgent) if enable_warmup else None
+
+    async def start(self) -> None:
+        """Inicializa as tarefas de segundo plano (pre-carregamento dos Boards, se ativado, roda sem ser aguardado)."""
+
+        if self.CacheWarmer is not None:
+            await self.CacheWarmer.start()
+
+    async def stop(self) -> None:
+        """Encerra as tarefas de segundo plano (aquecimento, limpeza de cache e buscas)."""
+
+        if self.CacheWarmer is not None:
+            await self.CacheWarmer.stop()
+        await self.CacheAgent.stop()
+        await self.BoardsHandler.SyncAgent.fetcher.close()
+
+    def export_latency(self, caminho: str = None) -> dict:
+        """
+        Exporta os histogramas de latencia por intencao e os rastros recentes das respostas.
+
+        args:
+            caminho: arquivo JSON de saida (opcional)
+
+        retorna dict exportado
+        """
+
+        return self.Tracer.export_json(caminho) if caminho else self.Tracer.export()
@@ -18,6 +18,20 @@ from database.fragments.participacao_fragment import gerar_fragmento_participaco
 
 # 5. Importando modulos locais
 from utils import helpers
+from core import tracing
+
+# Geradores de fragmentos do prompt geral, na ordem em que entram no prompt
+FRAGMENT_GENERATORS = (
+    gerar_fragmento_persona,
+    gerar_fragmento_empresa,
+    gerar_fragmento_setores,
+    gerar_fragmento_funcionarios,
+    gerar_fragmento_gerentes,
+    gerar_fragmento_projetos,
+    gerar_fragmento_participacoes,
+    gerar_fragmento_conhecimentos,
+    gerar_fragmento_cerimonias,
+)
 
 class PromptAgent:
     """Agente de processamento de Propmts."""
@@ -53,18 +67,11 @@ class PromptAgent:
         retorna uma String do prompt gerado
         """
         
+        fragmentos = []
         with SessionLocal() as db:
-            fragmentos = [
-                gerar_fragmento_persona(db),
-                gerar_fragmento_empresa(db),
-                gerar_fragmento_setores(db),
-                gerar_fragmento_funcionarios(db),
-                gerar_fragmento_gerentes(db),
-                gerar_fragmento_projetos(db),  
-                gerar_fragmento_participacoes(db),
-                gerar_fragmento_conhecimentos(db),
-                gerar_fragmento_cerimonias(db),
-            ]
+            for gerador in FRAGMENT_GENERATORS:
+                with tracing.span(f"db.{gerador.__name__}"):
+                    fragmentos.append(gerador(db))
     
         data_hoje = datetime.now().strftime("%d de %B de %Y")
         fragmentos.append(
@@ -0,0 +1,142 @@
+# 1. Importando bibliotecas padrao
+from datetime import date, timedelta
+from typing import Optional
+
+# 2. Importando blibliotecas de terceiros
+import numpy as np
+import pandas as pd
+
+# Colunas derivadas dos campos de data do Azure, gravadas pelo BoardsSyncAgent em cada sincronizacao
+DUE_DATE_COLUMN = "prazo_azure"
+CHANGED_DATE_COLUMN = "alteracao_azure"
+
+
+class BoardsDates:
+    """Datas de um DataFrame de AzureBoards convertidas uma vez por versao dos dados, para consultas vetorizadas."""
+
+    def __init__(self, df: pd.DataFrame, abertos: Optional[np.ndarray] = None) -> None:
+        """
+        Construtor das datas. Converte as colunas derivadas de prazo e de alteracao para datetime64.
+
+        args:
+            df: DataFrame com itens AzureBoards (colunas DUE_DATE_COLUMN e CHANGED_DATE_COLUMN, se houver)
+            abertos: array bool dos itens abertos, definido pelas funcoes de processamento (todos se None)
+
+        """
+
+        self.due_days = _to_days(df[DUE_DATE_COLUMN]) if DUE_DATE_COLUMN in df.columns else None
+        self.changed_at = _to_naive_utc(df[CHANGED_DATE_COLUMN]) if CHANGED_DATE_COLUMN in df.columns else None
+        self.open = np.asarray(abertos, dtype=bool) if abertos is not None else np.ones(len(df), dtype=bool)
+
+        self._reference_day = None
+        self._days_overdue = None
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def days_overdue(self, hoje: date) -> Optional[np.ndarray]:
+        """
+        Calcula os dias de atraso de cada item em relacao ao dia de referencia (recalculado so quando o dia muda).
+
+        args:
+            hoje: date de referencia
+
+        retorna array float de dias de atraso (NaN sem prazo, <= 0 se no prazo) ou None se nao ha coluna de prazo
+        """
+
+        if self.due_days is None:
+            return None
+
+        if self._reference_day != hoje:
+            dias = (np.datetime64(hoje, 'D') - self.due_days).astype('timedelta64[D]').astype(float)
+            dias[np.isnat(self.due_days)] = np.nan
+            self._days_overdue = dias
+            self._reference_day = hoje
+        return self._days_overdue
+
+    def overdue_positions(self, hoje: date) -> Optional[np.ndarray]:
+        """
+        Seleciona os itens abertos com prazo vencido, dos mais atrasados para os menos.
+
+        args:
+            hoje: date de referencia
+
+        retorna array de posicoes ou None se nao ha coluna de prazo
+        """
+
+        dias = self.days_overdue(hoje)
+        if dias is None:
+            return None
+
+        posicoes = np.flatnonzero(self.open & (dias > 0))
+        return posicoes[np.argsort(-dias[posicoes], kind="stable")]
+
+    def due_between_positions(self, inicio: date, fim: date) -> Optional[np.ndarray]:
+        """
+        Seleciona os itens abertos com prazo entre duas datas (inclusive), em ordem de prazo.
+
+        args:
+            inicio: date inicial
+            fim: date final
+
+        retorna array de posicoes ou None se nao ha coluna de prazo
+        """
+
+        if self.due_days is None:
+            return None
+
+        mascara = self.open & (self.due_days >= np.datetime64(inicio, 'D')) & (self.due_days <= np.datetime64(fim, 'D'))
+        posicoes = np.flatnonzero(mascara)
+        return posicoes[np.argsort(self.due_days[posicoes], kind="stable")]
+
+    def changed_since_positions(self, desde: pd.Timestamp) -> Optional[np.ndarray]:
+        """
+        Seleciona os itens alterados a partir de um instante, dos mais recentes para os mais antigos.
+
+        args:
+            desde: Timestamp (UTC) inicial
+
+        retorna array de posicoes ou None se nao ha coluna de alteracao
+        """
+
+        if self.changed_at is None:
+            return None
+
+        limite = _to_naive_utc(pd.Series([desde]))[0]
+        posicoes = np.flatnonzero(self.changed_at >= limite)
+        return posicoes[np.argsort(self.changed_at[posicoes], kind="stable")[::-1]]
+
+
+def week_bounds(hoje: date) -> tuple:
+    """
+    Retorna o primeiro (segunda-feira) e o ultimo (domingo) dia da semana de uma data.
+
+    args:
+        hoje: date de referencia
+
+    retorna tupla (date inicial, date final)
+    """
+
+    inicio = hoje - timedelta(days=hoje.weekday())
+    return inicio, inicio + timedelta(days=6)
+
+
+def _to_naive_utc(serie: pd.Series) -> np.ndarray:
+    """
+    Converte uma coluna de datas para datetime64[ns] em UTC sem fuso (NaT para valores invalidos).
+
+    args:
+        serie: Series de datas (texto ou datetime)
+
+    retorna array datetime64[ns]
+    """
+
+    datas = pd.to_datetime(serie, errors="coerce", utc=True, format="mixed")
+    return datas.dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+
+
+def _to_days(serie: pd.Series) -> np.ndarray:
+    """Convertendo uma coluna de datas para dias (datetime64[D])."""
+
+    return _to_naive_utc(serie).astype("datetime64[D]")
@@ -0,0 +1,115 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Optional, List, Callable
+
+# Parametros da busca
+BOARDS_BATCH_SIZE = 100
+BOARDS_MAX_CONCURRENT_FETCHES = 4
+
+
+class AsyncBoardsFetcher:
+    """
+    Busca de itens de AzureBoards sem bloquear o event loop. Os metodos do proprio servico (autenticacao, campos
+    e paginacao do servico) rodam em threads, limitados por um orcamento de chamadas ao Azure compartilhado
+    entre as consultas dos usuarios e o aquecimento do cache.
+    """
+
+    def __init__(self, batch_size: int = BOARDS_BATCH_SIZE,
+                 max_concurrency: int = BOARDS_MAX_CONCURRENT_FETCHES) -> None:
+        """
+        Construtor da busca.
+
+        args:
+            batch_size: int de tamanho do lote repassado ao servico
+            max_concurrency: int maximo de chamadas ao Azure em andamento ao mesmo tempo
+
+        """
+
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.limiter = asyncio.Semaphore(max_concurrency)
+        self.stats = {'calls': 0, 'queued': 0}
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency + 1, thread_name_prefix="boards-fetch")
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    async def run_blocking(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Executa uma funcao sincrona em thread, sem bloquear o event loop (fora do orcamento de chamadas).
+
+        args:
+            func: funcao sincrona
+            args, kwargs: argumentos da funcao
+
+        retorna o resultado da funcao
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def call_azure(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Executa uma chamada ao Azure em thread, aguardando vaga no orcamento de chamadas simultaneas.
+
+        args:
+            func: metodo sincrono do servico de AzureBoards
+            args, kwargs: argumentos do metodo
+
+        retorna o resultado do metodo
+        """
+
+        if self.limiter.locked():
+            self.stats['queued'] += 1
+        async with self.limiter:
+            self.stats['calls'] += 1
+            return await self.run_blocking(func, *args, **kwargs)
+
+    async def fetch_all(self, azure_service: Any) -> List[Any]:
+        """
+        Baixa todos os itens do Board pelo servico.
+
+        args:
+            azure_service: servico de AzureBoards do projeto
+
+        retorna list de itens brutos
+        """
+
+        return await self.call_azure(azure_service.buscar_work_items, batch_size=self.batch_size)
+
+    def supports_changed_since(self, azure_service: Any) -> bool:
+        """
+        Verifica se os itens alterados do servico podem ser buscados sem baixar o Board completo.
+
+        args:
+            azure_service: servico de AzureBoards do projeto
+
+        retorna bool (True se o servico oferece 'buscar_work_items_alterados(desde, batch_size)')
+        """
+
+        return callable(getattr(azure_service, 'buscar_work_items_alterados', None))
+
+    async def fetch_changed_since(self, azure_service: Any, desde: str) -> Optional[List[Any]]:
+        """
+        Baixa os itens alterados apos uma data.
+
+        args:
+            azure_service: servico de AzureBoards do projeto
+            desde: String de data ISO da ultima alteracao conhecida
+
+        retorna list de itens brutos ou None se o servico nao suportar a busca de alterados
+        """
+
+        if not self.supports_changed_since(azure_service):
+            return None
+        return await self.call_azure(azure_service.buscar_work_items_alterados, desde=desde,
+                                     batch_size=self.batch_size)
+
+    async def close(self) -> None:
+        """Encerrando as threads de busca."""
+
+        self._executor.shutdown(wait=False)
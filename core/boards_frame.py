@@ -0,0 +1,77 @@
+# 1. Importando bibliotecas padrao
+from typing import Tuple
+
+# 2. Importando blibliotecas de terceiros
+import numpy as np
+import pandas as pd
+
+# Parametros de compactacao
+CATEGORY_MAX_RATIO = 0.5
+
+# Colunas compactadas: somente colunas usadas por igualdade/.str nas consultas (nunca com fillna ou datas)
+CATEGORY_COLUMNS = ("tipo", "estado", "area")
+INT32_COLUMNS = ("id",)
+
+
+def compact_boards_frame(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    """
+    Compacta um DataFrame processado de AzureBoards para o cache: as colunas de texto de CATEGORY_COLUMNS
+    com poucos valores distintos viram categoricas e os ids viram int32. As demais colunas (inclusive datas)
+    sao mantidas como estao, pois sao usadas pelas funcoes de processamento.
+
+    args:
+        df: DataFrame retornado por processar_work_items_df
+
+    retorna tupla (DataFrame compactado, int de bytes economizados)
+    """
+
+    if df is None or df.empty:
+        return df, 0
+
+    antes = int(df.memory_usage(deep=True).sum())
+    compactado = df.copy()
+
+    for coluna in INT32_COLUMNS:
+        if coluna in compactado.columns and pd.api.types.is_numeric_dtype(compactado[coluna].dtype):
+            compactado[coluna] = _to_int32(compactado[coluna])
+
+    for coluna in CATEGORY_COLUMNS:
+        if coluna not in compactado.columns:
+            continue
+        serie = compactado[coluna]
+        if _is_text(serie) and serie.nunique(dropna=True) <= max(1, CATEGORY_MAX_RATIO * len(serie)):
+            compactado[coluna] = serie.astype("category")
+
+    depois = int(compactado.memory_usage(deep=True).sum())
+    return compactado, antes - depois
+
+
+def _is_text(serie: pd.Series) -> bool:
+    """Verificando se a coluna guarda somente textos (object ou string, sem categoricas)."""
+
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        return False
+    if pd.api.types.is_string_dtype(serie.dtype) and serie.dtype != object:
+        return True
+    return serie.dtype == object and serie.dropna().map(type).eq(str).all()
+
+
+def _to_int32(serie: pd.Series) -> pd.Series:
+    """
+    Converte ids para int32 quando todos os valores sao inteiros que cabem em 32 bits.
+
+    args:
+        serie: Series de ids
+
+    retorna Series convertida (ou a original se a conversao perder informacao)
+    """
+
+    numeros = pd.to_numeric(serie, errors="coerce")
+    if numeros.isna().any() or not (numeros % 1 == 0).all():
+        return serie
+
+    limites = np.iinfo(np.int32)
+    if numeros.min() < limites.min or numeros.max() > limites.max:
+        return serie
+    return numeros.astype(np.int32)
+
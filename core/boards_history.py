@@ -0,0 +1,512 @@
+# 1. Importando bibliotecas padrao
+import os
+import re
+from datetime import date, timedelta
+from typing import Dict, Optional, List, Iterator, Tuple, Any
+
+# 2. Importando blibliotecas de terceiros
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+# Parametros do historico de Boards
+HISTORY_COLUMNS = ("id", "estado", "tipo", "responsavel")
+HISTORY_RETENTION_DAYS = 180
+HISTORY_SUFFIX = ".arrow"
+HISTORY_BASE_SUFFIX = ".base.arrow"
+OPEN_COLUMN = "aberto"
+REMOVED_COLUMN = "removido"
+
+
+class BoardsHistory:
+    """
+    Historico diario de estado/tipo/responsavel dos itens de cada Board, gravado a partir das atualizacoes do cache.
+    Cada projeto guarda um snapshot base (o dia mais antigo mantido) e, para cada dia seguinte, apenas as linhas
+    novas, alteradas ou removidas em relacao ao dia anterior. Somente o delta do dia corrente e reescrito; a base
+    avanca quando o dia mais antigo sai da retencao. As contagens diarias (abertos e concluidos) sao calculadas
+    ao registrar cada dia, e reconstruidas uma unica vez quando o historico e lido do disco.
+    """
+
+    def __init__(self, directory: Optional[str] = None, retention_days: int = HISTORY_RETENTION_DAYS) -> None:
+        """
+        Construtor do historico.
+
+        args:
+            directory: diretorio dos snapshots em Arrow IPC (somente em memoria se None ou sem pyarrow)
+            retention_days: int de dias mantidos por projeto
+
+        """
+
+        self.directory = directory if directory and pa is not None else None
+        self.retention_days = retention_days
+        self._history = {}
+
+        if directory and pa is None:
+            print("⚠️ Histórico de Boards somente em memória: pyarrow não está instalado.")
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def record(self, projeto: str, df: pd.DataFrame, dia: Optional[date] = None,
+               abertos: Optional[np.ndarray] = None) -> Optional[date]:
+        """
+        Registra o estado do dia de um Board, guardando apenas o que mudou desde o dia anterior
+        (substitui o registro anterior do mesmo dia).
+
+        args:
+            projeto: String de identificacao do projeto
+            df: DataFrame base do Board
+            dia: date do registro (padrao hoje)
+            abertos: array bool dos itens abertos, definido pelas funcoes de processamento (todos se None)
+
+        retorna date registrada ou None se o DataFrame nao tiver as colunas do historico
+        """
+
+        if df is None or 'id' not in df.columns:
+            return None
+
+        dia = dia or date.today()
+        colunas = [coluna for coluna in HISTORY_COLUMNS if coluna in df.columns]
+        snapshot = df[colunas].copy()
+        snapshot[OPEN_COLUMN] = np.asarray(abertos, dtype=bool) if abertos is not None else True
+        snapshot = _categorize(snapshot.reset_index(drop=True))
+
+        historico = self._load(projeto)
+        if historico['base'] is None or (dia <= historico['base_day'] and not historico['deltas']):
+            historico.update(base=snapshot, base_day=dia, base_dirty=True, deltas={}, previous=None,
+                             counts={dia: _day_counts(None, snapshot)})
+        elif dia > historico['base_day']:
+            dia_anterior = max(d for d in self.days(projeto) if d < dia)
+            anterior = self._snapshot_before(projeto, dia)
+            contagens = self._counts(projeto)
+            historico['deltas'] = {d: delta for d, delta in historico['deltas'].items() if d < dia}
+            historico['deltas'][dia] = _diff(anterior, snapshot)
+            historico['previous'] = (dia_anterior, anterior)
+            historico['counts'] = {d: contagem for d, contagem in contagens.items() if d < dia}
+            historico['counts'][dia] = _day_counts(anterior, snapshot)
+        else:
+            return None
+
+        historico['latest'] = (dia, snapshot)
+        self._roll_base(historico, dia - timedelta(days=self.retention_days))
+        return dia
+
+    def persist(self, projeto: str, dia: date) -> bool:
+        """
+        Grava em disco o registro de um dia (arquivos substituidos atomicamente). Se a base avancou, ela e
+        regravada e os arquivos anteriores a ela sao removidos.
+
+        args:
+            projeto: String de identificacao do projeto
+            dia: date do registro
+
+        retorna bool (True se o arquivo foi gravado)
+        """
+
+        historico = self._history.get(projeto)
+        if self.directory is None or historico is None or historico['base'] is None:
+            return False
+
+        try:
+            if historico['base_dirty']:
+                self._write(self._path(projeto, historico['base_day'], HISTORY_BASE_SUFFIX), historico['base'])
+                historico['base_dirty'] = False
+                self._remove_before(projeto, historico['base_day'])
+            if dia in historico['deltas']:
+                self._write(self._path(projeto, dia), historico['deltas'][dia])
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao gravar histórico de '{projeto}': {e}")
+            return False
+
+    def days(self, projeto: str) -> List[date]:
+        """
+        Lista os dias registrados de um projeto.
+
+        args:
+            projeto: String de identificacao do projeto
+
+        retorna list de dates em ordem crescente
+        """
+
+        historico = self._load(projeto)
+        if historico['base'] is None:
+            return []
+        return [historico['base_day']] + sorted(historico['deltas'])
+
+    def open_counts(self, projeto: str, dias: int) -> pd.Series:
+        """
+        Conta os itens abertos em cada dia (burndown).
+
+        args:
+            projeto: String de identificacao do projeto
+            dias: int de dias mais recentes considerados
+
+        retorna Series de int indexada por date
+        """
+
+        contagens = self._counts(projeto)
+        return pd.Series({dia: contagens[dia][0] for dia in self.days(projeto)[-dias:]}, dtype="int64")
+
+    def throughput(self, projeto: str, dias: int) -> pd.Series:
+        """
+        Conta os itens concluidos em cada dia (abertos no dia anterior e encerrados no dia).
+
+        args:
+            projeto: String de identificacao do projeto
+            dias: int de dias mais recentes considerados
+
+        retorna Series de int indexada por date (o primeiro dia do historico nao tem comparacao)
+        """
+
+        contagens = self._counts(projeto)
+        return pd.Series({dia: contagens[dia][1] for dia in self.days(projeto)[1:][-dias:]}, dtype="int64")
+
+    def changes(self, projeto: str, dia: Optional[date] = None) -> Optional[Dict[str, Any]]:
+        """
+        Compara um dia com o dia registrado anterior, a partir do delta guardado do dia.
+
+        args:
+            projeto: String de identificacao do projeto
+            dia: date comparada (padrao o ultimo dia registrado)
+
+        retorna dict com 'desde' (date anterior), 'novos', 'removidos', 'estado' e 'responsavel'
+        (DataFrames com 'id', 'antes' e 'depois'), ou None se nao houver dois dias registrados
+        """
+
+        historico = self._load(projeto)
+        todos = self.days(projeto)
+        if dia is None and todos:
+            dia = todos[-1]
+        if dia not in historico['deltas']:
+            return None
+
+        desde = max(d for d in todos if d < dia)
+        delta = historico['deltas'][dia]
+        antes = self._snapshot_before(projeto, dia)
+        removido = delta[REMOVED_COLUMN].astype(bool)
+        alterados = delta.loc[~removido].merge(antes, on='id', how='left', suffixes=("_depois", "_antes"),
+                                               indicator=True)
+
+        mudancas = {
+            'desde': desde,
+            'novos': alterados.loc[alterados['_merge'] == "left_only", ['id']],
+            'removidos': delta.loc[removido, ['id']],
+        }
+        ambos = alterados[alterados['_merge'] == "both"]
+        for coluna in ("estado", "responsavel"):
+            if f"{coluna}_antes" not in ambos.columns:
+                mudancas[coluna] = pd.DataFrame(columns=['id', 'antes', 'depois'])
+                continue
+            valores_antes = ambos[f"{coluna}_antes"].astype(object)
+            valores_depois = ambos[f"{coluna}_depois"].astype(object)
+            diferentes = (valores_antes != valores_depois) & ~(valores_antes.isna() & valores_depois.isna())
+            mudancas[coluna] = pd.DataFrame({
+                'id': ambos.loc[diferentes, 'id'], 'antes': valores_antes[diferentes], 'depois': valores_depois[diferentes],
+            })
+        return mudancas
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    def _iter_snapshots(self, projeto: str) -> Iterator[Tuple[date, pd.DataFrame]]:
+        """
+        Reconstroi os snapshots de cada dia, aplicando os deltas sobre a base em ordem.
+
+        args:
+            projeto: String de identificacao do projeto
+
+        retorna um gerador de tuplas (date, DataFrame do snapshot)
+        """
+
+        historico = self._load(projeto)
+        if historico['base'] is None:
+            return
+
+        snapshot = historico['base']
+        yield historico['base_day'], snapshot
+        for dia in sorted(historico['deltas']):
+            snapshot = _apply(snapshot, historico['deltas'][dia])
+            yield dia, snapshot
+
+    def _counts(self, projeto: str) -> Dict[date, Tuple[int, int]]:
+        """
+        Obtem as contagens diarias de um projeto, reconstruindo-as a partir dos deltas so se ainda nao existirem
+        (historico lido do disco).
+
+        args:
+            projeto: String de identificacao do projeto
+
+        retorna dict de date -> tupla (itens abertos, itens concluidos no dia)
+        """
+
+        historico = self._load(projeto)
+        if historico['counts'] is None:
+            contagens, anterior = {}, None
+            for dia, snapshot in self._iter_snapshots(projeto):
+                contagens[dia] = _day_counts(anterior, snapshot)
+                anterior = snapshot
+            historico['counts'] = contagens
+        return historico['counts']
+
+    def _snapshot_before(self, projeto: str, dia: date) -> pd.DataFrame:
+        """
+        Obtem o snapshot do ultimo dia registrado antes de um dia, sem reconstruir o historico quando possivel.
+
+        args:
+            projeto: String de identificacao do projeto
+            dia: date de referencia
+
+        retorna DataFrame do snapshot anterior
+        """
+
+        historico = self._load(projeto)
+        for guardado in (historico['latest'], historico['previous']):
+            if guardado is None:
+                continue
+            dia_guardado, snapshot = guardado
+            intermediarios = any(dia_guardado < d < dia for d in historico['deltas'])
+            if historico['base_day'] <= dia_guardado < dia and not intermediarios:
+                return snapshot
+
+        anterior = historico['base']
+        for dia_snapshot, snapshot in self._iter_snapshots(projeto):
+            if dia_snapshot >= dia:
+                break
+            anterior = snapshot
+        return anterior
+
+    def _roll_base(self, historico: Dict[str, Any], limite: date) -> None:
+        """
+        Avanca a base para o dia mais antigo dentro da retencao, incorporando os deltas anteriores a ele.
+
+        args:
+            historico: dict do historico de um projeto
+            limite: date mais antiga mantida
+
+        """
+
+        deltas = historico['deltas']
+        while historico['base_day'] < limite and deltas:
+            proximo = min(deltas)
+            historico['base'] = _apply(historico['base'], deltas.pop(proximo))
+            historico['base_day'] = proximo
+            historico['base_dirty'] = True
+            if historico['counts'] is not None:
+                historico['counts'] = {d: c for d, c in historico['counts'].items() if d >= proximo}
+
+    def _load(self, projeto: str) -> Dict[str, Any]:
+        """
+        Obtem o historico de um projeto, lendo do disco no primeiro acesso.
+
+        args:
+            projeto: String de identificacao do projeto
+
+        retorna dict com 'base_day', 'base', 'deltas' (date -> DataFrame), 'latest', 'previous' e 'counts'
+        (contagens diarias, None ate serem reconstruidas)
+        """
+
+        if projeto in self._history:
+            return self._history[projeto]
+
+        historico = {'base_day': None, 'base': None, 'deltas': {}, 'latest': None, 'previous': None,
+                     'base_dirty': False, 'counts': None}
+        pasta = self._project_dir(projeto)
+        if self.directory and os.path.isdir(pasta):
+            for nome in sorted(os.listdir(pasta)):
+                base = nome.endswith(HISTORY_BASE_SUFFIX)
+                if not nome.endswith(HISTORY_SUFFIX):
+                    continue
+                try:
+                    dia = date.fromisoformat(nome[:-len(HISTORY_BASE_SUFFIX if base else HISTORY_SUFFIX)])
+                    with pa.OSFile(os.path.join(pasta, nome), "rb") as source:
+                        tabela = pa.ipc.open_file(source).read_all().to_pandas()
+                    if base:
+                        historico['base_day'], historico['base'] = dia, _categorize(tabela)
+                    else:
+                        historico['deltas'][dia] = tabela
+                except Exception as e:
+                    print(f"❌ Erro ao ler histórico '{nome}' de '{projeto}': {e}")
+
+        if historico['base'] is None:
+            historico['deltas'] = {}
+        else:
+            historico['deltas'] = {d: delta for d, delta in historico['deltas'].items() if d > historico['base_day']}
+        self._history[projeto] = historico
+        return historico
+
+    def _write(self, path: str, tabela: pd.DataFrame) -> None:
+        """
+        Grava um DataFrame em Arrow IPC, substituindo o arquivo atomicamente.
+
+        args:
+            path: String do caminho do arquivo
+            tabela: DataFrame gravado
+
+        """
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            table = pa.Table.from_pandas(tabela, preserve_index=False)
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _remove_before(self, projeto: str, base_day: date) -> None:
+        """
+        Remove os arquivos de dias incorporados a base (e bases antigas).
+
+        args:
+            projeto: String de identificacao do projeto
+            base_day: date da base atual
+
+        """
+
+        pasta = self._project_dir(projeto)
+        for nome in os.listdir(pasta):
+            if not nome.endswith(HISTORY_SUFFIX):
+                continue
+            base = nome.endswith(HISTORY_BASE_SUFFIX)
+            try:
+                dia = date.fromisoformat(nome[:-len(HISTORY_BASE_SUFFIX if base else HISTORY_SUFFIX)])
+            except ValueError:
+                continue
+            if dia < base_day or (dia == base_day and not base):
+                os.remove(os.path.join(pasta, nome))
+
+    def _project_dir(self, projeto: str) -> str:
+        """Montando o diretorio de snapshots de um projeto."""
+
+        return os.path.join(self.directory or "", re.sub(r"[^\w.-]", "_", projeto))
+
+    def _path(self, projeto: str, dia: date, sufixo: str = HISTORY_SUFFIX) -> str:
+        """Montando o caminho do arquivo de um dia (delta ou base)."""
+
+        return os.path.join(self._project_dir(projeto), dia.isoformat() + sufixo)
+
+
+def _categorize(snapshot: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normaliza as colunas de um snapshot (texto como category, 'aberto' como bool).
+
+    args:
+        snapshot: DataFrame do snapshot
+
+    retorna o DataFrame normalizado
+    """
+
+    for coluna in HISTORY_COLUMNS[1:]:
+        if coluna in snapshot.columns:
+            valores = snapshot[coluna].astype(object)
+            snapshot[coluna] = valores.where(valores.notna(), None).astype("category")
+    if OPEN_COLUMN in snapshot.columns:
+        snapshot[OPEN_COLUMN] = snapshot[OPEN_COLUMN].fillna(True).astype(bool)
+    return snapshot
+
+
+def _diff(antes: pd.DataFrame, depois: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calcula o delta entre dois snapshots: linhas novas ou alteradas de 'depois' e ids removidos.
+
+    args:
+        antes: DataFrame do snapshot anterior
+        depois: DataFrame do snapshot novo
+
+    retorna DataFrame com as colunas do snapshot e REMOVED_COLUMN
+    """
+
+    anteriores = antes.drop_duplicates('id', keep='last').set_index('id')
+    atuais = depois.drop_duplicates('id', keep='last').set_index('id')
+
+    alterado = ~atuais.index.isin(anteriores.index)
+    comuns = ~alterado
+    if comuns.any():
+        diferentes = np.zeros(int(comuns.sum()), dtype=bool)
+        alinhados = anteriores.reindex(atuais.index[comuns])
+        for coluna in atuais.columns:
+            if coluna not in alinhados.columns:
+                diferentes[:] = True
+                continue
+            valores_antes = alinhados[coluna].astype(object).to_numpy()
+            valores_depois = atuais.loc[comuns, coluna].astype(object).to_numpy()
+            diferentes |= ~((valores_antes == valores_depois) | (pd.isna(valores_antes) & pd.isna(valores_depois)))
+        alterado[comuns] = diferentes
+
+    linhas = atuais[alterado].reset_index()
+    linhas[REMOVED_COLUMN] = False
+    removidos = pd.DataFrame({'id': anteriores.index[~anteriores.index.isin(atuais.index)], REMOVED_COLUMN: True})
+
+    delta = pd.concat([linhas, removidos], ignore_index=True)
+    for coluna in delta.columns:
+        if coluna == OPEN_COLUMN:
+            delta[coluna] = delta[coluna].fillna(False).astype(bool)
+        elif coluna not in ('id', REMOVED_COLUMN):
+            valores = delta[coluna].astype(object)
+            delta[coluna] = valores.where(valores.notna(), None)
+    return delta
+
+
+def _apply(snapshot: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aplica um delta sobre o snapshot do dia anterior.
+
+    args:
+        snapshot: DataFrame do snapshot anterior
+        delta: DataFrame do delta do dia (ver _diff)
+
+    retorna DataFrame do snapshot do dia
+    """
+
+    mantidos = snapshot[~snapshot['id'].isin(delta['id'])]
+    novos = delta.loc[~delta[REMOVED_COLUMN].astype(bool)].drop(columns=REMOVED_COLUMN)
+    unidos = pd.concat([mantidos.astype(object), novos], ignore_index=True)
+    return _categorize(unidos.astype({'id': snapshot['id'].dtype}))
+
+
+def _day_counts(anterior: Optional[pd.DataFrame], snapshot: pd.DataFrame) -> Tuple[int, int]:
+    """
+    Conta os itens abertos de um dia e os concluidos no dia (abertos no dia anterior e encerrados no dia).
+
+    args:
+        anterior: DataFrame do snapshot do dia anterior (None no primeiro dia)
+        snapshot: DataFrame do snapshot do dia
+
+    retorna tupla (int de abertos, int de concluidos)
+    """
+
+    abertos = _open_mask(snapshot)
+    if anterior is None:
+        return int(abertos.sum()), 0
+
+    abertos_antes = anterior.loc[_open_mask(anterior), 'id']
+    concluidos = snapshot.loc[~abertos, 'id'].isin(abertos_antes)
+    return int(abertos.sum()), int(concluidos.sum())
+
+
+def _open_mask(snapshot: pd.DataFrame) -> pd.Series:
+    """
+    Identifica os itens abertos de um snapshot.
+
+    args:
+        snapshot: DataFrame do snapshot
+
+    retorna Series bool (True se o item estava aberto ao ser registrado)
+    """
+
+    if OPEN_COLUMN not in snapshot.columns:
+        return pd.Series(True, index=snapshot.index)
+    return snapshot[OPEN_COLUMN].astype(bool)
@@ -0,0 +1,231 @@
+# 1. Importando bibliotecas padrao
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Any, Optional, List
+
+# 2. Importando blibliotecas de terceiros
+import numpy as np
+import pandas as pd
+
+# Colunas indexadas: nome da coluna -> se o valor e comparado em minusculo
+INDEXED_COLUMNS = {
+    'tipo': True,
+    'estado': True,
+    'responsavel': True,
+    'area': False,
+}
+
+_EMPTY_POSITIONS = np.array([], dtype=np.intp)
+
+# Particulas de nomes ignoradas na deteccao de colaboradores
+NAME_PARTICLES = {"de", "da", "do", "das", "dos", "e"}
+
+# Sobrenomes que tambem sao palavras comuns (sozinhos nao identificam um colaborador; primeiros nomes sempre valem)
+COMMON_SURNAME_WORDS = {
+    "dias", "campos", "ramos", "neves", "prado", "vale", "paz", "cruz", "rosa", "luz", "flores",
+    "mata", "leite", "franco", "branco", "costa", "lima", "santos", "barros", "rocha", "reis",
+}
+
+# Tokens citados exigidos para aceitar um nome parcial
+COLLABORATOR_MIN_TOKENS = 2
+
+
+def fold_text(texto: str) -> str:
+    """
+    Converte um texto para minusculo e sem acentos.
+
+    args:
+        texto: String original
+
+    retorna String normalizada
+    """
+
+    texto = unicodedata.normalize("NFKD", texto.casefold())
+    return "".join(c for c in texto if not unicodedata.combining(c))
+
+
+class BoardsIndex:
+    """Indice de posicoes de linhas de um DataFrame de AzureBoards, construido uma vez por versao dos dados."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        """
+        Construtor do indice. Agrupa as posicoes das linhas por tipo, estado, responsavel e area.
+
+        args:
+            df: DataFrame com itens AzureBoards
+
+        """
+
+        self.size = len(df)
+        self.groups = {
+            coluna: self._group_positions(df[coluna], minusculo)
+            for coluna, minusculo in INDEXED_COLUMNS.items() if coluna in df.columns
+        }
+        self.counts = {
+            coluna: {valor: len(posicoes) for valor, posicoes in grupos.items()}
+            for coluna, grupos in self.groups.items()
+        }
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def positions(self, coluna: str, valor: Any) -> np.ndarray:
+        """
+        Obtem as posicoes das linhas com um valor na coluna.
+
+        args:
+            coluna: String da coluna indexada
+            valor: valor procurado (em minusculo para colunas normalizadas)
+
+        retorna np.ndarray de posicoes (vazio se nao houver linhas)
+        """
+
+        return self.groups.get(coluna, {}).get(valor, _EMPTY_POSITIONS)
+
+    def count(self, coluna: str, valor: Any) -> int:
+        """
+        Conta as linhas com um valor na coluna.
+
+        args:
+            coluna: String da coluna indexada
+            valor: valor procurado (em minusculo para colunas normalizadas)
+
+        retorna int da quantidade de linhas
+        """
+
+        return self.counts.get(coluna, {}).get(valor, 0)
+
+    def rows(self, df: pd.DataFrame, coluna: str, valor: Any) -> pd.DataFrame:
+        """
+        Seleciona as linhas com um valor na coluna.
+
+        args:
+            df: DataFrame a partir do qual o indice foi construido
+            coluna: String da coluna indexada
+            valor: valor procurado (em minusculo para colunas normalizadas)
+
+        retorna DataFrame com as linhas selecionadas, na ordem original
+        """
+
+        return df.iloc[self.positions(coluna, valor)]
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    def _group_positions(self, serie: pd.Series, minusculo: bool) -> Dict[Any, np.ndarray]:
+        """
+        Agrupa as posicoes das linhas pelo valor da coluna.
+
+        args:
+            serie: Series da coluna
+            minusculo: bool indicando se os valores sao comparados em minusculo
+
+        retorna dict de valor -> np.ndarray de posicoes
+        """
+
+        chaves = serie.astype("object").str.lower() if minusculo else serie
+        codigos, valores = pd.factorize(chaves, use_na_sentinel=True)
+        if not len(valores):
+            return {}
+
+        ordem = np.argsort(codigos, kind="stable")
+        codigos_ordenados = codigos[ordem]
+        inicio = np.searchsorted(codigos_ordenados, np.arange(len(valores)), side="left")
+        fim = np.searchsorted(codigos_ordenados, np.arange(len(valores)), side="right")
+        return {valor: ordem[i:f] for valor, i, f in zip(valores, inicio, fim)}
+
+
+class CollaboratorIndex:
+    """Indice invertido de tokens de nomes de responsaveis, construido uma vez por versao dos dados."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        """
+        Construtor do indice. Mapeia cada token de nome (sem acento) para os responsaveis que o contem.
+
+        args:
+            df: DataFrame com itens AzureBoards e coluna 'responsavel'
+
+        """
+
+        self.names = []
+        self.first_tokens = []
+        self.token_counts = []
+        self.tokens = defaultdict(list)
+
+        for posicao, responsavel in enumerate(df['responsavel'].dropna().unique()):
+            tokens = self._tokenize(str(responsavel))
+            self.names.append(responsavel)
+            self.first_tokens.append(tokens[0] if tokens else None)
+            self.token_counts.append(len(tokens))
+            for token in tokens:
+                self.tokens[token].append(posicao)
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def match(self, pergunta: str) -> Optional[str]:
+        """
+        Encontra o responsavel citado na pergunta.
+
+        Um responsavel e candidato se a pergunta cita seu nome completo, ao menos COLLABORATOR_MIN_TOKENS
+        tokens do nome, ou um unico token que so ele tem (o primeiro nome, ou um sobrenome que nao e palavra
+        comum, ver COMMON_SURNAME_WORDS).
+        Cada token citado soma um ponto e o nome completo soma um ponto extra; empate entre os melhores
+        candidatos e ambiguo.
+
+        args:
+            pergunta: String da pergunta
+
+        retorna o nome do responsavel ou None (nenhum candidato ou empate).
+        """
+
+        encontrados = defaultdict(list)
+        for token in self._tokenize(pergunta):
+            for posicao in self.tokens.get(token, ()):
+                encontrados[posicao].append(token)
+
+        pontuacoes = {}
+        for posicao, tokens in encontrados.items():
+            completo = len(tokens) == self.token_counts[posicao]
+            if completo or len(tokens) >= COLLABORATOR_MIN_TOKENS or self._is_distinctive(tokens[0]):
+                pontuacoes[posicao] = len(tokens) + completo
+
+        if not pontuacoes:
+            return None
+
+        melhor = max(pontuacoes.values())
+        vencedores = [posicao for posicao, pontuacao in pontuacoes.items() if pontuacao == melhor]
+        if len(vencedores) > 1:
+            return None
+        return self.names[vencedores[0]]
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    def _is_distinctive(self, token: str) -> bool:
+        """Verificando se um token sozinho identifica um responsavel (unico no Board e primeiro nome ou sobrenome incomum)."""
+
+        posicoes = self.tokens[token]
+        if len(posicoes) != 1:
+            return False
+        return self.first_tokens[posicoes[0]] == token or token not in COMMON_SURNAME_WORDS
+
+    def _tokenize(self, texto: str) -> List[str]:
+        """
+        Separa um texto em tokens de nome distintos, sem acentos e sem particulas.
+
+        args:
+            texto: String a ser separada
+
+        retorna list de tokens
+        """
+
+        return list(dict.fromkeys(
+            token for token in re.findall(r"\w+", fold_text(texto))
+            if token not in NAME_PARTICLES
+        ))
@@ -0,0 +1,392 @@
+# 1. Importando bibliotecas padrao
+import time
+from typing import Dict, Any, Optional, List, Set, Callable
+
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+
+# 3. Importando aplicacoes locais
+from src.services.module.boards.azure_boards_service import AzureBoardsService
+from src.services.module.boards.processing import processar_work_items_df
+
+# 5. Importando modulos locais
+from core import boards_frame, boards_fetcher, boards_dates
+
+# Parametros da sincronizacao
+BOARDS_FULL_RECONCILE_INTERVAL = 6 * 60 * 60
+BOARDS_DELTA_OVERLAP = pd.Timedelta(seconds=1)
+CHANGED_DATE_FIELD = "System.ChangedDate"
+DUE_DATE_FIELDS = ("Microsoft.VSTS.Scheduling.DueDate", "Microsoft.VSTS.Scheduling.TargetDate")
+
+
+class BoardsSyncAgent:
+    """Agente de sincronizacao incremental dos itens de AzureBoards."""
+
+    def __init__(self, service_factory: Callable[[str], Any] = AzureBoardsService,
+                 incremental: bool = True,
+                 full_reconcile_interval: float = BOARDS_FULL_RECONCILE_INTERVAL,
+                 fetcher: Optional[boards_fetcher.AsyncBoardsFetcher] = None) -> None:
+        """
+        Construtor do agente de sincronizacao.
+
+        args:
+            service_factory: funcao que recebe o projeto e retorna o servico de AzureBoards
+                (permite substituir o Azure por um servico local em testes)
+            incremental: se False, toda sincronizacao baixa o Board completo
+            full_reconcile_interval: segundos entre reconciliacoes completas de cada Board
+            fetcher: AsyncBoardsFetcher usado para baixar os itens sem bloquear o event loop
+
+        """
+
+        self.service_factory = service_factory
+        self.fetcher = fetcher if fetcher is not None else boards_fetcher.AsyncBoardsFetcher()
+        self.incremental = incremental
+        self.full_reconcile_interval = full_reconcile_interval
+        self.stats = {'full_syncs': 0, 'delta_syncs': 0, 'delta_items': 0, 'bytes_saved': 0, 'epic_enrichments': 0}
+
+        self._sync_state = {}
+        self._epic_columns = {}
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    async def sync(self, projeto: str, cached_df: Optional[pd.DataFrame] = None) -> Optional[pd.DataFrame]:
+        """
+        Sincroniza os itens de um Board, baixando apenas o que mudou desde a ultima sincronizacao.
+        Servicos sem busca de alterados sao sempre sincronizados por completo.
+        Se o projeto ja foi enriquecido com epicos, as colunas de epicos sao atualizadas na mesma busca.
+
+        args:
+            projeto: String de identificacao do projeto
+            cached_df: DataFrame base ja em cache do Board (None forca sincronizacao completa)
+
+        retorna um DataFrame pandas (sem colunas de epicos) com os itens atualizados ou None.
+        """
+
+        return (await self.sync_with_items(projeto, cached_df))[0]
+
+    async def sync_with_items(self, projeto: str, cached_df: Optional[pd.DataFrame] = None,
+                              work_items: Optional[Dict[int, Any]] = None) -> tuple:
+        """
+        Sincroniza os itens de um Board (ver sync) e retorna tambem os itens brutos do Board por 'id', usados no
+        primeiro enriquecimento com epicos. Os itens nao ficam guardados no agente: quem chama os guarda junto
+        com o DataFrame (ex.: na entrada de cache) e os devolve na proxima sincronizacao.
+
+        args:
+            projeto: String de identificacao do projeto
+            cached_df: DataFrame base ja em cache do Board (None forca sincronizacao completa)
+            work_items: dict de itens brutos por 'id' de cached_df (None se desconhecidos; nao e alterado)
+
+        retorna tupla (DataFrame ou None, dict de itens brutos por 'id' ou None se o projeto ja foi enriquecido
+        ou se os itens de cached_df eram desconhecidos e a sincronizacao foi incremental)
+        """
+
+        state = self._sync_state.get(projeto)
+        precisa_reconciliar = (
+            not self.incremental or cached_df is None or state is None
+            or time.monotonic() - state['last_full_sync'] >= self.full_reconcile_interval
+        )
+        guardar_itens = projeto not in self._epic_columns
+
+        azure_service = await self.fetcher.run_blocking(self.service_factory, projeto)
+        if precisa_reconciliar or not self.fetcher.supports_changed_since(azure_service):
+            itens = {} if guardar_itens else None
+            return await self._full_sync(azure_service, projeto, itens), itens
+
+        itens = dict(work_items) if guardar_itens and work_items is not None else None
+        return await self._delta_sync(azure_service, projeto, cached_df, state, itens), itens
+
+    async def enrich_epics(self, projeto: str, df: pd.DataFrame,
+                           work_items: Optional[Dict[int, Any]] = None) -> Optional[pd.DataFrame]:
+        """
+        Enriquece o DataFrame base de um Board com as colunas de epicos/clientes.
+        Os itens brutos da sincronizacao (sync_with_items) sao reprocessados com os epicos (apenas os pais sao
+        buscados pelo processamento), sem baixar o Board novamente; o Board so e baixado se os itens nao forem
+        informados (DataFrame vindo do disco ou de outro worker). Depois, as sincronizacoes mantem as colunas
+        atualizadas.
+
+        args:
+            projeto: String de identificacao do projeto
+            df: DataFrame base do Board
+            work_items: dict de itens brutos por 'id' de df (baixados se None)
+
+        retorna um DataFrame pandas com as colunas de epicos ou None.
+        """
+
+        if projeto not in self._epic_columns:
+            if work_items is None:
+                azure_service = await self.fetcher.run_blocking(self.service_factory, projeto)
+                work_items = {}
+                self._store_work_items(work_items, await self.fetcher.fetch_all(azure_service))
+
+            ids = set(df['id'].tolist())
+            work_items = [item for item_id, item in work_items.items() if item_id in ids]
+            if not work_items:
+                return None
+
+            async with self.fetcher.limiter:
+                enriquecido = await processar_work_items_df(work_items, projeto=projeto, buscar_epicos=True)
+            if enriquecido is None or enriquecido.empty:
+                return None
+
+            colunas = ['id'] + [coluna for coluna in enriquecido.columns if coluna not in df.columns]
+            epicos = enriquecido[colunas].drop_duplicates('id', keep='last')
+            self._epic_columns[projeto] = boards_frame.compact_boards_frame(epicos)[0]
+            self.stats['epic_enrichments'] += 1
+
+        return df.merge(self._epic_columns[projeto], on='id', how='left')
+
+    def reset(self, projeto: str) -> None:
+        """
+        Descarta o estado de sincronizacao de um projeto, forcando a proxima sincronizacao completa.
+
+        args:
+            projeto: String de identificacao do projeto
+
+        """
+
+        self._sync_state.pop(projeto, None)
+        self._epic_columns.pop(projeto, None)
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    async def _full_sync(self, azure_service: Any, projeto: str,
+                         itens: Optional[Dict[int, Any]] = None) -> Optional[pd.DataFrame]:
+        """
+        Baixa e processa o Board completo, reiniciando a marca de alteracao.
+
+        args:
+            azure_service: servico de AzureBoards do projeto
+            projeto: String de identificacao do projeto
+            itens: dict preenchido com os itens brutos por 'id' (ignorado se None)
+
+        retorna um DataFrame pandas com os itens ou None.
+        """
+
+        work_items = await self.fetcher.fetch_all(azure_service)
+        if not work_items:
+            return None
+
+        if itens is not None:
+            self._store_work_items(itens, work_items)
+        df = await self._process(work_items, projeto)
+        if df is not None and projeto in self._epic_columns:
+            self._epic_columns[projeto] = self._epic_columns[projeto].iloc[:0]
+            self._upsert_epic_columns(projeto, df)
+            df = df.drop(columns=self._epic_column_names(projeto), errors="ignore")
+        df = self._compact(df, projeto)
+
+        high_water_mark = self._high_water_mark(work_items)
+        self._sync_state[projeto] = {
+            'high_water_mark': high_water_mark,
+            'ids_at_mark': self._ids_changed_at(work_items, high_water_mark),
+            'last_full_sync': time.monotonic(),
+        }
+        self.stats['full_syncs'] += 1
+        return df
+
+    async def _delta_sync(self, azure_service: Any, projeto: str, cached_df: pd.DataFrame, state: Dict[str, Any],
+                          itens: Optional[Dict[int, Any]] = None) -> pd.DataFrame:
+        """
+        Baixa apenas os itens alterados desde a marca de alteracao e os atualiza no DataFrame em cache por 'id'.
+
+        args:
+            azure_service: servico de AzureBoards do projeto
+            projeto: String de identificacao do projeto
+            cached_df: DataFrame ja em cache do Board
+            state: dict de estado de sincronizacao do Board
+            itens: dict de itens brutos por 'id' atualizado com os itens alterados (ignorado se None)
+
+        retorna um DataFrame pandas com os itens atualizados.
+        """
+
+        alterados = await self._fetch_changed_since(azure_service, state['high_water_mark'], state['ids_at_mark'])
+
+        self.stats['delta_syncs'] += 1
+        self.stats['delta_items'] += len(alterados)
+        if not alterados:
+            return cached_df
+
+        if itens is not None:
+            self._store_work_items(itens, alterados)
+        delta_df = await self._process(alterados, projeto)
+        high_water_mark = self._high_water_mark(alterados)
+        if high_water_mark > state['high_water_mark']:
+            state['high_water_mark'] = high_water_mark
+            state['ids_at_mark'] = self._ids_changed_at(alterados, high_water_mark)
+        elif high_water_mark == state['high_water_mark']:
+            state['ids_at_mark'] |= self._ids_changed_at(alterados, high_water_mark)
+
+        if delta_df is None or delta_df.empty:
+            return cached_df
+
+        if projeto in self._epic_columns:
+            self._upsert_epic_columns(projeto, delta_df)
+            delta_df = delta_df.drop(columns=self._epic_column_names(projeto), errors="ignore")
+
+        mantidos = cached_df[~cached_df['id'].isin(delta_df['id'])]
+        return self._compact(pd.concat([mantidos, delta_df], ignore_index=True), projeto)
+
+    async def _process(self, work_items: List[Any], projeto: str) -> Optional[pd.DataFrame]:
+        """
+        Processa itens brutos, incluindo os epicos apenas se o projeto ja foi enriquecido, e acrescenta as
+        colunas de prazo e de alteracao lidas dos campos do Azure (usadas por BoardsDates).
+
+        args:
+            work_items: list de itens brutos do AzureBoards
+            projeto: String de identificacao do projeto
+
+        retorna um DataFrame pandas com os itens ou None.
+        """
+
+        buscar_epicos = projeto in self._epic_columns
+        df = await processar_work_items_df(work_items, projeto=projeto, buscar_epicos=buscar_epicos)
+        if df is None or df.empty or 'id' not in df.columns:
+            return df
+
+        prazos, alteracoes = {}, {}
+        for item in work_items:
+            item_id = self._item_id(item)
+            fields = self._fields(item)
+            prazos[item_id] = next((fields[campo] for campo in DUE_DATE_FIELDS if fields.get(campo)), None)
+            alteracoes[item_id] = fields.get(CHANGED_DATE_FIELD)
+
+        df = df.copy()
+        df[boards_dates.DUE_DATE_COLUMN] = pd.to_datetime(
+            df['id'].map(prazos), errors="coerce", utc=True, format="mixed"
+        )
+        df[boards_dates.CHANGED_DATE_COLUMN] = pd.to_datetime(
+            df['id'].map(alteracoes), errors="coerce", utc=True, format="mixed"
+        )
+        return df
+
+    def _store_work_items(self, itens: Dict[int, Any], work_items: List[Any]) -> None:
+        """
+        Guarda por 'id' itens brutos sincronizados, reaproveitados no enriquecimento com epicos.
+
+        args:
+            itens: dict de itens brutos por 'id' a ser atualizado
+            work_items: list de itens brutos do AzureBoards
+
+        """
+
+        itens.update((self._item_id(item), item) for item in work_items or [])
+
+    def _epic_column_names(self, projeto: str) -> List[str]:
+        """Obtendo as colunas de epicos de um projeto enriquecido (sem o 'id')."""
+
+        return [coluna for coluna in self._epic_columns[projeto].columns if coluna != 'id']
+
+    def _upsert_epic_columns(self, projeto: str, df: pd.DataFrame) -> None:
+        """
+        Atualiza por 'id' as colunas de epicos de um projeto a partir de itens processados com epicos.
+
+        args:
+            projeto: String de identificacao do projeto
+            df: DataFrame processado com as colunas de epicos
+
+        """
+
+        atuais = self._epic_columns[projeto]
+        colunas = ['id'] + [coluna for coluna in self._epic_column_names(projeto) if coluna in df.columns]
+        mantidos = atuais[~atuais['id'].isin(df['id'])]
+        novos = pd.concat([mantidos, df[colunas]], ignore_index=True)
+        self._epic_columns[projeto] = boards_frame.compact_boards_frame(novos)[0]
+
+    def _compact(self, df: Optional[pd.DataFrame], projeto: str) -> Optional[pd.DataFrame]:
+        """
+        Compacta o DataFrame sincronizado e registra os bytes economizados.
+
+        args:
+            df: DataFrame processado do Board
+            projeto: String de identificacao do projeto
+
+        retorna o DataFrame compactado
+        """
+
+        df, economizados = boards_frame.compact_boards_frame(df)
+        if economizados > 0:
+            self.stats['bytes_saved'] += economizados
+            print(f"🗜️ Boards '{projeto}': {economizados / 1024 / 1024:.1f} MB economizados com a compactação")
+        return df
+
+    async def _fetch_changed_since(self, azure_service: Any, high_water_mark: pd.Timestamp,
+                                   ids_at_mark: Set[Any]) -> List[Any]:
+        """
+        Obtem os itens alterados desde a marca de alteracao.
+
+        A busca comeca BOARDS_DELTA_OVERLAP antes da marca, para nao perder itens alterados no mesmo segundo
+        da marca depois da ultima sincronizacao; os itens da marca ja conhecidos sao descartados.
+
+        args:
+            azure_service: servico de AzureBoards do projeto
+            high_water_mark: Timestamp da ultima alteracao conhecida
+            ids_at_mark: set de ids ja sincronizados com alteracao exatamente na marca
+
+        retorna list de itens alterados
+        """
+
+        desde = (high_water_mark - BOARDS_DELTA_OVERLAP).isoformat()
+        work_items = await self.fetcher.fetch_changed_since(azure_service, desde)
+
+        alterados = []
+        for item in work_items or []:
+            changed = self._changed_date(item)
+            if changed is None or changed < high_water_mark:
+                continue
+            if changed == high_water_mark and self._item_id(item) in ids_at_mark:
+                continue
+            alterados.append(item)
+        return alterados
+
+    def _high_water_mark(self, work_items: List[Any]) -> pd.Timestamp:
+        """
+        Calcula a maior data de alteracao de uma lista de itens.
+
+        args:
+            work_items: list de itens brutos do AzureBoards
+
+        retorna Timestamp da ultima alteracao (ou 1970-01-01 se nenhuma data existir)
+        """
+
+        datas = [changed for item in work_items if (changed := self._changed_date(item)) is not None]
+        return max(datas, default=pd.Timestamp(0, tz="UTC"))
+
+    def _ids_changed_at(self, work_items: List[Any], high_water_mark: pd.Timestamp) -> Set[Any]:
+        """Obtendo os ids dos itens alterados exatamente na marca de alteracao."""
+
+        return {self._item_id(item) for item in work_items if self._changed_date(item) == high_water_mark}
+
+    def _item_id(self, item: Any) -> Any:
+        """Extraindo o id de um item bruto do AzureBoards."""
+
+        return item.get('id') if isinstance(item, dict) else getattr(item, 'id', None)
+
+    def _fields(self, item: Any) -> Dict[str, Any]:
+        """Extraindo os campos de um item bruto do AzureBoards."""
+
+        fields = item.get('fields') if isinstance(item, dict) else getattr(item, 'fields', None)
+        return fields or {}
+
+    def _changed_date(self, item: Any) -> Optional[pd.Timestamp]:
+        """
+        Extrai a data de alteracao de um item bruto do AzureBoards.
+
+        args:
+            item: dict ou objeto de work item com campo 'fields'
+
+        retorna Timestamp em UTC ou None.
+        """
+
+        valor = self._fields(item).get(CHANGED_DATE_FIELD)
+        if not valor:
+            return None
+
+        try:
+            data = pd.Timestamp(valor)
+        except (ValueError, TypeError):
+            return None
+        return data.tz_convert("UTC") if data.tzinfo else data.tz_localize("UTC")
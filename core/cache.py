@@ -1,89 +1,885 @@
 # 1. Importando bibliotecas padrao
-from datetime import datetime,timedelta
-from typing import Dict, Any, Optional, List
+import abc
+import asyncio
+import contextvars
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, Awaitable
 
 # 2. Importando blibliotecas de terceiros
 import pandas as pd
 
-# 3. Importando aplicacoes locais
-from src.services.module.boards.azure_boards_service import AzureBoardsService
-from src.services.module.boards.processing import processar_work_items_df
-
 # 4. Importando constantes
 from src.services.constants import (
-    # Padroes
-    CLIENT_SEARCH_KEYWORDS,
-
     # Parametros
-    CACHE_DURATION, CACHE_CLEANUP_INTERVAL
+    CACHE_DURATION, CACHE_CLEANUP_INTERVAL, SEARCH_CACHE_DURATION
 )
 
+# 5. Importando modulos locais
+from core import disk_cache
+
+# Limites padrao do cache
+CACHE_MAX_ENTRIES = 128
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+BOARDS_HARD_STALE_LIMIT = 30 * 60
+SEARCH_CACHE_MAX_ENTRIES = 1024
+SEARCH_NEGATIVE_CACHE_DURATION = 60
+NEGATIVE_CACHE_DURATION = 60
+
+# Comandos administrativos do cache
+CACHE_ADMIN_COMMANDS = {
+    "cache stats": "Exibe as métricas do cache",
+    "limpar cache": "Remove os dados em cache de um projeto (ex.: limpar cache sonar)",
+    "aquecer cache": "Carrega os dados de um projeto no cache (ex.: aquecer cache sonar)",
+}
+
+
+class NegativeResult:
+    """Marcador de resultado negativo em cache: a carga falhou ou confirmou que nao ha dados."""
+
+    def __repr__(self) -> str:
+        return "NEGATIVE_RESULT"
+
+
+NEGATIVE_RESULT = NegativeResult()
+
+
+class WithDerived:
+    """Resultado de um loader acompanhado de artefatos derivados ja construidos, guardados na mesma entrada."""
+
+    def __init__(self, value: Any, derived: Dict[str, Any]) -> None:
+        """
+        Construtor do resultado.
+
+        args:
+            value: valor carregado
+            derived: dict de nome do artefato -> artefato derivado do valor
+
+        """
+
+        self.value = value
+        self.derived = derived
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estima o tamanho em bytes de um valor armazenado em cache.
+
+    args:
+        value: valor a ser medido (DataFrame, String, colecoes...)
+
+    retorna int com a estimativa de bytes
+    """
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class CacheBackend(abc.ABC):
+    """Interface dos backends de armazenamento do CacheAgent. Datas das entradas usam o relogio monotonico local."""
+
+    def __init__(self, ttl: float) -> None:
+        """
+        Construtor do backend. Inicializando contadores.
+
+        args:
+            ttl: tempo de vida padrao das entradas, em segundos
+
+        """
+
+        self.ttl = ttl
+        self.total_bytes = 0
+        self.stats = {
+            'hits': 0, 'misses': 0, 'stale_hits': 0, 'negative_hits': 0, 'evictions': 0, 'expirations': 0,
+            'fetches': 0, 'fetch_seconds_total': 0.0, 'fetch_seconds_max': 0.0,
+        }
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Obtem um valor valido do cache.
+
+        args:
+            key: String da chave
+
+        retorna o valor armazenado ou None se ausente/expirado/negativo.
+        """
+
+        entry = self.get_entry(key)
+        if entry is None or entry['expires_at'] <= time.monotonic() or entry['value'] is NEGATIVE_RESULT:
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['hits'] += 1
+        return entry['value']
+
+    @abc.abstractmethod
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtem a entrada completa da chave, incluindo entradas expiradas ainda dentro do limite de obsolescencia.
+
+        args:
+            key: String da chave
+
+        retorna dict da entrada ('value', 'size', 'timestamp', 'expires_at', 'stale_until') ou None.
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, stale_ttl: float = 0) -> None:
+        """
+        Armazena um valor.
+
+        args:
+            key: String da chave
+            value: valor a ser armazenado
+            ttl: tempo de vida em segundos (padrao do backend se None)
+            stale_ttl: segundos apos a expiracao em que o valor ainda pode ser servido como obsoleto
+
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> bool:
+        """
+        Remove uma entrada do cache.
+
+        args:
+            key: String da chave
+
+        retorna bool (True se a entrada existia)
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def cleanup_expired(self) -> int:
+        """
+        Remove todas as entradas expiradas.
+
+        retorna int de entradas removidas
+        """
+
+        raise NotImplementedError
+
+    def attach(self, key: str, value: Any, name: str, artifact: Any) -> bool:
+        """
+        Guarda um artefato derivado na entrada da chave, somando seu tamanho ao da entrada para que seja
+        contado nos limites de bytes e descartado junto com ela. Artefatos ja guardados sao mantidos.
+
+        args:
+            key: String da chave
+            value: valor da entrada a partir do qual o artefato foi derivado
+            name: String de identificacao do artefato
+            artifact: artefato a ser guardado
+
+        retorna bool (True se o artefato esta guardado na entrada)
+        """
+
+        entry = self.get_entry(key)
+        if entry is None or entry['value'] is not value:
+            return False
+
+        derived = entry.setdefault('derived', {})
+        if name not in derived:
+            size = estimate_size(artifact)
+            derived[name] = artifact
+            entry['size'] += size
+            self.total_bytes += size
+            self._evict()
+        return True
+
+    def record_fetch(self, seconds: float) -> None:
+        """
+        Registra a duracao de uma carga de valor para este backend.
+
+        args:
+            seconds: float de duracao da carga em segundos
+
+        """
+
+        self.stats['fetches'] += 1
+        self.stats['fetch_seconds_total'] += seconds
+        self.stats['fetch_seconds_max'] = max(self.stats['fetch_seconds_max'], seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtem as metricas do backend.
+
+        retorna dict com contadores, entradas e bytes mantidos
+        """
+
+        stats = dict(self.stats)
+        stats['entries'] = len(self)
+        stats['bytes'] = self.total_bytes
+        stats['fetch_seconds_avg'] = stats['fetch_seconds_total'] / stats['fetches'] if stats['fetches'] else 0.0
+        return stats
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    def _evict(self) -> None:
+        """Descartando entradas ate respeitar os limites do backend (sem limite de bytes por padrao)."""
+
+        return None
+
+
+class CacheStore(CacheBackend):
+    """Backend em processo com expiracao por TTL (relogio monotonico) e descarte LRU limitado por entradas e bytes."""
+
+    def __init__(self, ttl: float, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES) -> None:
+        """
+        Construtor do armazenamento.
+
+        args:
+            ttl: tempo de vida padrao das entradas, em segundos
+            max_entries: quantidade maxima de entradas
+            max_bytes: quantidade maxima de bytes estimados
+
+        """
+
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtem a entrada completa da chave, incluindo entradas expiradas ainda dentro do limite de obsolescencia.
+
+        args:
+            key: String da chave
+
+        retorna dict da entrada ('value', 'size', 'timestamp', 'expires_at', 'stale_until') ou None.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry['stale_until'] <= time.monotonic():
+            self._remove(key)
+            self.stats['expirations'] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, stale_ttl: float = 0) -> None:
+        """
+        Armazena um valor e aplica os limites de entradas e bytes.
+
+        args:
+            key: String da chave
+            value: valor a ser armazenado
+            ttl: tempo de vida em segundos (padrao do armazenamento se None)
+            stale_ttl: segundos apos a expiracao em que o valor ainda pode ser servido como obsoleto
+
+        """
+
+        if key in self._entries:
+            self._remove(key)
+
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            print(f"⚠️ Cache: '{key}' ignorado ({size} bytes excede o limite de {self.max_bytes})")
+            return
+
+        now = time.monotonic()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        self._entries[key] = {
+            'value': value,
+            'size': size,
+            'timestamp': now,
+            'expires_at': expires_at,
+            'stale_until': expires_at + stale_ttl,
+        }
+        self.total_bytes += size
+        self._evict()
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove uma entrada do cache.
+
+        args:
+            key: String da chave
+
+        retorna bool (True se a entrada existia)
+        """
+
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def cleanup_expired(self) -> int:
+        """
+        Remove todas as entradas expiradas.
+
+        retorna int de entradas removidas
+        """
+
+        now = time.monotonic()
+        expired_keys = [key for key, entry in self._entries.items() if entry['stale_until'] <= now]
+        for key in expired_keys:
+            self._remove(key)
+        self.stats['expirations'] += len(expired_keys)
+        return len(expired_keys)
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    def _remove(self, key: str) -> None:
+        """Removendo entrada e atualizando contagem de bytes."""
+
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry['size']
+
+    def _evict(self) -> None:
+        """Descartando entradas menos usadas ate respeitar os limites."""
+
+        while self._entries and (len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats['evictions'] += 1
+
+
+class SingleFlight:
+    """Agrupa cargas concorrentes da mesma chave em uma unica busca em andamento."""
+
+    def __init__(self) -> None:
+        """Construtor da classe. Inicializando buscas em andamento e contadores."""
+
+        self.stats = {'fetches': 0, 'coalesced': 0}
+
+        self._inflight = {}
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    async def run(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Executa a carga da chave ou aguarda a carga ja em andamento.
+
+        args:
+            key: String da chave da carga
+            loader: funcao assincrona que executa a carga
+
+        retorna o resultado compartilhado da carga.
+        """
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self.start(key, loader)
+        else:
+            self.stats['coalesced'] += 1
+
+        return await asyncio.shield(task)
+
+    def start(self, key: str, loader: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        """
+        Inicia a carga da chave sem aguarda-la (ou retorna a carga ja em andamento).
+        A carga fica registrada imediatamente, entao chamadas seguintes ja a encontram em andamento.
+
+        args:
+            key: String da chave da carga
+            loader: funcao assincrona que executa a carga
+
+        retorna o asyncio.Future da carga.
+        """
+
+        task = self._inflight.get(key)
+        if task is not None:
+            return task
+
+        # A carga pode sobreviver a requisicao que a iniciou e e compartilhada com outras: roda em um contexto
+        # vazio, sem herdar o rastro (tracing) da requisicao
+        task = contextvars.Context().run(asyncio.ensure_future, loader())
+        self._inflight[key] = task
+        task.add_done_callback(lambda t, key=key: self._finish(key, t))
+        self.stats['fetches'] += 1
+        return task
+
+    def in_flight(self, key: str) -> bool:
+        """
+        Verifica se ha carga em andamento para a chave.
+
+        args:
+            key: String da chave
+
+        retorna bool (True se ha carga em andamento)
+        """
+
+        return key in self._inflight
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        """Removendo a carga concluida e marcando eventual erro como tratado."""
+
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+
 class CacheAgent:
     """Agente de manipulacao de cache de AzureBoards"""
 
-    def __init__(self) -> None:
-        """Construtor da classe. Inicializando cache."""
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES,
+                 hard_stale_limit: float = BOARDS_HARD_STALE_LIMIT, disk_cache_dir: Optional[str] = None,
+                 boards_backend: Optional[CacheBackend] = None) -> None:
+        """
+        Construtor da classe. Inicializando cache.
+
+        args:
+            max_entries: quantidade maxima de entradas em cache
+            max_bytes: quantidade maxima de bytes estimados em cache
+            hard_stale_limit: segundos apos a expiracao em que um valor ainda pode ser servido enquanto e atualizado
+            disk_cache_dir: diretorio da camada de cache em disco para DataFrames (desativada se None)
+            boards_backend: backend dos dados de AzureBoards (padrao em processo; ver core.cache_backends
+                para o backend compartilhado entre workers)
+
+        """
 
-        self.boards_cache = {}
         self.cache_duration = CACHE_DURATION
-        self._last_cache_cleanup = datetime.now()
+        self.hard_stale_limit = hard_stale_limit
+        self.boards_cache = (
+            boards_backend if boards_backend is not None else CacheStore(CACHE_DURATION, max_entries, max_bytes)
+        )
+        self.search_cache = CacheStore(SEARCH_CACHE_DURATION, SEARCH_CACHE_MAX_ENTRIES, max_bytes)
+        self.stores = {'boards': self.boards_cache, 'search': self.search_cache}
+        self.disk_tier = disk_cache.DiskCacheTier(disk_cache_dir) if disk_cache_dir else None
+
+        self.single_flight = SingleFlight()
+        self._refresh_tasks = set()
+        self._project_warmer = None
+        self._project_flusher = None
+        self.project_access = {}
+
+        self._last_cache_cleanup = time.monotonic()
+        self._cleanup_task = None
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def get(self, key: str, namespace: str = "boards") -> Optional[Any]:
+        """
+        Obtem um valor do cache.
+
+        args:
+            key: String da chave
+            namespace: String do cache consultado ('boards' ou 'search')
+
+        retorna o valor armazenado ou None se ausente/expirado.
+        """
+
+        self._schedule_cleanup()
+        return self.stores[namespace].get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, stale_ttl: float = 0,
+            namespace: str = "boards") -> None:
+        """
+        Armazena um valor no cache.
+
+        args:
+            key: String da chave
+            value: valor a ser armazenado
+            ttl: tempo de vida em segundos (padrao do namespace se None)
+            stale_ttl: segundos apos a expiracao em que o valor ainda pode ser servido como obsoleto
+            namespace: String do cache usado ('boards' ou 'search')
+
+        """
+
+        self._schedule_cleanup()
+        self.stores[namespace].set(key, value, ttl, stale_ttl)
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]],
+                          ttl: Optional[float] = None, stale_while_revalidate: bool = False,
+                          force_refresh: bool = False,
+                          negative_ttl: float = NEGATIVE_CACHE_DURATION) -> Optional[Any]:
+        """
+        Obtem um valor do cache ou o carrega uma unica vez, mesmo com chamadas concorrentes.
+
+        Resultados vazios (None, DataFrame/colecao vazia) nao sao armazenados, pois os loaders tambem os
+        retornam quando a busca falha. Um resultado negativo so e armazenado (por negative_ttl) quando o
+        loader levanta uma excecao sem haver valor anterior em cache, ou retorna NEGATIVE_RESULT.
+        O loader pode retornar WithDerived para guardar artefatos derivados junto com o valor.
+
+        args:
+            key: String da chave
+            loader: funcao assincrona que retorna o valor
+            ttl: tempo de vida em segundos (padrao CACHE_DURATION se None)
+            stale_while_revalidate: se True, valores expirados dentro do limite de obsolescencia
+                sao servidos imediatamente enquanto uma atualizacao roda em segundo plano
+            force_refresh: se True, recarrega o valor mesmo que ainda esteja valido (aquecimento)
+            negative_ttl: segundos em que um resultado negativo e servido sem nova carga
+
+        retorna o valor armazenado/carregado ou None (resultado negativo).
+        """
+
+        self._schedule_cleanup()
+        stale_ttl = self.hard_stale_limit if stale_while_revalidate else 0
+
+        async def load_and_store():
+            inicio = time.perf_counter()
+            try:
+                loaded = await loader()
+            except Exception:
+                self.boards_cache.record_fetch(time.perf_counter() - inicio)
+                if self.boards_cache.get_entry(key) is None:
+                    self.set(key, NEGATIVE_RESULT, negative_ttl)
+                raise
+
+            self.boards_cache.record_fetch(time.perf_counter() - inicio)
+            derived = {}
+            if isinstance(loaded, WithDerived):
+                loaded, derived = loaded.value, loaded.derived
+            if loaded is NEGATIVE_RESULT:
+                self.set(key, NEGATIVE_RESULT, negative_ttl)
+                return None
+            if not _is_empty(loaded):
+                self.set(key, loaded, ttl, stale_ttl)
+                for name, artifact in derived.items():
+                    self.boards_cache.attach(key, loaded, name, artifact)
+                if self.disk_tier is not None and isinstance(loaded, pd.DataFrame):
+                    await asyncio.to_thread(self.disk_tier.save, key, loaded)
+            return loaded
+
+        if force_refresh:
+            return await self.single_flight.run(key, load_and_store)
+
+        entry = self.boards_cache.get_entry(key)
+        if entry is None and self.disk_tier is not None:
+            entry = await self._load_from_disk(key, ttl, stale_ttl)
+        if entry is not None and entry['value'] is NEGATIVE_RESULT:
+            if entry['expires_at'] > time.monotonic():
+                self.boards_cache.stats['negative_hits'] += 1
+                return None
+            entry = None
+        if entry is not None:
+            if entry['expires_at'] > time.monotonic():
+                self.boards_cache.stats['hits'] += 1
+                return entry['value']
+            if stale_while_revalidate:
+                self.boards_cache.stats['stale_hits'] += 1
+                self._schedule_refresh(key, load_and_store)
+                return entry['value']
+
+        self.boards_cache.stats['misses'] += 1
+        return await self.single_flight.run(key, load_and_store)
+
+    def get_derived(self, key: str, value: Any, name: str, builder: Callable[[Any], Any]) -> Any:
+        """
+        Obtem um artefato derivado (indice, memo...) de um valor em cache, construido uma vez por versao da entrada.
+        O artefato conta no tamanho da entrada e e descartado automaticamente quando a entrada e substituida.
+
+        args:
+            key: String da chave da entrada de AzureBoards
+            value: valor a partir do qual o artefato e derivado
+            name: String de identificacao do artefato
+            builder: funcao que recebe o valor e constroi o artefato
+
+        retorna o artefato (construido sem ser guardado se o valor nao for mais o da entrada em cache)
+        """
+
+        entry = self.boards_cache.get_entry(key)
+        if entry is None or entry['value'] is not value:
+            return builder(value)
+
+        artefato = entry.get('derived', {}).get(name)
+        if artefato is None:
+            artefato = builder(value)
+            self.boards_cache.attach(key, value, name, artefato)
+        return artefato
+
+    async def get_derived_async(self, key: str, value: Any, name: str,
+                                builder: Callable[[Any], Awaitable[Any]]) -> Any:
+        """
+        Versao assincrona de get_derived: o artefato e construido uma unica vez mesmo com chamadas concorrentes.
+        Artefatos None nao sao guardados.
+
+        args:
+            key: String da chave da entrada de AzureBoards
+            value: valor a partir do qual o artefato e derivado
+            name: String de identificacao do artefato
+            builder: funcao assincrona que recebe o valor e constroi o artefato
+
+        retorna o artefato (construido sem ser guardado se o valor nao for mais o da entrada em cache)
+        """
+
+        entry = self.boards_cache.get_entry(key)
+        if entry is None or entry['value'] is not value:
+            return await builder(value)
+
+        artefato = entry.get('derived', {}).get(name)
+        if artefato is None:
+            artefato = await self.single_flight.run(f"{key}:{name}", lambda: builder(value))
+            if artefato is not None:
+                self.boards_cache.attach(key, value, name, artefato)
+        return artefato
+
+    def get_attached(self, key: str, value: Any, name: str) -> Optional[Any]:
+        """
+        Obtem um artefato derivado ja guardado na entrada, sem construi-lo.
+
+        args:
+            key: String da chave da entrada de AzureBoards
+            value: valor a partir do qual o artefato foi derivado
+            name: String de identificacao do artefato
+
+        retorna o artefato ou None (ausente, ou valor que nao e mais o da entrada em cache)
+        """
+
+        entry = self.boards_cache.get_entry(key)
+        if entry is None or entry['value'] is not value:
+            return None
+        return entry.get('derived', {}).get(name)
+
+    def invalidate(self, key: str, namespace: str = "boards") -> bool:
+        """
+        Invalida uma entrada do cache.
+
+        args:
+            key: String da chave
+            namespace: String do cache usado ('boards' ou 'search')
+
+        retorna bool (True se a entrada existia)
+        """
+
+        if self.disk_tier is not None and namespace == "boards":
+            self.disk_tier.delete(key)
+        return self.stores[namespace].delete(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtem as metricas do cache por namespace, em formato simples para exportadores externos.
+
+        retorna dict com metricas de cada namespace e da camada single-flight
+        """
+
+        stats = {namespace: store.get_stats() for namespace, store in self.stores.items()}
+        stats['single_flight'] = dict(self.single_flight.stats)
+        return stats
+
+    def record_project_access(self, projeto: str) -> None:
+        """
+        Registra uma consulta a um projeto (usado pelo aquecimento para priorizar os Boards populares).
+
+        args:
+            projeto: String de identificacao do projeto
+
+        """
+
+        acesso = self.project_access.setdefault(projeto, {'count': 0, 'last_access': 0.0})
+        acesso['count'] += 1
+        acesso['last_access'] = time.monotonic()
+
+    def register_project_hooks(self, warmer: Callable[[str, bool], Awaitable[bool]],
+                               flusher: Callable[[str], int]) -> None:
+        """
+        Registra as funcoes que aquecem e limpam os dados de um projeto no cache.
+
+        args:
+            warmer: funcao assincrona que recebe o projeto e se deve recarregar, e carrega seus dados
+                (retorna bool de sucesso)
+            flusher: funcao que recebe o projeto e remove seus dados (retorna int de entradas removidas)
+
+        """
+
+        self._project_warmer = warmer
+        self._project_flusher = flusher
+
+    async def warm_project(self, projeto: str, refresh: bool = False) -> bool:
+        """
+        Carrega os dados de um projeto no cache.
+
+        args:
+            projeto: String de identificacao do projeto
+            refresh: se True, recarrega os dados mesmo que ainda estejam validos
+
+        retorna bool (True se os dados foram carregados)
+        """
+
+        if self._project_warmer is None:
+            return False
+        return await self._project_warmer(projeto, refresh)
+
+    def flush_project(self, projeto: str) -> int:
+        """
+        Remove os dados de um projeto do cache.
+
+        args:
+            projeto: String de identificacao do projeto
+
+        retorna int de entradas removidas
+        """
+
+        if self._project_flusher is None:
+            return 0
+        return self._project_flusher(projeto)
+
+    async def stop(self) -> None:
+        """Encerrando a limpeza e as atualizacoes em segundo plano."""
+
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        self._refresh_tasks.clear()
+
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+            self._cleanup_task = None
 
     ###################
     # Funcoes privadas
     ###################
 
-    def _cleanup_cache(self) -> None:
-        """Limpando cache."""
-
-        now = datetime.now()
-        if (now - self._last_cache_cleanup).seconds > CACHE_CLEANUP_INTERVAL:
-            expired_keys = [
-                key for key, data in self.boards_cache.items()
-                if (now - data['timestamp']).seconds > self.cache_duration
-            ]
-            for key in expired_keys:
-                del self.boards_cache[key]
-            self._last_cache_cleanup = now
-
-    async def _get_boards_data_cached(self, projeto: str, pergunta_lower: str) -> Optional[pd.DataFrame]:
-        """
-        Obter cache armazenado no AzureBoards.
-        
-        args:
-            projeto: String com o noome do projeto
-            pergunta_lower: String da pergunta em minusculo
-
-        retorna um DataFrame com os dados em cache ou None.
-        """
-        
-        buscar_epicos = any(termo in pergunta_lower for termo in CLIENT_SEARCH_KEYWORDS)
-        
-        cache_key = f"{projeto}_{datetime.now().strftime('%Y%m%d_%H_%M')[:12]}"
-        if buscar_epicos:
-            cache_key += "_epicos"
-        
-        if cache_key in self.boards_cache:
-            cached_data = self.boards_cache[cache_key]
-            if (datetime.now() - cached_data['timestamp']).seconds < self.cache_duration:
-                return cached_data['dataframe']
-        
+    def _cleanup_cache(self) -> int:
+        """
+        Limpando cache.
+
+        retorna int de entradas removidas
+        """
+
+        now = time.monotonic()
+        if now - self._last_cache_cleanup < CACHE_CLEANUP_INTERVAL:
+            return 0
+
+        self._last_cache_cleanup = now
+        return sum(store.cleanup_expired() for store in self.stores.values())
+
+    def _schedule_cleanup(self) -> None:
+        """Iniciando a limpeza em segundo plano se houver event loop ativo, ou limpando de forma amortizada."""
+
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
+
         try:
-            azure_service = AzureBoardsService(projeto)
-            work_items = azure_service.buscar_work_items(batch_size=100)
-            
-            if not work_items:
-                return None
-            
-            df = await processar_work_items_df(work_items, projeto=projeto, buscar_epicos=buscar_epicos)
-            
-            self.boards_cache[cache_key] = {
-                'dataframe': df,
-                'timestamp': datetime.now()
-            }
-            
-            return df
-            
-        except Exception as e:
-            print(f"❌ Erro ao buscar boards: {e}")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._cleanup_cache()
+            return
+
+        self._cleanup_task = loop.create_task(self._cleanup_loop())
+
+    async def _load_from_disk(self, key: str, ttl: Optional[float], stale_ttl: float) -> Optional[Dict[str, Any]]:
+        """
+        Carregando uma chave da camada em disco para a memoria, descontando a idade do arquivo do tempo de vida.
+
+        args:
+            key: String da chave
+            ttl: tempo de vida em segundos (padrao CACHE_DURATION se None)
+            stale_ttl: segundos apos a expiracao em que o valor ainda pode ser servido como obsoleto
+
+        retorna dict da entrada carregada ou None se ausente/velha demais.
+        """
+
+        carregado = await asyncio.to_thread(self.disk_tier.load, key)
+        if carregado is None:
+            return None
+
+        df, idade = carregado
+        restante = (self.cache_duration if ttl is None else ttl) - idade
+        if restante + stale_ttl <= 0:
             return None
-    
\ No newline at end of file
+
+        self.boards_cache.set(key, df, max(restante, 0), stale_ttl + min(restante, 0))
+        return self.boards_cache.get_entry(key)
+
+    def _schedule_refresh(self, key: str, load_and_store: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Agendando atualizacao em segundo plano da chave, se ainda nao houver uma em andamento.
+
+        args:
+            key: String da chave
+            load_and_store: funcao assincrona que carrega e armazena o novo valor
+
+        """
+
+        if self.single_flight.in_flight(key):
+            return
+
+        def finish(task):
+            self._refresh_tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                print(f"❌ Erro ao atualizar cache '{key}' em segundo plano: {task.exception()}")
+
+        task = self.single_flight.start(key, load_and_store)
+        self._refresh_tasks.add(task)
+        task.add_done_callback(finish)
+
+    async def _cleanup_loop(self) -> None:
+        """Limpando entradas expiradas periodicamente."""
+
+        while True:
+            await asyncio.sleep(CACHE_CLEANUP_INTERVAL)
+            self._cleanup_cache()
+
+
+def _is_empty(value: Any) -> bool:
+    """
+    Verifica se um resultado carregado e vazio (nao armazenado em cache).
+
+    args:
+        value: resultado do loader
+
+    retorna bool (True se None, DataFrame/Series vazio ou colecao vazia)
+    """
+
+    if value is None:
+        return True
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.empty
+    if isinstance(value, (list, tuple, dict, set, frozenset)):
+        return not value
+    return False
@@ -0,0 +1,376 @@
+# 1. Importando bibliotecas padrao
+import fnmatch
+import io
+import json
+import math
+import os
+import re
+import struct
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Iterator
+
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+# 4. Importando constantes
+from src.services.constants import (
+    # Parametros
+    CACHE_DURATION
+)
+
+# 5. Importando modulos locais
+from core import cache
+
+# Parametros do backend compartilhado
+SHARED_CACHE_PREFIX = "sofia:cache:"
+SHARED_CACHE_LOCAL_ENTRIES = 32
+
+
+def _serialize(value: Any) -> bytes:
+    """
+    Serializa um valor para o backend compartilhado.
+    DataFrames usam Arrow IPC (ou JSON 'split' sem pyarrow); resultados negativos usam um marcador; demais valores usam JSON.
+
+    args:
+        value: valor a ser serializado
+
+    retorna bytes com um prefixo de formato
+    """
+
+    if value is cache.NEGATIVE_RESULT:
+        return b"N"
+    if isinstance(value, pd.DataFrame):
+        if pa is not None:
+            table = pa.Table.from_pandas(value, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return b"A" + sink.getvalue().to_pybytes()
+        return b"F" + value.to_json(orient="split", date_format="iso").encode()
+    return b"J" + json.dumps(value, default=str).encode()
+
+
+def _deserialize(payload: bytes) -> Any:
+    """
+    Desserializa um valor gravado por _serialize.
+
+    args:
+        payload: bytes com prefixo de formato
+
+    retorna o valor original
+    """
+
+    formato, dados = payload[:1], payload[1:]
+    if formato == b"N":
+        return cache.NEGATIVE_RESULT
+    if formato == b"A":
+        return pa.ipc.open_stream(pa.py_buffer(dados)).read_all().to_pandas()
+    if formato == b"F":
+        return pd.read_json(io.StringIO(dados.decode()), orient="split")
+    return json.loads(dados)
+
+
+class FileStoreClient:
+    """Armazenamento chave/valor em diretorio local, compartilhavel entre processos do mesmo host (interface estilo Redis)."""
+
+    def __init__(self, directory: str) -> None:
+        """
+        Construtor do armazenamento em arquivos.
+
+        args:
+            directory: diretorio compartilhado pelos workers
+
+        """
+
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def get(self, name: str) -> Optional[bytes]:
+        """
+        Le o valor de uma chave.
+
+        args:
+            name: String da chave
+
+        retorna bytes do valor ou None se ausente/expirado.
+        """
+
+        path = self._path(name)
+        try:
+            with open(path, "rb") as arquivo:
+                (expira_em,) = struct.unpack("!d", arquivo.read(8))
+                dados = arquivo.read()
+        except (FileNotFoundError, struct.error):
+            return None
+
+        if expira_em and expira_em <= time.time():
+            self.delete(name)
+            return None
+        return dados
+
+    def set(self, name: str, value: bytes, ex: Optional[int] = None) -> bool:
+        """
+        Grava o valor de uma chave de forma atomica.
+
+        args:
+            name: String da chave
+            value: bytes do valor
+            ex: int de segundos ate a expiracao (sem expiracao se None)
+
+        retorna bool (True se gravado)
+        """
+
+        path = self._path(name)
+        tmp_path = f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        expira_em = time.time() + ex if ex else 0.0
+
+        with open(tmp_path, "wb") as arquivo:
+            arquivo.write(struct.pack("!d", expira_em))
+            arquivo.write(value)
+        os.replace(tmp_path, path)
+        return True
+
+    def delete(self, *names: str) -> int:
+        """
+        Remove chaves.
+
+        args:
+            names: Strings das chaves
+
+        retorna int de chaves removidas
+        """
+
+        removidas = 0
+        for name in names:
+            try:
+                os.remove(self._path(name))
+                removidas += 1
+            except FileNotFoundError:
+                continue
+        return removidas
+
+    def scan_iter(self, match: str = "*") -> Iterator[str]:
+        """
+        Lista as chaves gravadas que casam com um padrao glob.
+
+        args:
+            match: String do padrao (ex.: 'sofia:cache:*')
+
+        retorna um gerador de Strings das chaves (na forma gravada em disco)
+        """
+
+        padrao = "*".join(re.sub(r"[^\w.-]", "_", parte) for parte in match.split("*"))
+        for nome in os.listdir(self.directory):
+            if not nome.endswith(".tmp") and fnmatch.fnmatchcase(nome, padrao):
+                yield nome
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    def _path(self, name: str) -> str:
+        """Montando o caminho do arquivo de uma chave."""
+
+        return os.path.join(self.directory, re.sub(r"[^\w.-]", "_", name))
+
+
+class SharedCacheBackend(cache.CacheBackend):
+    """
+    Backend compartilhado entre workers sobre um cliente chave/valor (servidor Redis ou FileStoreClient).
+    Mantem uma copia local das entradas lidas, revalidada por um token de versao a cada consulta.
+    """
+
+    def __init__(self, client: Any, ttl: float = CACHE_DURATION, prefix: str = SHARED_CACHE_PREFIX,
+                 local_max_entries: int = SHARED_CACHE_LOCAL_ENTRIES) -> None:
+        """
+        Construtor do backend compartilhado.
+
+        args:
+            client: cliente com get(name), set(name, value, ex=None), delete(*names) e scan_iter(match)
+                (ex.: redis.Redis)
+            ttl: tempo de vida padrao das entradas, em segundos
+            prefix: String de prefixo das chaves no servidor
+            local_max_entries: quantidade maxima de entradas mantidas desserializadas em memoria
+
+        """
+
+        super().__init__(ttl)
+        self.client = client
+        self.prefix = prefix
+        self.local_max_entries = local_max_entries
+
+        self._local = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtem a entrada compartilhada da chave, desserializando-a apenas quando sua versao muda.
+
+        args:
+            key: String da chave
+
+        retorna dict da entrada (datas convertidas para o relogio monotonico local) ou None.
+        """
+
+        meta_raw = self.client.get(self._meta_key(key))
+        if meta_raw is None:
+            self._drop_local(key)
+            return None
+
+        meta = json.loads(meta_raw)
+        agora_wall, agora_mono = time.time(), time.monotonic()
+        if meta['stale_until'] <= agora_wall:
+            self._drop_local(key)
+            self.stats['expirations'] += 1
+            return None
+
+        local = self._local.get(key)
+        if local is None or local['token'] != meta['token']:
+            payload = self.client.get(self._data_key(key))
+            if payload is None:
+                self._drop_local(key)
+                return None
+
+            self._drop_local(key)
+            local = {'token': meta['token'], 'entry': {'value': _deserialize(payload), 'size': meta['size']}}
+            self._local[key] = local
+            self.total_bytes += meta['size']
+            self._evict_local()
+        else:
+            self._local.move_to_end(key)
+
+        entry = local['entry']
+        entry['timestamp'] = agora_mono - (agora_wall - meta['timestamp'])
+        entry['expires_at'] = agora_mono + (meta['expires_at'] - agora_wall)
+        entry['stale_until'] = agora_mono + (meta['stale_until'] - agora_wall)
+        return entry
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, stale_ttl: float = 0) -> None:
+        """
+        Serializa e grava um valor no servidor compartilhado.
+
+        args:
+            key: String da chave
+            value: valor a ser armazenado
+            ttl: tempo de vida em segundos (padrao do backend se None)
+            stale_ttl: segundos apos a expiracao em que o valor ainda pode ser servido como obsoleto
+
+        """
+
+        payload = _serialize(value)
+        agora = time.time()
+        expires_at = agora + (self.ttl if ttl is None else ttl)
+        meta = {
+            'token': uuid.uuid4().hex,
+            'size': cache.estimate_size(value),
+            'timestamp': agora,
+            'expires_at': expires_at,
+            'stale_until': expires_at + stale_ttl,
+        }
+        ex = max(1, math.ceil(meta['stale_until'] - agora))
+
+        self.client.set(self._data_key(key), payload, ex=ex)
+        self.client.set(self._meta_key(key), json.dumps(meta).encode(), ex=ex)
+
+        self._drop_local(key)
+        self._local[key] = {'token': meta['token'], 'entry': {'value': value, 'size': meta['size']}}
+        self.total_bytes += meta['size']
+        self._evict_local()
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove uma entrada do servidor e da copia local.
+
+        args:
+            key: String da chave
+
+        retorna bool (True se a entrada existia no servidor)
+        """
+
+        self._drop_local(key)
+        return bool(self.client.delete(self._meta_key(key), self._data_key(key)))
+
+    def clear(self) -> None:
+        """Remove do servidor todas as entradas do prefixo (de todos os workers) e limpa a copia local."""
+
+        nomes = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        if nomes:
+            self.client.delete(*nomes)
+        for key in list(self._local):
+            self._drop_local(key)
+
+    def cleanup_expired(self) -> int:
+        """
+        Remove da copia local as entradas expiradas (o servidor expira as suas pelo TTL).
+
+        retorna int de entradas removidas
+        """
+
+        agora = time.monotonic()
+        expiradas = [key for key, local in self._local.items() if local['entry'].get('stale_until', agora) < agora]
+        for key in expiradas:
+            self._drop_local(key)
+        self.stats['expirations'] += len(expiradas)
+        return len(expiradas)
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    def _meta_key(self, key: str) -> str:
+        return f"{self.prefix}{key}:meta"
+
+    def _data_key(self, key: str) -> str:
+        return f"{self.prefix}{key}:data"
+
+    def _drop_local(self, key: str) -> None:
+        """Removendo a copia local de uma chave."""
+
+        local = self._local.pop(key, None)
+        if local is not None:
+            self.total_bytes -= local['entry']['size']
+
+    def _evict_local(self) -> None:
+        """Descartando copias locais menos usadas ate respeitar o limite."""
+
+        while len(self._local) > self.local_max_entries:
+            key = next(iter(self._local))
+            self._drop_local(key)
+            self.stats['evictions'] += 1
+
+
+def create_shared_backend(url: str, ttl: float = CACHE_DURATION) -> SharedCacheBackend:
+    """
+    Cria um backend compartilhado a partir de uma URL.
+
+    args:
+        url: 'redis://host:porta/db' (requer o pacote redis) ou 'file:///caminho/do/diretorio'
+        ttl: tempo de vida padrao das entradas, em segundos
+
+    retorna o SharedCacheBackend configurado
+    """
+
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        import redis
+        return SharedCacheBackend(redis.Redis.from_url(url), ttl=ttl)
+    if url.startswith("file://"):
+        return SharedCacheBackend(FileStoreClient(url[len("file://"):]), ttl=ttl)
+    raise ValueError(f"URL de cache compartilhado não suportada: {url}")
@@ -0,0 +1,223 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+import time
+from typing import Dict, Any, Optional, List, Iterable
+
+# 4. Importando constantes
+from src.services.constants import (
+    # Padroes
+    BOARD_PROJECTS,
+
+    # Parametros
+    CACHE_DURATION,
+)
+
+# 5. Importando modulos locais
+from core import cache
+
+# Parametros do aquecimento de cache
+WARMUP_INTERVAL = CACHE_DURATION * 0.8
+WARMUP_MAX_INTERVAL = CACHE_DURATION * 6
+WARMUP_HOT_QUERIES = 10
+WARMUP_TICK = 30
+WARMUP_IDLE_AFTER = 2 * 60 * 60
+WARMUP_MAX_CONCURRENCY = 2
+WARMUP_POPULARITY_HALF_LIFE = 60 * 60
+
+class CacheWarmer:
+    """
+    Agente de aquecimento do cache de AzureBoards: pre-carrega os Boards em segundo plano na inicializacao e
+    atualiza cada Board consultado com frequencia proporcional a sua popularidade.
+    As cargas passam pelo limiter do AsyncBoardsFetcher, o mesmo orcamento de chamadas ao Azure das consultas
+    dos usuarios; max_concurrency apenas impede que o aquecimento ocupe o orcamento inteiro.
+    """
+
+    def __init__(self, CacheHandler: cache.CacheAgent, projetos: Optional[Iterable[str]] = None,
+                 interval: float = WARMUP_INTERVAL, max_interval: float = WARMUP_MAX_INTERVAL,
+                 hot_queries: float = WARMUP_HOT_QUERIES, tick: float = WARMUP_TICK,
+                 idle_after: float = WARMUP_IDLE_AFTER, max_concurrency: int = WARMUP_MAX_CONCURRENCY) -> None:
+        """
+        Construtor do agente de aquecimento.
+
+        args:
+            CacheHandler: Agente de cache ativo (com os hooks de projeto registrados pelo BoardsHandler)
+            projetos: projetos pre-carregados na inicializacao (padrao todos de BOARD_PROJECTS)
+            interval: menor intervalo de atualizacao, em segundos (projetos mais populares, abaixo do tempo de vida do cache)
+            max_interval: maior intervalo de atualizacao, em segundos (projetos pouco consultados)
+            hot_queries: consultas recentes a partir das quais um projeto e atualizado no menor intervalo
+            tick: segundos entre verificacoes dos projetos com atualizacao vencida
+            idle_after: segundos sem consultas apos os quais um projeto deixa de ser atualizado
+            max_concurrency: int maximo de Boards carregados ao mesmo tempo pelo aquecimento
+
+        """
+
+        self.CacheHandler = CacheHandler
+        self.projetos = list(dict.fromkeys(projetos if projetos is not None else BOARD_PROJECTS.values()))
+        self.interval = interval
+        self.max_interval = max(max_interval, interval)
+        self.hot_queries = hot_queries
+        self.tick = tick
+        self.idle_after = idle_after
+
+        self.stats = {'prefetches': 0, 'refreshes': 0, 'failures': 0, 'dropped': 0}
+        self._hot = set()
+        self._last_refresh = {}
+        self._last_decay = time.monotonic()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._task = None
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    async def start(self) -> None:
+        """Inicia em segundo plano o pre-carregamento de todos os projetos e as atualizacoes agendadas (sem aguarda-los)."""
+
+        if self._task is not None:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Encerrando as atualizacoes agendadas."""
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def hot_projects(self) -> List[str]:
+        """
+        Seleciona os projetos que devem continuar aquecidos, dos mais consultados para os menos.
+
+        retorna list de projetos consultados dentro da janela de inatividade
+        """
+
+        agora = time.monotonic()
+        acessos = self.CacheHandler.project_access
+        ativos = [
+            projeto for projeto, acesso in acessos.items()
+            if agora - acesso['last_access'] <= self.idle_after
+        ]
+        return sorted(ativos, key=lambda projeto: acessos[projeto]['count'], reverse=True)
+
+    def refresh_interval(self, projeto: str) -> float:
+        """
+        Calcula o intervalo de atualizacao de um projeto a partir de suas consultas recentes.
+        Projetos com hot_queries consultas recentes ou mais usam o menor intervalo; abaixo disso o intervalo
+        cresce na proporcao inversa das consultas, ate max_interval.
+
+        args:
+            projeto: String de identificacao do projeto
+
+        retorna float de segundos entre atualizacoes
+        """
+
+        consultas = self.CacheHandler.project_access.get(projeto, {}).get('count', 0)
+        if consultas <= 0:
+            return self.max_interval
+        return min(max(self.interval * self.hot_queries / consultas, self.interval), self.max_interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna as estatisticas do aquecimento.
+
+        retorna dict com contadores e projetos aquecidos
+        """
+
+        return {
+            **self.stats,
+            'hot_projects': {projeto: round(self.refresh_interval(projeto)) for projeto in sorted(self._hot)},
+            'running': self._task is not None,
+        }
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    async def _run(self) -> None:
+        """Pre-carregando os projetos e verificando as atualizacoes vencidas a cada tick."""
+
+        carregados = await self._warm_all(self.projetos, refresh=False)
+        self.stats['prefetches'] += carregados
+        print(f"🔥 Aquecimento: {carregados}/{len(self.projetos)} Boards pré-carregados")
+
+        agora = time.monotonic()
+        for projeto in self.projetos:
+            self._last_refresh[projeto] = agora
+
+        while True:
+            await asyncio.sleep(self.tick)
+            await self._refresh_cycle()
+
+    async def _refresh_cycle(self) -> None:
+        """Atualiza os projetos populares com atualizacao vencida e deixa de atualizar os inativos."""
+
+        agora = time.monotonic()
+        self._decay_popularity(agora)
+        quentes = self.hot_projects()
+
+        inativos = self._hot.difference(quentes)
+        if inativos:
+            self.stats['dropped'] += len(inativos)
+            print(f"🧊 Aquecimento: {', '.join(sorted(inativos))} sem consultas, deixando de atualizar")
+            for projeto in inativos:
+                self._last_refresh.pop(projeto, None)
+        self._hot = set(quentes)
+
+        vencidos = []
+        for projeto in quentes:
+            ultima = self._last_refresh.setdefault(projeto, agora)
+            if agora - ultima >= self.refresh_interval(projeto):
+                vencidos.append(projeto)
+                self._last_refresh[projeto] = agora
+
+        if vencidos:
+            self.stats['refreshes'] += await self._warm_all(vencidos, refresh=True)
+
+    def _decay_popularity(self, agora: float) -> None:
+        """Reduzindo as contagens de consultas pela meia-vida de popularidade (consultas recentes pesam mais)."""
+
+        fator = 0.5 ** ((agora - self._last_decay) / WARMUP_POPULARITY_HALF_LIFE)
+        self._last_decay = agora
+        for acesso in self.CacheHandler.project_access.values():
+            acesso['count'] *= fator
+
+    async def _warm_all(self, projetos: List[str], refresh: bool) -> int:
+        """
+        Carrega varios projetos em paralelo, respeitando o limite de concorrencia do aquecimento.
+
+        args:
+            projetos: list de projetos
+            refresh: se True, recarrega os dados mesmo que ainda estejam validos
+
+        retorna int de projetos carregados com sucesso
+        """
+
+        resultados = await asyncio.gather(*(self._warm_one(projeto, refresh) for projeto in projetos))
+        return sum(resultados)
+
+    async def _warm_one(self, projeto: str, refresh: bool) -> bool:
+        """
+        Carrega um projeto dentro do limite de concorrencia.
+
+        args:
+            projeto: String de identificacao do projeto
+            refresh: se True, recarrega os dados mesmo que ainda estejam validos
+
+        retorna bool (True se os dados foram carregados)
+        """
+
+        async with self._semaphore:
+            try:
+                if await self.CacheHandler.warm_project(projeto, refresh):
+                    return True
+            except Exception as e:
+                print(f"❌ Erro ao aquecer '{projeto}': {e}")
+            self.stats['failures'] += 1
+            return False
@@ -0,0 +1,145 @@
+# 1. Importando bibliotecas padrao
+import os
+import re
+import time
+from typing import Any, Optional, Tuple
+
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+# Parametros do cache em disco
+DISK_CACHE_FORMAT_VERSION = "1"
+DISK_CACHE_SUFFIX = ".arrow"
+
+
+class DiskCacheTier:
+    """
+    Camada opcional de cache em disco para DataFrames processados, em arquivos Arrow IPC.
+    A leitura materializa o DataFrame inteiro em memoria: o ganho e evitar a busca e o processamento no Azure.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Construtor da camada em disco.
+
+        args:
+            directory: diretorio onde os arquivos de cache sao gravados
+
+        """
+
+        self.directory = directory
+        self.enabled = pa is not None
+
+        if not self.enabled:
+            print("⚠️ Cache em disco desativado: pyarrow não está instalado.")
+            return
+
+        os.makedirs(directory, exist_ok=True)
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def save(self, key: str, df: pd.DataFrame) -> bool:
+        """
+        Grava um DataFrame em disco com versao de formato e data de gravacao.
+
+        args:
+            key: String da chave de cache
+            df: DataFrame a ser gravado
+
+        retorna bool (True se o arquivo foi gravado)
+        """
+
+        if not self.enabled or not isinstance(df, pd.DataFrame):
+            return False
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[b"sofia_version"] = DISK_CACHE_FORMAT_VERSION.encode()
+            metadata[b"sofia_timestamp"] = str(time.time()).encode()
+            table = table.replace_schema_metadata(metadata)
+
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao gravar cache em disco '{key}': {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    def load(self, key: str) -> Optional[Tuple[pd.DataFrame, float]]:
+        """
+        Carrega um DataFrame do disco (arquivo lido por completo e convertido para pandas).
+
+        args:
+            key: String da chave de cache
+
+        retorna tupla (DataFrame, idade em segundos) ou None se ausente/incompativel.
+        """
+
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with pa.OSFile(path, "rb") as source:
+                table = pa.ipc.open_file(source).read_all()
+
+            metadata = table.schema.metadata or {}
+            if metadata.get(b"sofia_version", b"").decode() != DISK_CACHE_FORMAT_VERSION:
+                return None
+
+            idade = time.time() - float(metadata.get(b"sofia_timestamp", b"0"))
+            return table.to_pandas(), max(idade, 0.0)
+        except Exception as e:
+            print(f"❌ Erro ao ler cache em disco '{key}': {e}")
+            return None
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove o arquivo de uma chave.
+
+        args:
+            key: String da chave de cache
+
+        retorna bool (True se o arquivo existia)
+        """
+
+        path = self._path(key)
+        if not self.enabled or not os.path.exists(path):
+            return False
+        os.remove(path)
+        return True
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    def _path(self, key: str) -> str:
+        """
+        Monta o caminho do arquivo de uma chave.
+
+        args:
+            key: String da chave de cache
+
+        retorna String do caminho do arquivo
+        """
+
+        return os.path.join(self.directory, re.sub(r"[^\w.-]", "_", key) + DISK_CACHE_SUFFIX)
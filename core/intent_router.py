@@ -1,6 +1,7 @@
 # 1. Standard library imports
 import re
-from functools import lru_cache
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Sequence
 
 # 4. Constants imports
 from src.services.constants import (    
@@ -16,62 +17,176 @@ from src.services.constants import (
     REGEX_PATTERNS, URL_VALIDATION_PATTERNS, INVALID_URL_PATTERNS,
 )
 
-class IntentRouter:
+# 5. Importando modulos locais
+from core.cache import CACHE_ADMIN_COMMANDS
+from core import message_features
 
-    def __init__(self,BoardsHandler):
-        self.modo_analise_boards = BoardsHandler.modo_analise_boards
-        self.aprendizado_manual_ativo = BoardsHandler.aprendizado_manual_ativo
+# Keyword lists checked by the router (MessageFeatures categories)
+ROUTER_KEYWORDS = {
+    'ADMIN_COMMANDS': ADMIN_COMMANDS.keys(),
+    'CACHE_ADMIN_COMMANDS': CACHE_ADMIN_COMMANDS,
+    'BOARDS_COMMANDS': BOARDS_COMMANDS,
+    'LEARNING_TRIGGERS': LEARNING_TRIGGERS,
+    'LIST_PATTERNS': LIST_PATTERNS,
+    'FILE_KEYWORDS': FILE_KEYWORDS,
+    'ACTION_KEYWORDS': ACTION_KEYWORDS,
+    'CASUAL_WORDS': CASUAL_WORDS,
+}
+
+# Patterns compiled once per process
+FILE_EXTENSION_PATTERN = re.compile(REGEX_PATTERNS['file_extension'], re.IGNORECASE)
+FILE_NAMING_PATTERN = re.compile(REGEX_PATTERNS['file_naming'])
+GREETING_PATTERN = re.compile(REGEX_PATTERNS['greeting'], re.IGNORECASE)
+
+# File scorer parameters
+FILE_SCORE_CACHE_SIZE = 4096
+FILE_SCORE_WEIGHTS = {'FILE_KEYWORDS': 0.2, 'ACTION_KEYWORDS': 0.15, 'CASUAL_WORDS': 0.2}
+
+
+class FileScorer:
+    """File-intent scorer with precompiled patterns and a bounded LRU cache keyed on the raw message."""
+
+    def __init__(self, max_entries: int = FILE_SCORE_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+        self._extractor = message_features.MessageFeatureExtractor({
+            categoria: ROUTER_KEYWORDS[categoria] for categoria in FILE_SCORE_WEIGHTS
+        })
+        self._cache = OrderedDict()
+
+    def score(self, message: str, features: message_features.MessageFeatures = None) -> float:
+        # features: MessageFeatures already extracted for the message (with the FILE_SCORE_WEIGHTS categories),
+        # so the keyword scan is not repeated; extracted here only on a cache miss without them
+        if message in self._cache:
+            self._cache.move_to_end(message)
+            self.stats['hits'] += 1
+            return self._cache[message]
+
+        self.stats['misses'] += 1
+        valor = self._compute(message, features or self._extractor.extract(message))
+
+        self._cache[message] = valor
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self.stats['evictions'] += 1
+        return valor
+
+    def warm_up(self, mensagens: Iterable[str]) -> int:
+        antes = len(self._cache)
+        for mensagem in mensagens:
+            self.score(mensagem)
+        return len(self._cache) - antes
 
-    @lru_cache(maxsize=256)
-    def _calculate_file_score(self, message: str) -> float:
-        message_lower = message.lower()
+    def get_stats(self) -> Dict[str, Any]:
+        consultas = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'entries': len(self._cache),
+            'hit_rate': self.stats['hits'] / consultas if consultas else 0.0,
+        }
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _compute(self, message: str, features: message_features.MessageFeatures) -> float:
+        # Same text and accumulation order as the original per-keyword sums (patterns on the raw message,
+        # keywords on its lowercase form), so scores and threshold ties stay identical
         score = 0.0
-        
-        if self.file_extension_pattern.search(message):
+
+        if FILE_EXTENSION_PATTERN.search(message):
             score += 0.5
-        
-        score += sum(0.2 for keyword in FILE_KEYWORDS if keyword in message_lower)
-        score += sum(0.15 for keyword in ACTION_KEYWORDS if keyword in message_lower)
-        
-        if self.file_naming_pattern.search(message):
+
+        score += sum(FILE_SCORE_WEIGHTS['FILE_KEYWORDS'] for _ in range(features.count('FILE_KEYWORDS')))
+        score += sum(FILE_SCORE_WEIGHTS['ACTION_KEYWORDS'] for _ in range(features.count('ACTION_KEYWORDS')))
+
+        if FILE_NAMING_PATTERN.search(message):
             score += 0.2
-        
-        score -= sum(0.2 for word in CASUAL_WORDS if word in message_lower)
-        
+
+        score -= sum(FILE_SCORE_WEIGHTS['CASUAL_WORDS'] for _ in range(features.count('CASUAL_WORDS')))
+
         return max(min(score, 1.0), 0.0)
 
+
+FILE_SCORER = FileScorer()
+
+
+class IntentRouter:
+
+    def __init__(self, BoardsHandler, GeneralHandler, file_scorer: FileScorer = FILE_SCORER):
+        self.modo_analise_boards = BoardsHandler.modo_analise_boards
+        self.aprendizado_manual_ativo = GeneralHandler.aprendizado_manual_ativo
+        self.FeatureExtractor = message_features.MessageFeatureExtractor(ROUTER_KEYWORDS)
+        self.FileScorer = file_scorer
+
+        self._compile_regex_patterns()
+
+    def warm_up(self, mensagens: Iterable[str]) -> int:
+        return self.FileScorer.warm_up(mensagens)
+
+    def _calculate_file_score(self, message: str, features: message_features.MessageFeatures = None) -> float:
+        return self.FileScorer.score(message, features)
+
     def _compile_regex_patterns(self):
-        self.file_extension_pattern = re.compile(
-            REGEX_PATTERNS['file_extension'], 
-            re.IGNORECASE
-        )
-        self.file_naming_pattern = re.compile(REGEX_PATTERNS['file_naming'])
-        self.greeting_pattern = re.compile(
-            REGEX_PATTERNS['greeting'],
-            re.IGNORECASE
-        )
-
-    def _detect_intent(self, message: str, user_id: str) -> str:
-        message_lower = message.lower().strip()
-        
-        if any(cmd in message_lower for cmd in ADMIN_COMMANDS.keys()):
+        self.file_extension_pattern = FILE_EXTENSION_PATTERN
+        self.file_naming_pattern = FILE_NAMING_PATTERN
+        self.greeting_pattern = GREETING_PATTERN
+
+    def classify_batch(self, messages: Sequence[str], user_ids: Sequence[str]) -> List[str]:
+        # Deduplication, not batch matching: each distinct text is scanned and classified once (its features are
+        # reused by the file scorer), then only the per-user session state is applied per message. A batch without
+        # repeated texts costs the same as classifying message by message.
+        if len(messages) != len(user_ids):
+            raise ValueError("messages and user_ids must have the same length")
+
+        intents_por_texto = {}
+        for message in messages:
+            if message not in intents_por_texto:
+                intents_por_texto[message] = self._message_intent(message, self.FeatureExtractor.extract(message))
+
+        return [
+            self._apply_session_state(intents_por_texto[message], user_id)
+            for message, user_id in zip(messages, user_ids)
+        ]
+
+    def _detect_intent(self, message: str, user_id: str,
+                       features: message_features.MessageFeatures = None) -> str:
+        features = features or self.FeatureExtractor.extract(message)
+        return self._apply_session_state(self._message_intent(message, features), user_id)
+
+    def _message_intent(self, message: str, features: message_features.MessageFeatures) -> str:
+        # Intent from the text alone (no session state)
+        if features.has('ADMIN_COMMANDS') or features.has('CACHE_ADMIN_COMMANDS'):
             return "admin"
         
-        if any(cmd in message_lower for cmd in BOARDS_COMMANDS) or user_id in self.modo_analise_boards:
+        if features.has('BOARDS_COMMANDS'):
             return "boards"
         
-        if any(trigger in message_lower for trigger in LEARNING_TRIGGERS) or user_id in self.aprendizado_manual_ativo:
+        if features.has('LEARNING_TRIGGERS'):
             return "learning"
         
-        if any(pattern in message_lower for pattern in LIST_PATTERNS):
+        if features.has('LIST_PATTERNS'):
             return "file_list"
         
-        if len(message.split()) <= 6 and self.greeting_pattern.search(message):
+        if features.word_count <= 6 and self.greeting_pattern.search(message):
             return "greeting"
         
-        if self._calculate_file_score(message) > 0.7:
+        if self._calculate_file_score(message, features) > 0.7:
             return "file"
         
         return "general"
+
+    def _apply_session_state(self, intent: str, user_id: str) -> str:
+        # Users in boards analysis or manual learning keep that intent, unless the text is admin/boards
+        if intent in ("admin", "boards"):
+            return intent
+        
+        if user_id in self.modo_analise_boards:
+            return "boards"
+        
+        if user_id in self.aprendizado_manual_ativo:
+            return "learning"
+        
+        return intent
     
 
@@ -0,0 +1,55 @@
+# 1. Importando bibliotecas padrao
+import re
+from typing import Dict, Set, Iterable
+
+
+class KeywordMatcher:
+    """
+    Busca de varias listas de palavras-chave em uma unica passada sobre o texto.
+    Equivale a 'palavra in texto' para cada palavra, inclusive com palavras sobrepostas.
+    """
+
+    def __init__(self, categorias: Dict[str, Iterable[str]]) -> None:
+        """
+        Construtor do buscador. Compila todas as palavras em uma unica expressao regular.
+
+        args:
+            categorias: dict de nome da categoria -> palavras-chave da categoria
+
+        """
+
+        self.categorias_por_palavra = {}
+        for categoria, palavras in categorias.items():
+            for palavra in palavras:
+                self.categorias_por_palavra.setdefault(palavra, set()).add(categoria)
+
+        palavras = sorted((p for p in self.categorias_por_palavra if p), key=len, reverse=True)
+
+        # Em cada posicao a expressao captura a palavra mais longa; as demais que comecam ali sao prefixos dela
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, palavras)) + "))") if palavras else None
+        self._prefixos = {p: [q for q in palavras if p.startswith(q)] for p in palavras}
+        self._sempre = self.categorias_por_palavra.get("", set())
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def match(self, texto: str) -> Dict[str, Set[str]]:
+        """
+        Busca todas as palavras-chave no texto.
+
+        args:
+            texto: String onde as palavras sao buscadas
+
+        retorna dict de categoria -> palavras encontradas (categorias sem palavras encontradas ficam de fora)
+        """
+
+        encontrados = {categoria: {""} for categoria in self._sempre}
+        if self._pattern is None:
+            return encontrados
+
+        for mais_longa in set(self._pattern.findall(texto)):
+            for palavra in self._prefixos[mais_longa]:
+                for categoria in self.categorias_por_palavra[palavra]:
+                    encontrados.setdefault(categoria, set()).add(palavra)
+        return encontrados
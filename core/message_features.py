@@ -0,0 +1,95 @@
+# 1. Importando bibliotecas padrao
+from collections import Counter
+from typing import Dict, Set, Iterable
+
+# 5. Importando modulos locais
+from core import keyword_matcher
+
+
+class MessageFeatures:
+    """Caracteristicas de uma mensagem calculadas uma unica vez: texto normalizado e palavras-chave encontradas."""
+
+    def __init__(self, message: str, matches: Dict[str, Set[str]], pesos: Dict[str, Counter]) -> None:
+        """
+        Construtor das caracteristicas.
+
+        args:
+            message: String da mensagem original
+            matches: dict de categoria -> palavras-chave encontradas
+            pesos: dict de categoria -> Counter de ocorrencias de cada palavra na lista da categoria
+
+        """
+
+        self.message = message
+        self.lower = message.lower()
+        self.stripped = self.lower.strip()
+        self.word_count = len(message.split())
+        self.matches = matches
+
+        self._pesos = pesos
+
+    def has(self, categoria: str) -> bool:
+        """
+        Verifica se alguma palavra-chave da categoria esta na mensagem.
+
+        args:
+            categoria: String do nome da categoria
+
+        retorna bool (equivale a any(palavra in mensagem for palavra in lista))
+        """
+
+        return categoria in self.matches
+
+    def matched(self, categoria: str) -> Set[str]:
+        """
+        Obtem as palavras-chave da categoria encontradas na mensagem.
+
+        args:
+            categoria: String do nome da categoria
+
+        retorna set de palavras encontradas
+        """
+
+        return self.matches.get(categoria, set())
+
+    def count(self, categoria: str) -> int:
+        """
+        Conta as entradas da lista da categoria presentes na mensagem (repeticoes na lista contam de novo).
+
+        args:
+            categoria: String do nome da categoria
+
+        retorna int (equivale a sum(1 for palavra in lista if palavra in mensagem))
+        """
+
+        pesos = self._pesos.get(categoria, {})
+        return sum(pesos[palavra] for palavra in self.matched(categoria))
+
+
+class MessageFeatureExtractor:
+    """Extrator de MessageFeatures com um unico automato compilado para todas as listas de palavras-chave."""
+
+    def __init__(self, categorias: Dict[str, Iterable[str]]) -> None:
+        """
+        Construtor do extrator.
+
+        args:
+            categorias: dict de nome da categoria -> palavras-chave (minusculas) da categoria
+
+        """
+
+        categorias = {categoria: list(palavras) for categoria, palavras in categorias.items()}
+        self.matcher = keyword_matcher.KeywordMatcher(categorias)
+        self._pesos = {categoria: Counter(palavras) for categoria, palavras in categorias.items()}
+
+    def extract(self, message: str) -> MessageFeatures:
+        """
+        Calcula as caracteristicas de uma mensagem.
+
+        args:
+            message: String da mensagem original
+
+        retorna MessageFeatures da mensagem
+        """
+
+        return MessageFeatures(message, self.matcher.match(message.lower()), self._pesos)
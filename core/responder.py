@@ -1,6 +1,6 @@
 
 # 5. Importando modulos locais
-from core import intent_router
+from core import intent_router, message_features, tracing
 from utils import helpers
 from handlers import general_handler, boards_handler, file_handler
 
@@ -10,16 +10,23 @@ class Responder:
     def __init__(self, Helper: helpers.Helper, 
                  GeneralHandler: general_handler.GeneralHandler, 
                  BoardsHandler: boards_handler.BoardsHandler, 
-                 FileHandler: file_handler.FileHandler) -> None:
+                 FileHandler: file_handler.FileHandler, Tracer: tracing.Tracer = tracing.TRACER) -> None:
         
-        """Construtor do agente de respostas. Inicializando cada Handler e o interpretador."""
+        """Construtor do agente de respostas. Inicializando cada Handler, o interpretador e o rastreamento."""
 
-        self.IntentRouter = intent_router.IntentRouter(BoardsHandler)
+        self.IntentRouter = intent_router.IntentRouter(BoardsHandler, GeneralHandler)
+        self.FeatureExtractor = message_features.MessageFeatureExtractor({
+            **intent_router.ROUTER_KEYWORDS,
+            **general_handler.GENERAL_KEYWORDS,
+            **file_handler.FILE_HANDLER_KEYWORDS,
+            **boards_handler.BOARDS_KEYWORDS,
+        })
         
         self.Helper = Helper
         self.GeneralHandler = GeneralHandler
         self.BoardsHandler = BoardsHandler
         self.FileHandler = FileHandler
+        self.Tracer = Tracer
 
     ###################
     # Funcoes publicas
@@ -37,26 +44,52 @@ class Responder:
         retorna uma String de resposta gerada
         """
 
-        intent = self.IntentRouter._detect_intent(user_message,user_id)
+        with self.Tracer.trace():
+            with tracing.span("intent"):
+                features = self.FeatureExtractor.extract(user_message)
+                intent = self.IntentRouter._detect_intent(user_message, user_id, features)
+            tracing.set_intent(intent)
+
+            try:
+                with tracing.span("handler"):
+                    resposta = await self._dispatch(intent, user_id, user_message, nome_usuario, features)
+            except Exception as e:
+                resposta = self.Helper._handle_error_response(e, intent, user_id)
+
+            with tracing.span("history"):
+                return self.Helper._log_interaction(user_id, user_message, resposta)
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    async def _dispatch(self, intent: str, user_id: str, user_message: str, nome_usuario: str,
+                        features: message_features.MessageFeatures) -> str:
+        """
+        Encaminhando a mensagem ao Handler da intencao detectada.
+
+        args:
+            intent: String da intencao detectada
+            user_id: ID do usuario da mensagem
+            user_message: String de mensagem do usuario
+            nome_usuario: String de nome do usuario
+            features: MessageFeatures da mensagem
+
+        retorna uma String de resposta gerada
+        """
+
+        if intent == "admin":
+            return await self.GeneralHandler._handle_admin_commands(user_id, user_message)
+        elif intent == "boards":
+            return await self.BoardsHandler._handle_boards_analysis(user_id, user_message, features)
+        elif intent == "learning":
+            return self.GeneralHandler._handle_learning(user_id, user_message)
+        elif intent == "file_list":
+            quantidade = self.FileHandler._extract_quantity_listing(user_message)
+            return await self.FileHandler.list_files(user_id, user_message, features.lower, quantidade)
+        elif intent == "file":
+            return await self.FileHandler._handle_file_requests(user_id, user_message, features)
+        elif intent == "greeting":
+            return self.GeneralHandler._handle_greetings(user_message, features)
         
-        try:
-            if intent == "admin":
-                resposta = await self.GeneralHandler._handle_admin_commands(user_id, user_message)
-            elif intent == "boards":
-                resposta = await self.BoardsHandler._handle_boards_analysis(user_id, user_message)
-            elif intent == "learning":
-                resposta = self.GeneralHandler._handle_learning(user_id, user_message)
-            elif intent == "file_list":
-                quantidade = self.FileHandler._extract_quantity_listing(user_message)
-                resposta = await self.FileHandler.list_files(user_id, user_message, user_message.lower(), quantidade)
-            elif intent == "file":
-                resposta = await self.FileHandler._handle_file_requests(user_id, user_message)
-            elif intent == "greeting":
-                resposta = self.GeneralHandler._handle_greetings(user_message)
-            else:
-                resposta = await self.GeneralHandler._handle_general_questions(user_id, user_message, nome_usuario)
-            
-        except Exception as e:
-            resposta = self.Helper._handle_error_response(e, intent, user_id)
-            
-        return self.Helper._login_interaction(user_id, user_message, resposta)
\ No newline at end of file
+        return await self.GeneralHandler._handle_general_questions(user_id, user_message, nome_usuario, features)
@@ -0,0 +1,283 @@
+# 1. Importando bibliotecas padrao
+import contextvars
+import itertools
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Iterator
+
+# Parametros de rastreamento
+HISTOGRAM_SUB_BUCKET_BITS = 7
+HISTOGRAM_PERCENTILES = (50, 90, 99, 99.9)
+TRACE_HISTORY_SIZE = 100
+TRACE_ROOT_SPAN = "answer"
+
+_CURRENT_TRACE = contextvars.ContextVar("sofia_trace", default=None)
+_CURRENT_SPAN = contextvars.ContextVar("sofia_span", default=None)
+_TRACE_IDS = itertools.count(1)
+
+
+class LatencyHistogram:
+    """Histograma de latencias no estilo HDR: baldes log-lineares com erro relativo limitado e memoria constante."""
+
+    def __init__(self, sub_bucket_bits: int = HISTOGRAM_SUB_BUCKET_BITS) -> None:
+        """
+        Construtor do histograma.
+
+        args:
+            sub_bucket_bits: bits de precisao por faixa de potencia de 2 (7 -> erro relativo abaixo de 1%)
+
+        """
+
+        self.sub_bucket_bits = sub_bucket_bits
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = 0
+        self._buckets = {}
+
+    def record(self, valor_us: float) -> None:
+        """
+        Registra uma latencia.
+
+        args:
+            valor_us: latencia em microssegundos
+
+        """
+
+        valor = max(int(valor_us), 0)
+        expoente = max(valor.bit_length() - self.sub_bucket_bits, 0)
+        limite = (valor >> expoente) << expoente
+
+        self._buckets[limite] = self._buckets.get(limite, 0) + 1
+        self.count += 1
+        self.total_us += valor
+        self.min_us = valor if self.min_us is None else min(self.min_us, valor)
+        self.max_us = max(self.max_us, valor)
+
+    def percentile(self, percentil: float) -> int:
+        """
+        Calcula um percentil a partir dos baldes.
+
+        args:
+            percentil: float entre 0 e 100
+
+        retorna int do maior valor equivalente do balde do percentil (microssegundos)
+        """
+
+        if not self.count:
+            return 0
+
+        alvo = max(1, -(-self.count * percentil // 100))
+        acumulado = 0
+        for limite in sorted(self._buckets):
+            acumulado += self._buckets[limite]
+            if acumulado >= alvo:
+                largura = 1 << max(limite.bit_length() - self.sub_bucket_bits, 0)
+                return min(limite + largura - 1, self.max_us)
+        return self.max_us
+
+    def export(self) -> Dict[str, Any]:
+        """
+        Exporta o histograma em formato serializavel.
+
+        retorna dict com contagem, extremos, media, percentis e baldes {limite inferior (us): contagem}
+        """
+
+        return {
+            'count': self.count,
+            'min_us': self.min_us or 0,
+            'max_us': self.max_us,
+            'mean_us': round(self.total_us / self.count, 1) if self.count else 0.0,
+            **{f"p{p:g}_us": self.percentile(p) for p in HISTOGRAM_PERCENTILES},
+            'buckets': {str(limite): self._buckets[limite] for limite in sorted(self._buckets)},
+        }
+
+
+class Trace:
+    """Rastro de uma mensagem: spans registrados durante o processamento e a intencao detectada."""
+
+    def __init__(self, nome: str) -> None:
+        self.trace_id = next(_TRACE_IDS)
+        self.nome = nome
+        self.intent = None
+        self.inicio = time.perf_counter()
+        self.spans = []
+        self.finished = False
+
+    def add_span(self, nome: str, pai: Optional[str], inicio: float, duracao_us: float,
+                 atributos: Dict[str, Any]) -> None:
+        """Registrando um span concluido."""
+
+        self.spans.append({
+            'name': nome,
+            'parent': pai,
+            'start_ms': round((inicio - self.inicio) * 1000, 3),
+            'duration_us': round(duracao_us, 1),
+            **atributos,
+        })
+
+    def export(self) -> Dict[str, Any]:
+        """Exportando o rastro em formato serializavel."""
+
+        return {'trace_id': self.trace_id, 'intent': self.intent, 'spans': list(self.spans)}
+
+
+class Tracer:
+    """Agente de rastreamento: abre um rastro por mensagem e alimenta os histogramas de latencia por intencao e span."""
+
+    def __init__(self, history_size: int = TRACE_HISTORY_SIZE) -> None:
+        """
+        Construtor do agente de rastreamento.
+
+        args:
+            history_size: int de rastros recentes mantidos para exportacao
+
+        """
+
+        self.histograms = {}
+        self.recent = deque(maxlen=history_size)
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    @contextmanager
+    def trace(self, nome: str = TRACE_ROOT_SPAN) -> Iterator[Trace]:
+        """
+        Abre um rastro no contexto atual; ao sair, os spans alimentam os histogramas da intencao do rastro.
+
+        args:
+            nome: String do span raiz
+
+        retorna (via yield) o Trace aberto
+        """
+
+        rastro = Trace(nome)
+        token = _CURRENT_TRACE.set(rastro)
+        try:
+            with span(nome):
+                yield rastro
+        finally:
+            _CURRENT_TRACE.reset(token)
+            self._finish(rastro)
+
+    def histogram(self, intent: str, nome: str) -> LatencyHistogram:
+        """
+        Obtem (ou cria) o histograma de um span para uma intencao.
+
+        args:
+            intent: String da intencao
+            nome: String do span
+
+        retorna LatencyHistogram
+        """
+
+        por_span = self.histograms.setdefault(intent, {})
+        if nome not in por_span:
+            por_span[nome] = LatencyHistogram()
+        return por_span[nome]
+
+    def export(self) -> Dict[str, Any]:
+        """
+        Exporta os histogramas e os rastros recentes.
+
+        retorna dict serializavel em JSON {'intents': {intencao: {span: histograma}}, 'recent_traces': [...]}
+        """
+
+        return {
+            'intents': {
+                intent: {nome: histograma.export() for nome, histograma in sorted(por_span.items())}
+                for intent, por_span in sorted(self.histograms.items())
+            },
+            'recent_traces': [rastro.export() for rastro in self.recent],
+        }
+
+    def export_json(self, caminho: str) -> Dict[str, Any]:
+        """
+        Grava a exportacao em um arquivo JSON.
+
+        args:
+            caminho: String do arquivo de saida
+
+        retorna dict exportado
+        """
+
+        dados = self.export()
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+        return dados
+
+    def reset(self) -> None:
+        """Descarta histogramas e rastros recentes."""
+
+        self.histograms.clear()
+        self.recent.clear()
+
+    ###################
+    # Funcoes privadas
+    ###################
+
+    def _finish(self, rastro: Trace) -> None:
+        """Alimentando os histogramas com os spans de um rastro encerrado."""
+
+        rastro.finished = True
+        intent = rastro.intent or "unknown"
+        for registro in rastro.spans:
+            self.histogram(intent, registro['name']).record(registro['duration_us'])
+        self.recent.append(rastro)
+
+
+TRACER = Tracer()
+
+
+@contextmanager
+def span(nome: str, **atributos) -> Iterator[None]:
+    """
+    Mede um trecho dentro do rastro do contexto atual (sem custo quando nao ha rastro aberto ou quando o rastro
+    ja foi encerrado, como em tarefas que herdaram o contexto da requisicao e terminaram depois dela).
+
+    args:
+        nome: String do span (ex.: 'openai.completion')
+        atributos: valores extras gravados no span
+
+    """
+
+    rastro = _CURRENT_TRACE.get()
+    if rastro is None or rastro.finished:
+        yield
+        return
+
+    token = _CURRENT_SPAN.set(nome)
+    inicio = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        atributos['error'] = type(e).__name__
+        raise
+    finally:
+        _CURRENT_SPAN.reset(token)
+        if not rastro.finished:
+            rastro.add_span(nome, _CURRENT_SPAN.get(), inicio, (time.perf_counter() - inicio) * 1_000_000,
+                            atributos)
+
+
+def set_intent(intent: str) -> None:
+    """
+    Define a intencao do rastro do contexto atual (usada como chave dos histogramas).
+
+    args:
+        intent: String da intencao detectada
+
+    """
+
+    rastro = _CURRENT_TRACE.get()
+    if rastro is not None:
+        rastro.intent = intent
+
+
+def current_trace() -> Optional[Trace]:
+    """Retorna o Trace do contexto atual (ou None)."""
+
+    return _CURRENT_TRACE.get()
@@ -1,16 +1,20 @@
 # 1. Importando bibliotecas padrao
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+import asyncio
+import math
+import re
+import time
+from contextlib import nullcontext
+from datetime import date, timedelta
+from typing import Dict, Any, Optional, List, Iterator, Set
 
 # 2. Importando blibliotecas de terceiros
+import numpy as np
 import pandas as pd
 
 # 3. Importando aplicacoes locais
-from src.services.module.boards.azure_boards_service import AzureBoardsService
 from src.services.module.boards.processing import (
     cliente_com_mais_atividades,
     cliente_com_mais_atividades_sonar_labs,
-    processar_work_items_df,
     obter_responsavel_com_mais_tarefas,
     formatar_lista_tarefas,
     tarefas_em_andamento,
@@ -34,17 +38,77 @@ from src.services.constants import (
 )
 
 # 5. Importando modulos locais
-from core import cache
+from core import (
+    cache, boards_sync, boards_index, boards_dates, boards_history, keyword_matcher, message_features, tracing
+)
+
+# Parametros da hierarquia de User Stories
+HIERARCHY_PAGE_SIZE = 50
+
+# Artefato da entrada de cache com os itens brutos do Board (usados no primeiro enriquecimento com epicos)
+WORK_ITEMS_ARTIFACT = "itens_brutos"
+
+# Padroes das consultas por periodo
+DUE_THIS_WEEK_KEYWORDS = ["vencem esta semana", "vence esta semana", "vencem nesta semana", "prazo esta semana",
+                          "prazo nesta semana", "prazos da semana", "entregas da semana"]
+RECENT_CHANGES_PATTERN = re.compile(
+    r"(?:alterad|modificad|atualizad|mudad|mudaram|mudou)\w*.*?[uú]ltim[oa]s?\s+(\d+)\s+dias?"
+)
+RECENT_DAYS_PATTERN = re.compile(r"[uú]ltim[oa]s?\s+\d+\s+dias?")
+
+# Padroes das consultas de historico
+BURNDOWN_KEYWORDS = ["burndown", "burn down", "burn-down", "abertos por dia"]
+THROUGHPUT_KEYWORDS = ["throughput", "vazão", "vazao", "concluídos por dia", "entregas por dia"]
+CHANGES_SINCE_YESTERDAY_KEYWORDS = ["desde ontem", "mudou ontem", "mudanças de ontem", "mudou de ontem"]
+HISTORY_DEFAULT_DAYS = 14
+HISTORY_MAX_CHANGES_LISTED = 20
+
+# Grupos de palavras-chave de periodo, ignorados na busca de colaborador ("dias" tambem e sobrenome)
+PERIOD_KEYWORD_GROUPS = ("DUE_THIS_WEEK_KEYWORDS", "OVERDUE_KEYWORDS", "BURNDOWN_KEYWORDS", "THROUGHPUT_KEYWORDS",
+                         "CHANGES_SINCE_YESTERDAY_KEYWORDS")
+
+# Palavras-chave das perguntas de AzureBoards, buscadas em uma unica passada
+BOARDS_KEYWORDS = {
+    'BOARDS_COMMANDS': BOARDS_COMMANDS,
+    'PROGRESS_KEYWORDS': PROGRESS_KEYWORDS,
+    'TODO_KEYWORDS': TODO_KEYWORDS,
+    'COMPLETED_KEYWORDS': COMPLETED_KEYWORDS,
+    'OVERVIEW_KEYWORDS': OVERVIEW_KEYWORDS,
+    'OVERDUE_KEYWORDS': OVERDUE_KEYWORDS,
+    'HIERARCHY_KEYWORDS': HIERARCHY_KEYWORDS,
+    'CLIENT_KEYWORDS': CLIENT_KEYWORDS,
+    'ACTIVITY_KEYWORDS': ACTIVITY_KEYWORDS,
+    'TASK_COUNT_KEYWORDS': TASK_COUNT_KEYWORDS,
+    'COLLABORATOR_REFERENCES': COLLABORATOR_REFERENCES,
+    'DUE_THIS_WEEK_KEYWORDS': DUE_THIS_WEEK_KEYWORDS,
+    'BURNDOWN_KEYWORDS': BURNDOWN_KEYWORDS,
+    'THROUGHPUT_KEYWORDS': THROUGHPUT_KEYWORDS,
+    'CHANGES_SINCE_YESTERDAY_KEYWORDS': CHANGES_SINCE_YESTERDAY_KEYWORDS,
+    'MAPA_TIPOS_ITENS': MAPA_TIPOS_ITENS.keys(),
+    'QUANTIDADE_TIPOS_ITENS': [f"{prefixo} {chave}" for chave in MAPA_TIPOS_ITENS for prefixo in ("quantos", "quantas")],
+}
+BOARDS_KEYWORD_MATCHER = keyword_matcher.KeywordMatcher(BOARDS_KEYWORDS)
+
+# Parametros da memorizacao de respostas
+ANSWER_MEMO_MAX_ENTRIES = 256
+COLLABORATOR_STATE_TITLES = {
+    "em andamento": "Tarefas em andamento",
+    "a fazer": "Tarefas a fazer",
+    "concluído": "Tarefas concluídas",
+}
 
 class BoardsHandler:
     """Agente Handler de AzureBoards."""
 
-    def __init__(self, CacheHandler: cache.CacheAgent) -> None:
+    def __init__(self, CacheHandler: cache.CacheAgent, SyncAgent: Optional[boards_sync.BoardsSyncAgent] = None,
+                 History: Optional[boards_history.BoardsHistory] = None) -> None:
         """
         Construtor do agente. Inicializando variaveis de AzureBoards e carregando cache.
         
         args:
             CacheHandler: Agente de cache ativo.
+            SyncAgent: Agente de sincronizacao de AzureBoards (padrao incremental com o servico do Azure).
+            History: Historico diario dos Boards (padrao somente em memoria).
 
         Constroi o Handler.
         """
@@ -54,12 +118,16 @@ class BoardsHandler:
         self.ultimo_board_por_usuario = {}
 
         self.CacheHandler = CacheHandler
+        self.SyncAgent = SyncAgent or boards_sync.BoardsSyncAgent()
+        self.History = History if History is not None else boards_history.BoardsHistory()
+        self.CacheHandler.register_project_hooks(self._warm_project, self._flush_project)
 
     ###################
     # Funcoes publicas
     ###################
 
-    async def answer_with_boards(self, pergunta: str, user_id: str = "global", context=None) -> str:
+    async def answer_with_boards(self, pergunta: str, user_id: str = "global", context=None,
+                                 features: Optional[message_features.MessageFeatures] = None) -> str:
         """
         Gerando resposta com AzureBoards.
         
@@ -67,6 +135,7 @@ class BoardsHandler:
             pergunta: String da pergunta a ser respondida com AzureBoards
             user_id: ID do usuario.
             context: None por padrao (funcao vai ser extendida?)
+            features: MessageFeatures da pergunta (palavras-chave buscadas na hora se None)
 
         retorna uma String de resposta com AzureBoards ou erro.
         """
@@ -81,32 +150,72 @@ class BoardsHandler:
             return BOARDS_SELECTION_MESSAGE
         
         self.ultimo_board_por_usuario[user_id] = projeto
+        self.CacheHandler.record_project_access(projeto)
         nome_amigavel = "Operações" if projeto == "Sonar" else projeto
 
-        df = await self._get_boards_data_cached(projeto, pergunta_lower)
-        if df is None:
+        base_df = await self._get_boards_data_cached(projeto)
+        if base_df is None:
             return f"Erro ao consultar o Azure Boards de '{nome_amigavel}'"
         
-        return self._process_boards_query(user_id, pergunta_lower, df, nome_amigavel)
+        cache_key = self._boards_cache_key(projeto)
+        df, variante = base_df, ""
+        if self._wants_epics(pergunta_lower):
+            df, variante = await self._get_epic_frame(projeto, cache_key, base_df), "_epicos"
+        
+        # Artefatos derivados ficam presos a versao da entrada base (descartados quando ela e substituida)
+        def derivar(nome, builder):
+            return self.CacheHandler.get_derived(cache_key, base_df, nome + variante, lambda _: builder(df))
+        
+        index = derivar("boards_index", boards_index.BoardsIndex)
+        collaborators = derivar("collaborator_index", boards_index.CollaboratorIndex)
+        dates = derivar("boards_dates", lambda d: boards_dates.BoardsDates(d, abertos=self._open_mask(d)))
+        answers = derivar("answers", lambda _: {})
+        
+        termos = features.matches if features is not None else None
+        return self._process_boards_query(user_id, pergunta_lower, df, nome_amigavel, index, collaborators, answers,
+                                          dates, termos, projeto)
+
+    def iter_user_story_hierarchy(self, df: pd.DataFrame, index: Optional[boards_index.BoardsIndex] = None,
+                                  tamanho_lote: int = HIERARCHY_PAGE_SIZE) -> Iterator[str]:
+        """
+        Gera a hierarquia de User Stories em partes, para respostas enviadas aos poucos em Boards grandes.
+        
+        args:
+            df: DataFrame com itens AzureBoards
+            index: BoardsIndex do DataFrame (construido na hora se None)
+            tamanho_lote: int de User Stories por parte
+
+        retorna um gerador de Strings, uma por lote de User Stories
+        """
+
+        blocos = self._render_user_story_blocks(df, index)
+        for inicio in range(0, len(blocos), tamanho_lote):
+            yield "\n".join(blocos.iloc[inicio:inicio + tamanho_lote])
 
     ###################
     # Funcoes privadas
     ###################
 
-    async def _handle_boards_analysis(self, user_id: str, user_message: str) -> str:
+    async def _handle_boards_analysis(self, user_id: str, user_message: str,
+                                      features: Optional[message_features.MessageFeatures] = None) -> str:
         """
         Analizando AzureBoards.
         
         args:
             user_id: ID de usuario
             user_message: Mensagem que sera tratada com AzureBoards
+            features: MessageFeatures da mensagem (palavras-chave buscadas na hora se None)
 
         retorna uma String de resposta.
         """
 
         message_lower = user_message.lower()
+        comando_boards = (
+            features.has('BOARDS_COMMANDS') if features is not None
+            else any(comando in message_lower for comando in BOARDS_COMMANDS)
+        )
         
-        if any(comando in message_lower for comando in BOARDS_COMMANDS):
+        if comando_boards:
             self.modo_analise_boards[user_id] = True
             return BOARDS_SELECTION_MESSAGE
         
@@ -115,7 +224,7 @@ class BoardsHandler:
                 del self.modo_analise_boards[user_id]
             return BOARDS_EXIT_MESSAGE
         
-        return await self.answer_with_boards(user_message, user_id)
+        return await self.answer_with_boards(user_message, user_id, features=features)
     
     def _get_boards_help_message(self) -> str:
         """
@@ -142,88 +251,214 @@ class BoardsHandler:
                 return project
         return self.ultimo_board_por_usuario.get(user_id)
 
-    async def _get_boards_data_cached(self, projeto: str, pergunta_lower: str) -> Optional[pd.DataFrame]:
+    async def _get_boards_data_cached(self, projeto: str, force_refresh: bool = False) -> Optional[pd.DataFrame]:
         """
-        Buscando cache de dados AzureBoards.
+        Buscando cache de dados AzureBoards (DataFrame base, sem colunas de epicos).
         
         args:
             projeto: String de identificacao do projeto
-            pergunta_lower: String da pergunta em minusculo
+            force_refresh: se True, sincroniza o Board mesmo com dados validos em cache
 
         retorna um DataFrame pandas com os dados cache ou erro.
         """
 
-        buscar_epicos = any(termo in pergunta_lower for termo in CLIENT_SEARCH_KEYWORDS)
+        cache_key = self._boards_cache_key(projeto)
         
-        cache_key = f"{projeto}_{datetime.now().strftime('%Y%m%d_%H_%M')[:12]}"
-        if buscar_epicos:
-            cache_key += "_epicos"
-        
-        if cache_key in self.CacheHandler.boards_cache:
-            cached_data = self.CacheHandler.boards_cache[cache_key]
-            if (datetime.now() - cached_data['timestamp']).seconds < self.CacheHandler.cache_duration:
-                return cached_data['dataframe']
+        # A carga roda fora do contexto da requisicao (single-flight); o span mede a espera pela carga no rastro
+        # da requisicao, so quando ela precisa aguardar (miss ou refresh forcado, nao obsoleto servido na hora)
+        entry = self.CacheHandler.boards_cache.get_entry(cache_key)
+        aguarda_carga = force_refresh or entry is None or (
+            entry['value'] is cache.NEGATIVE_RESULT and entry['expires_at'] <= time.monotonic()
+        )
         
         try:
-            azure_service = AzureBoardsService(projeto)
-            work_items = azure_service.buscar_work_items(batch_size=100)
-            
-            if not work_items:
-                return None
-            
-            df = await processar_work_items_df(work_items, projeto=projeto, buscar_epicos=buscar_epicos)
-            
-            self.CacheHandler.boards_cache[cache_key] = {
-                'dataframe': df,
-                'timestamp': datetime.now()
-            }
-            
-            return df
-            
+            with tracing.span("azure_boards.load", projeto=projeto) if aguarda_carga else nullcontext():
+                return await self.CacheHandler.get_or_load(
+                    cache_key, lambda: self._fetch_boards_data(projeto, cache_key),
+                    stale_while_revalidate=True, force_refresh=force_refresh
+                )
         except Exception as e:
             print(f"❌ Erro ao buscar boards: {e}")
             return None
 
-    def _process_boards_query(self, user_id: str, pergunta_lower: str, df: pd.DataFrame, nome_amigavel: str) -> str:
+    async def _fetch_boards_data(self, projeto: str, cache_key: str) -> Optional[pd.DataFrame]:
+        """
+        Busca e processa os itens de um Board no AzureBoards, de forma incremental quando ja ha dados em cache.
+        
+        args:
+            projeto: String de identificacao do projeto
+            cache_key: String da chave de cache do Board
+
+        retorna um DataFrame pandas com os itens (com os itens brutos como artefato da entrada, se houver) ou None.
+        """
+
+        entry = self.CacheHandler.boards_cache.get_entry(cache_key)
+        cached_df = entry['value'] if entry is not None and isinstance(entry['value'], pd.DataFrame) else None
+        itens = self.CacheHandler.get_attached(cache_key, cached_df, WORK_ITEMS_ARTIFACT)
+        
+        with tracing.span("azure_boards.sync", projeto=projeto):
+            df, itens = await self.SyncAgent.sync_with_items(projeto, cached_df, itens)
+        if df is not None and df is not cached_df:
+            dia = self.History.record(projeto, df, abertos=self._open_mask(df))
+            if dia is not None:
+                await asyncio.to_thread(self.History.persist, projeto, dia)
+        if df is None or itens is None:
+            return df
+        return cache.WithDerived(df, {WORK_ITEMS_ARTIFACT: itens})
+
+    async def _get_epic_frame(self, projeto: str, cache_key: str, base_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Obtem o DataFrame enriquecido com epicos, construido uma vez por versao da entrada base.
+        
+        args:
+            projeto: String de identificacao do projeto
+            cache_key: String da chave de cache do Board
+            base_df: DataFrame base em cache
+
+        retorna o DataFrame com as colunas de epicos (ou o base se o enriquecimento falhar)
+        """
+
+        try:
+            with tracing.span("azure_boards.enrich_epics", projeto=projeto):
+                enriquecido = await self.CacheHandler.get_derived_async(
+                    cache_key, base_df, "epicos", lambda base: self.SyncAgent.enrich_epics(
+                        projeto, base, self.CacheHandler.get_attached(cache_key, base, WORK_ITEMS_ARTIFACT)
+                    )
+                )
+        except Exception as e:
+            print(f"❌ Erro ao buscar épicos: {e}")
+            return base_df
+        return enriquecido if enriquecido is not None else base_df
+
+    async def _warm_project(self, projeto: str, refresh: bool = False) -> bool:
+        """
+        Carrega os dados de um Board no cache.
+        
+        args:
+            projeto: String de identificacao do projeto
+            refresh: se True, sincroniza o Board mesmo com dados validos em cache
+
+        retorna bool (True se os dados foram carregados)
+        """
+
+        return await self._get_boards_data_cached(projeto, force_refresh=refresh) is not None
+
+    def _flush_project(self, projeto: str) -> int:
+        """
+        Remove os dados de um Board do cache e reinicia sua sincronizacao.
+        
+        args:
+            projeto: String de identificacao do projeto
+
+        retorna int de entradas removidas
+        """
+
+        self.SyncAgent.reset(projeto)
+        return int(self.CacheHandler.invalidate(self._boards_cache_key(projeto)))
+
+    def _extract_page(self, pergunta_lower: str) -> int:
+        """
+        Extrai o numero de pagina pedido na pergunta.
+        
+        args:
+            pergunta_lower: String da pergunta em minusculo
+
+        retorna int da pagina (1 se nao informada)
+        """
+
+        match = re.search(r"p[aá]gina\s+(\d+)", pergunta_lower)
+        return int(match.group(1)) if match else 1
+
+    def _wants_epics(self, pergunta_lower: str) -> bool:
+        """
+        Identifica se a pergunta precisa dos dados de epicos/clientes.
+        
+        args:
+            pergunta_lower: String da pergunta em minusculo
+
+        retorna bool (True se os epicos devem ser incluidos)
+        """
+
+        return any(termo in pergunta_lower for termo in CLIENT_SEARCH_KEYWORDS)
+
+    def _boards_cache_key(self, projeto: str) -> str:
+        """
+        Monta a chave de cache de um Board (os epicos sao um artefato derivado da mesma entrada).
+        
+        args:
+            projeto: String de identificacao do projeto
+
+        retorna String da chave de cache
+        """
+
+        return f"boards_{projeto}"
+
+    def _process_boards_query(self, user_id: str, pergunta_lower: str, df: pd.DataFrame, nome_amigavel: str,
+                              index: Optional[boards_index.BoardsIndex] = None,
+                              collaborators: Optional[boards_index.CollaboratorIndex] = None,
+                              answers: Optional[Dict[tuple, str]] = None,
+                              dates: Optional[boards_dates.BoardsDates] = None,
+                              termos: Optional[Dict[str, Set[str]]] = None,
+                              projeto: Optional[str] = None) -> str:
         """
         Processando a busca de AzureBoards. Separa a busca em classes de cliente, colaborador ou geral.
+        A pergunta e resolvida em uma consulta (tipo + parametros) e a resposta renderizada e memorizada por consulta.
         
         args:
             user_id: ID do usuario
             pergunta_lower: String da pergunta em minusculo
             df: Dataframe contendo itens AzureBoards
             nome_amigavel: identificador do projeto a ser pesquisado
+            index: BoardsIndex do DataFrame (construido na hora se None)
+            collaborators: CollaboratorIndex do DataFrame (construido na hora se None)
+            answers: dict de respostas memorizadas da versao do DataFrame (sem memorizacao se None)
+            dates: BoardsDates do DataFrame (construido na hora se None)
+            termos: palavras-chave encontradas na pergunta (buscadas na hora se None)
+            projeto: String de identificacao do projeto, usada no historico (padrao nome_amigavel)
 
         retorna String formatada de resposta a pesquisa
         """
         
-        if self._is_client_activity_query(pergunta_lower):
-            if "sonar labs" in nome_amigavel.lower():
-                return cliente_com_mais_atividades_sonar_labs(df)
+        if termos is None:
+            termos = BOARDS_KEYWORD_MATCHER.match(pergunta_lower)
+        
+        if self._is_client_activity_query(pergunta_lower, termos):
+            consulta = ("cliente",)
+        else:
+            nome_colaborador = self._detect_collaborator_in_query(pergunta_lower, user_id, df, collaborators, termos)
+            if nome_colaborador:
+                consulta = self._resolve_collaborator_query(termos, nome_colaborador)
             else:
-                return cliente_com_mais_atividades(df, projeto=nome_amigavel)
+                consulta = self._resolve_general_query(pergunta_lower, termos)
         
-        nome_colaborador = self._detect_collaborator_in_query(pergunta_lower, user_id, df)
+        if answers is None:
+            return self._render_boards_query(consulta, df, nome_amigavel, index, dates, projeto)
         
-        if nome_colaborador:
-            return self._process_collaborator_specific_query(pergunta_lower, df, nome_colaborador)
-        else:
-            return self._process_general_boards_query(pergunta_lower, df, nome_amigavel)
+        chave = (nome_amigavel, date.today().isoformat()) + consulta
+        if chave not in answers:
+            if len(answers) >= ANSWER_MEMO_MAX_ENTRIES:
+                answers.pop(next(iter(answers)))
+            answers[chave] = self._render_boards_query(consulta, df, nome_amigavel, index, dates, projeto)
+        return answers[chave]
         
-    def _is_client_activity_query(self, pergunta_lower: str) -> bool:
+    def _is_client_activity_query(self, pergunta_lower: str, termos: Optional[Dict[str, Set[str]]] = None) -> bool:
         """
         Identifica se a pergunta pede informacoes de atividade de cliente.
         
         args:
             pergunta_lower: String da pergunta em minusculo.
+            termos: palavras-chave encontradas na pergunta (buscadas na hora se None)
 
         retorna um booleano (True - se requer as informacoes do cliente).
         """
 
-        return (any(word in pergunta_lower for word in CLIENT_KEYWORDS) and
-                any(word in pergunta_lower for word in ACTIVITY_KEYWORDS))
+        if termos is None:
+            termos = BOARDS_KEYWORD_MATCHER.match(pergunta_lower)
+        return 'CLIENT_KEYWORDS' in termos and 'ACTIVITY_KEYWORDS' in termos
 
-    def _detect_collaborator_in_query(self, pergunta_lower: str, user_id: str, df: pd.DataFrame) -> Optional[str]:
+    def _detect_collaborator_in_query(self, pergunta_lower: str, user_id: str, df: pd.DataFrame,
+                                      collaborators: Optional[boards_index.CollaboratorIndex] = None,
+                                      termos: Optional[Dict[str, Set[str]]] = None) -> Optional[str]:
         """
         Identifica se um colaborador esta sendo mencionado na pergunta.
 
@@ -231,117 +466,332 @@ class BoardsHandler:
             pergunta_lower: String da pergunta em minusculo
             user_id: ID do usuario perguntando
             df: DataFrame com itens AzureBoards e coluna 'responsavel'
+            collaborators: CollaboratorIndex do DataFrame (construido na hora se None)
+            termos: palavras-chave encontradas na pergunta (buscadas na hora se None)
 
         retorna o nome do colaborador ou None.
         """
 
-        if any(termo in pergunta_lower for termo in COLLABORATOR_REFERENCES):
+        if termos is None:
+            termos = BOARDS_KEYWORD_MATCHER.match(pergunta_lower)
+        
+        if 'COLLABORATOR_REFERENCES' in termos:
             return self.ultimo_colaborador_consultado.get(user_id)
         
-        tokens_pergunta = set(pergunta_lower.split())
-        for responsavel in df['responsavel'].dropna().unique():
-            partes_nome = set(responsavel.lower().split())
-            if tokens_pergunta & partes_nome:
-                self.ultimo_colaborador_consultado[user_id] = responsavel
-                return responsavel
+        if collaborators is None:
+            collaborators = boards_index.CollaboratorIndex(df)
         
-        return None
+        responsavel = collaborators.match(self._strip_period_terms(pergunta_lower, termos))
+        if responsavel:
+            self.ultimo_colaborador_consultado[user_id] = responsavel
+        return responsavel
 
-    def _process_collaborator_specific_query(self, pergunta_lower: str, df: pd.DataFrame, nome_colaborador: str) -> str:
+    def _strip_period_terms(self, pergunta_lower: str, termos: Dict[str, Set[str]]) -> str:
         """
-        Processa perguntas sobre colaborador especifico.
-        
+        Remove da pergunta os termos de periodo (prazo, atraso, historico e "ultimos N dias"), que podem coincidir
+        com sobrenomes ("dias") e nao devem ser lidos como colaborador.
+
         args:
             pergunta_lower: String da pergunta em minusculo
-            df: DataFrame com informacoes AzureBoards dos colaboradores
-            nome_colaborador: String com nome do colaborador a ser pesquisado
+            termos: palavras-chave encontradas na pergunta
+
+        retorna String da pergunta sem os termos de periodo
+        """
+
+        texto = RECENT_DAYS_PATTERN.sub(" ", pergunta_lower)
+        for grupo in PERIOD_KEYWORD_GROUPS:
+            for termo in termos.get(grupo, ()):
+                texto = texto.replace(termo, " ")
+        return texto
 
-        retorna uma String formatada com as informacoes do colaborador
+    def _open_mask(self, df: pd.DataFrame) -> np.ndarray:
         """
+        Marca os itens abertos segundo as mesmas funcoes de processamento usadas nas respostas (a fazer e em andamento).
+
+        args:
+            df: DataFrame com itens AzureBoards
+
+        retorna array bool alinhado as linhas do DataFrame
+        """
+
+        abertos = tarefas_a_fazer(df).index.union(tarefas_em_andamento(df).index)
+        return df.index.isin(abertos)
+
+    def _resolve_collaborator_query(self, termos: Dict[str, Set[str]], nome_colaborador: str) -> tuple:
+        """
+        Resolve uma pergunta sobre colaborador especifico.
         
-        if any(t in pergunta_lower for t in PROGRESS_KEYWORDS):
-            tarefas = extrair_tarefas_por_colaborador_e_estado(df, nome_colaborador, "em andamento")
-            return formatar_lista_tarefas(tarefas, f"Tarefas em andamento de {nome_colaborador}")
-        elif any(t in pergunta_lower for t in TODO_KEYWORDS):
-            tarefas = extrair_tarefas_por_colaborador_e_estado(df, nome_colaborador, "a fazer")
-            return formatar_lista_tarefas(tarefas, f"Tarefas a fazer de {nome_colaborador}")
-        elif any(t in pergunta_lower for t in COMPLETED_KEYWORDS):
-            tarefas = extrair_tarefas_por_colaborador_e_estado(df, nome_colaborador, "concluído")
-            return formatar_lista_tarefas(tarefas, f"Tarefas concluídas de {nome_colaborador}")
-        else:
-            tarefas = extrair_tarefas_por_colaborador(df, nome_colaborador)
-            return formatar_lista_tarefas(tarefas, f"Tarefas de {nome_colaborador}")
+        args:
+            termos: palavras-chave encontradas na pergunta
+            nome_colaborador: String com nome do colaborador a ser pesquisado
 
-    def _process_general_boards_query(self, pergunta_lower: str, df: pd.DataFrame, nome_amigavel: str) -> str:
+        retorna tuple da consulta ("colaborador", nome, estado ou None)
         """
-        Processa uma pergunta geral sobre o AzureBoard.
+        
+        if 'PROGRESS_KEYWORDS' in termos:
+            return ("colaborador", nome_colaborador, "em andamento")
+        elif 'TODO_KEYWORDS' in termos:
+            return ("colaborador", nome_colaborador, "a fazer")
+        elif 'COMPLETED_KEYWORDS' in termos:
+            return ("colaborador", nome_colaborador, "concluído")
+        return ("colaborador", nome_colaborador, None)
+
+    def _resolve_general_query(self, pergunta_lower: str, termos: Dict[str, Set[str]]) -> tuple:
+        """
+        Resolve uma pergunta geral sobre o AzureBoard. A ordem das verificacoes define a precedencia.
         
         args:
             pergunta_lower: String da pergunta em minusculo
-            df: DataFrame do Board
-            nome_amigavel: idenficador do Board ou projeto
+            termos: palavras-chave encontradas na pergunta
 
-        retorna uma String com as informacoes pedidas
+        retorna tuple da consulta (tipo + parametros)
         """
 
+        quantidades = termos.get('QUANTIDADE_TIPOS_ITENS', set())
         for chave, tipo in MAPA_TIPOS_ITENS.items():
-            if f"quantos {chave}" in pergunta_lower or f"quantas {chave}" in pergunta_lower:
-                total = len(df[df["tipo"].str.lower() == tipo])
-                return f"🔢 Existem **{total}** item(ns) do tipo **{tipo.title()}** no board {nome_amigavel}."
+            if f"quantos {chave}" in quantidades or f"quantas {chave}" in quantidades:
+                return ("quantidade_tipo", tipo)
     
-        for chave, tipo in MAPA_TIPOS_ITENS.items():
-            if chave in pergunta_lower:
-                tarefas_tipo = df[df["tipo"].str.lower() == tipo]
-                return formatar_lista_tarefas(tarefas_tipo, f"{tipo.title()}s do board {nome_amigavel}")
+        if 'BURNDOWN_KEYWORDS' in termos:
+            return ("burndown", HISTORY_DEFAULT_DAYS)
+        elif 'THROUGHPUT_KEYWORDS' in termos:
+            return ("throughput", HISTORY_DEFAULT_DAYS)
+        elif 'CHANGES_SINCE_YESTERDAY_KEYWORDS' in termos:
+            return ("mudancas",)
     
-        if any(p in pergunta_lower for p in OVERVIEW_KEYWORDS):
-            return formatar_visao_geral(df)
+        if 'DUE_THIS_WEEK_KEYWORDS' in termos:
+            return ("prazo_semana",)
+        
+        alteracoes = RECENT_CHANGES_PATTERN.search(pergunta_lower)
+        if alteracoes:
+            return ("alterados", int(alteracoes.group(1)))
     
-        elif any(t in pergunta_lower for t in TODO_KEYWORDS):
-            tarefas = tarefas_a_fazer(df)
-            return formatar_lista_tarefas(tarefas, f"Tarefas a fazer do board {nome_amigavel}")
+        tipos = termos.get('MAPA_TIPOS_ITENS', set())
+        for chave, tipo in MAPA_TIPOS_ITENS.items():
+            if chave in tipos:
+                return ("lista_tipo", tipo)
     
-        elif any(t in pergunta_lower for t in PROGRESS_KEYWORDS):
-            tarefas = tarefas_em_andamento(df)
-            return formatar_lista_tarefas(tarefas, f"Tarefas em andamento do board {nome_amigavel}")
+        if 'OVERVIEW_KEYWORDS' in termos:
+            return ("visao_geral",)
+        elif 'TODO_KEYWORDS' in termos:
+            return ("a_fazer",)
+        elif 'PROGRESS_KEYWORDS' in termos:
+            return ("em_andamento",)
+        elif 'OVERDUE_KEYWORDS' in termos:
+            return ("atrasadas",)
+        elif 'TASK_COUNT_KEYWORDS' in termos:
+            return ("mais_tarefas",)
+        elif 'HIERARCHY_KEYWORDS' in termos:
+            return ("hierarquia", self._extract_page(pergunta_lower))
     
-        elif any(t in pergunta_lower for t in OVERDUE_KEYWORDS):
-            tarefas = tarefas_em_atraso(df)
+        return ("visao_geral",)
+
+    def _render_boards_query(self, consulta: tuple, df: pd.DataFrame, nome_amigavel: str,
+                             index: Optional[boards_index.BoardsIndex] = None,
+                             dates: Optional[boards_dates.BoardsDates] = None,
+                             projeto: Optional[str] = None) -> str:
+        """
+        Renderiza a resposta de uma consulta resolvida.
+        
+        args:
+            consulta: tuple da consulta (tipo + parametros)
+            df: DataFrame do Board
+            nome_amigavel: idenficador do Board ou projeto
+            index: BoardsIndex do DataFrame (construido na hora se None)
+            dates: BoardsDates do DataFrame (construido na hora se None)
+            projeto: String de identificacao do projeto, usada no historico (padrao nome_amigavel)
+
+        retorna uma String com as informacoes pedidas
+        """
+
+        if index is None:
+            index = boards_index.BoardsIndex(df)
+        if dates is None and consulta[0] in ("atrasadas", "prazo_semana", "alterados"):
+            dates = boards_dates.BoardsDates(df, abertos=self._open_mask(df))
+
+        tipo_consulta, parametros = consulta[0], consulta[1:]
+
+        if tipo_consulta == "cliente":
+            if "sonar labs" in nome_amigavel.lower():
+                return cliente_com_mais_atividades_sonar_labs(df)
+            return cliente_com_mais_atividades(df, projeto=nome_amigavel)
+
+        if tipo_consulta == "colaborador":
+            nome_colaborador, estado = parametros
+            df_colaborador = index.rows(df, 'responsavel', nome_colaborador.lower())
+            if estado is None:
+                tarefas = extrair_tarefas_por_colaborador(df_colaborador, nome_colaborador)
+                return formatar_lista_tarefas(tarefas, f"Tarefas de {nome_colaborador}")
+            tarefas = extrair_tarefas_por_colaborador_e_estado(df_colaborador, nome_colaborador, estado)
+            return formatar_lista_tarefas(tarefas, f"{COLLABORATOR_STATE_TITLES[estado]} de {nome_colaborador}")
+
+        if tipo_consulta == "quantidade_tipo":
+            tipo = parametros[0]
+            total = index.count('tipo', tipo)
+            return f"🔢 Existem **{total}** item(ns) do tipo **{tipo.title()}** no board {nome_amigavel}."
+
+        if tipo_consulta == "lista_tipo":
+            tipo = parametros[0]
+            return formatar_lista_tarefas(index.rows(df, 'tipo', tipo), f"{tipo.title()}s do board {nome_amigavel}")
+
+        if tipo_consulta == "a_fazer":
+            return formatar_lista_tarefas(tarefas_a_fazer(df), f"Tarefas a fazer do board {nome_amigavel}")
+
+        if tipo_consulta == "em_andamento":
+            return formatar_lista_tarefas(tarefas_em_andamento(df), f"Tarefas em andamento do board {nome_amigavel}")
+
+        if tipo_consulta == "atrasadas":
+            posicoes = dates.overdue_positions(date.today())
+            tarefas = tarefas_em_atraso(df) if posicoes is None else df.iloc[posicoes]
             return formatar_lista_tarefas(tarefas, f"Tarefas atrasadas do board {nome_amigavel}")
-    
-        elif any(t in pergunta_lower for t in TASK_COUNT_KEYWORDS):
+
+        if tipo_consulta == "prazo_semana":
+            posicoes = dates.due_between_positions(*boards_dates.week_bounds(date.today()))
+            if posicoes is None:
+                return f"❌ O board {nome_amigavel} não possui datas de prazo."
+            return formatar_lista_tarefas(df.iloc[posicoes], f"Tarefas com prazo nesta semana do board {nome_amigavel}")
+
+        if tipo_consulta == "alterados":
+            dias = parametros[0]
+            posicoes = dates.changed_since_positions(pd.Timestamp(date.today() - timedelta(days=dias), tz="UTC"))
+            if posicoes is None:
+                return f"❌ O board {nome_amigavel} não possui datas de alteração."
+            return formatar_lista_tarefas(df.iloc[posicoes], f"Itens alterados nos últimos {dias} dias do board {nome_amigavel}")
+
+        if tipo_consulta in ("burndown", "throughput", "mudancas"):
+            return self._render_history_query(consulta, projeto or nome_amigavel, nome_amigavel)
+
+        if tipo_consulta == "mais_tarefas":
             responsavel, quantidade = obter_responsavel_com_mais_tarefas(df)
             return f"O colaborador com mais tarefas no total é {responsavel}, com {quantidade} tarefas."
-    
-        elif any(t in pergunta_lower for t in HIERARCHY_KEYWORDS):
-            return self._format_user_story_hierarchy(df)
-    
+
+        if tipo_consulta == "hierarquia":
+            return self._format_user_story_hierarchy(df, index, pagina=parametros[0])
+
         return formatar_visao_geral(df)
     
-    def _format_user_story_hierarchy(self, df: pd.DataFrame) -> str:
+    def _render_history_query(self, consulta: tuple, projeto: str, nome_amigavel: str) -> str:
+        """
+        Renderiza as consultas de historico (burndown, throughput e mudancas desde ontem) sem acessar o Azure.
+        
+        args:
+            consulta: tuple da consulta (tipo + parametros)
+            projeto: String de identificacao do projeto (resolvida por _detect_board_project)
+            nome_amigavel: idenficador do Board ou projeto
+
+        retorna uma String com as informacoes pedidas
+        """
+
+        tipo_consulta = consulta[0]
+
+        if tipo_consulta == "mudancas":
+            mudancas = self.History.changes(projeto)
+            if mudancas is None:
+                return f"❌ Ainda não há histórico suficiente do board {nome_amigavel} para comparar com ontem."
+            return self._format_history_changes(mudancas, nome_amigavel)
+
+        dias = consulta[1]
+        if tipo_consulta == "burndown":
+            serie, titulo, sufixo = self.History.open_counts(projeto, dias), "Burndown", "itens abertos"
+        else:
+            serie, titulo, sufixo = self.History.throughput(projeto, dias), "Throughput", "itens concluídos"
+
+        if serie.empty:
+            return f"❌ Ainda não há histórico suficiente do board {nome_amigavel}."
+
+        linhas = [f"📉 **{titulo} do board {nome_amigavel}** (últimos {len(serie)} dias)"]
+        linhas += [f"   • {dia.strftime('%d/%m')}: {quantidade} {sufixo}" for dia, quantidade in serie.items()]
+        if tipo_consulta == "throughput":
+            linhas.append(f"\nMédia: {serie.mean():.1f} itens concluídos por dia")
+        return "\n".join(linhas)
+
+    def _format_history_changes(self, mudancas: Dict[str, Any], nome_amigavel: str) -> str:
+        """
+        Formata as mudancas entre dois snapshots do historico.
+        
+        args:
+            mudancas: dict retornado por BoardsHistory.changes
+            nome_amigavel: idenficador do Board ou projeto
+
+        retorna String formatada com as mudancas
+        """
+
+        linhas = [f"🔄 **Mudanças no board {nome_amigavel} desde {mudancas['desde'].strftime('%d/%m')}**"]
+        linhas.append(f"   • {len(mudancas['novos'])} item(ns) novo(s), {len(mudancas['removidos'])} removido(s)")
+
+        for coluna, rotulo in (("estado", "Mudanças de estado"), ("responsavel", "Mudanças de responsável")):
+            alteracoes = mudancas[coluna]
+            if alteracoes.empty:
+                continue
+            linhas.append(f"\n**{rotulo}** ({len(alteracoes)}):")
+            trecho = alteracoes.head(HISTORY_MAX_CHANGES_LISTED)
+            linhas += [
+                f"   • #{item_id}: {antes or '—'} → {depois or '—'}"
+                for item_id, antes, depois in zip(trecho['id'], trecho['antes'], trecho['depois'])
+            ]
+            if len(alteracoes) > HISTORY_MAX_CHANGES_LISTED:
+                linhas.append(f"   • ... e mais {len(alteracoes) - HISTORY_MAX_CHANGES_LISTED}")
+
+        if len(linhas) == 2:
+            linhas.append("   • Nenhuma mudança de estado ou responsável.")
+        return "\n".join(linhas)
+
+    def _format_user_story_hierarchy(self, df: pd.DataFrame, index: Optional[boards_index.BoardsIndex] = None,
+                                     pagina: int = 1, por_pagina: Optional[int] = HIERARCHY_PAGE_SIZE) -> str:
         """
         Formata uma visualizacao hierarquica dos stories do usuario e suas informacoes.
         
         args:
             df: DataFrame com as informacoes do usuario
+            index: BoardsIndex do DataFrame (construido na hora se None)
+            pagina: int da pagina de User Stories exibida (a partir de 1)
+            por_pagina: int de User Stories por pagina (todas se None)
 
         retorna String formatada com as informacoes do usuario
         """
 
-        user_stories = df[df["tipo"].str.lower() == "user story"]
-        tasks = df[df["tipo"].str.lower() == "task"]
+        blocos = self._render_user_story_blocks(df, index)
     
-        if user_stories.empty:
+        if blocos.empty:
             return "❌ Nenhuma User Story encontrada no board."
     
-        linhas = []
-        for _, us in user_stories.iterrows():
-            linhas.append(f"🔹 **{us['titulo']}** (#{us['id']})")
-            tarefas_us = tasks[tasks["area"] == us["area"]]
-            if tarefas_us.empty:
-                linhas.append("   • _(sem tasks registradas)_")
-            else:
-                for _, t in tarefas_us.iterrows():
-                    linhas.append(f"   • {t['titulo']} (#{t['id']})")
+        if por_pagina is None or len(blocos) <= por_pagina:
+            return "\n".join(blocos)
+    
+        total_paginas = math.ceil(len(blocos) / por_pagina)
+        pagina = min(max(pagina, 1), total_paginas)
+        trecho = blocos.iloc[(pagina - 1) * por_pagina:pagina * por_pagina]
+    
+        return (
+            "\n".join(trecho) +
+            f"\n\n📄 Página {pagina} de {total_paginas} ({len(blocos)} User Stories). "
+            f"Inclua \"página N\" na pergunta para ver as demais."
+        )
+
+    def _render_user_story_blocks(self, df: pd.DataFrame, index: Optional[boards_index.BoardsIndex] = None) -> pd.Series:
+        """
+        Renderiza o bloco de texto de cada User Story com suas tasks, agrupando as tasks por area uma unica vez.
+        
+        args:
+            df: DataFrame com itens AzureBoards
+            index: BoardsIndex do DataFrame (construido na hora se None)
+
+        retorna Series de Strings, um bloco por User Story na ordem do Board
+        """
+
+        if index is None:
+            index = boards_index.BoardsIndex(df)
+
+        user_stories = index.rows(df, 'tipo', "user story")
+        tasks = index.rows(df, 'tipo', "task")
+    
+        if user_stories.empty:
+            return pd.Series([], dtype=object)
+    
+        linhas_tasks = "   • " + tasks["titulo"].astype(str) + " (#" + tasks["id"].astype(str) + ")"
+        tasks_por_area = linhas_tasks.groupby(tasks["area"].astype(object), sort=False).agg("\n".join).to_dict()
+    
+        cabecalhos = "🔹 **" + user_stories["titulo"].astype(str) + "** (#" + user_stories["id"].astype(str) + ")"
+        corpo = user_stories["area"].astype(object).map(tasks_por_area).fillna("   • _(sem tasks registradas)_")
     
-        return "\n".join(linhas)
\ No newline at end of file
+        return (cabecalhos + "\n" + corpo).astype(object)
@@ -17,8 +17,14 @@ from src.services.constants import (
 
 # 5. Importando modulos locais
 from utils import helpers
+from core import message_features, tracing
 from handlers import general_handler
 
+# Palavras-chave consultadas pelo Handler de arquivos (categorias das MessageFeatures)
+FILE_HANDLER_KEYWORDS = {
+    'FILE_REQUEST_PATTERNS': FILE_REQUEST_PATTERNS,
+}
+
 class FileHandler:
     """Handler de arquivos."""
 
@@ -58,7 +64,8 @@ class FileHandler:
             
             print(f"[DEBUG] Solicitando {quantidade} arquivos...")
             
-            arquivos = self.Helper.sharepoint_service.list_recent_files(limit=quantidade)
+            with tracing.span("sharepoint.list_recent_files"):
+                arquivos = self.Helper.sharepoint_service.list_recent_files(limit=quantidade)
             
             if not arquivos:
                 return self._get_no_files_message()
@@ -74,21 +81,27 @@ class FileHandler:
     # Funcoes privadas
     ###################
 
-    async def _handle_file_requests(self, user_id: str, user_message: str) -> str:
+    async def _handle_file_requests(self, user_id: str, user_message: str,
+                                    features: message_features.MessageFeatures = None) -> str:
         """
         Lidando com listagem ou pesquisa de arquivos.
         
         args:
             user_id: ID do usuario
             user_message: mensagem do usuario
+            features: MessageFeatures da mensagem (padroes buscados na hora se None)
 
         retorna String formatada com informacoes do(s) arquivo(s) ou erro. 
         """
 
         message_lower = user_message.lower()
         quantidade = self._extract_quantity_listing(user_message)
+        pedido_listagem = (
+            features.has('FILE_REQUEST_PATTERNS') if features is not None
+            else any(pattern in message_lower for pattern in FILE_REQUEST_PATTERNS)
+        )
         
-        if any(pattern in message_lower for pattern in FILE_REQUEST_PATTERNS):
+        if pedido_listagem:
             return await self.list_files(user_id, user_message, message_lower, quantidade)
         
         termo_busca = self._extract_search_term(user_message)
@@ -1,6 +1,6 @@
 # 1. Importando bibliotecas padrao
 import re
-from datetime import datetime, timedelta
+import unicodedata
 
 # 3. Importando aplicacoes locais
 from src.services.knowledge.knowledge_manager import (
@@ -20,7 +20,7 @@ from src.services.constants import (
     # Padroes
     LEARNING_TRIGGERS, FILE_KEYWORDS, POSITIVE_WORDS,
     FILE_CONTEXT_WORDS, CASUAL_INDICATORS, FILE_INTENT_INDICATORS,
-    GREETING_WORDS, WELLBEING_PHRASES, REGEX_PATTERNS,
+    GREETING_WORDS, WELLBEING_PHRASES, REGEX_PATTERNS, BOARD_PROJECTS,
     
     # Parametros
     SEARCH_CACHE_DURATION, ENDPOINTS_TIMEOUT, MAX_RELEVANT_WORDS, 
@@ -29,9 +29,21 @@ from src.services.constants import (
 
 # 5. Importando modulos locais
 from utils import helpers
-from core import cache
+from core import cache, message_features, tracing
+from core.cache import SEARCH_NEGATIVE_CACHE_DURATION
 from config import promts
 
+# Palavras-chave consultadas pelo Handler geral (categorias das MessageFeatures)
+GENERAL_KEYWORDS = {
+    'LEARNING_TRIGGERS': LEARNING_TRIGGERS,
+    'GREETING_WORDS': GREETING_WORDS,
+    'WELLBEING_PHRASES': WELLBEING_PHRASES,
+    'POSITIVE_WORDS': POSITIVE_WORDS,
+    'FILE_CONTEXT_WORDS': FILE_CONTEXT_WORDS,
+    'CASUAL_INDICATORS': CASUAL_INDICATORS,
+    'FILE_INTENT_INDICATORS': FILE_INTENT_INDICATORS,
+}
+
 class GeneralHandler:
     """Handler geral. Base para todos os Handlers."""
 
@@ -53,6 +65,7 @@ class GeneralHandler:
         self.CacheAgent = CacheAgent
         self.Helper = Helper
         self.PromptAgent = PromptAgent
+        self.FeatureExtractor = message_features.MessageFeatureExtractor(GENERAL_KEYWORDS)
 
         self._compile_regex_patterns()
 
@@ -172,7 +185,8 @@ class GeneralHandler:
         try:
             relatorio.append(DIAGNOSTIC_CONNECTIVITY_SECTION)
             
-            arquivos_teste = self.Helper.sharepoint_service.list_recent_files(limit=3)
+            with tracing.span("sharepoint.list_recent_files"):
+                arquivos_teste = self.Helper.sharepoint_service.list_recent_files(limit=3)
             
             if arquivos_teste:
                 relatorio.append(f"✅ Conexão OK - {len(arquivos_teste)} arquivos acessíveis")
@@ -203,51 +217,18 @@ class GeneralHandler:
         if not termo_busca.strip():
             return FILE_NOT_FOUND_MESSAGE
         
-        cache_key = f"search_{termo_busca.lower().replace(' ', '_')}"
-        if cache_key in self.CacheAgent.boards_cache:
-            cached = self.CacheAgent.boards_cache[cache_key]
-            if (datetime.now() - cached['timestamp']).seconds < SEARCH_CACHE_DURATION:
-                return cached['result']
+        cache_key = self._normalize_search_term(termo_busca)
+        arquivos = self.CacheAgent.get(cache_key, namespace="search")
         
-        try:
-            # Estratégia 1: Busca direta
-            arquivos = self.Helper.sharepoint_service.search_files(termo_busca)
+        if arquivos is None:
+            arquivos, busca_completa = await self._search_files_with_fallbacks(termo_busca)
             if arquivos:
-                result = self.Helper._format_search_results(user_id, termo_busca, arquivos)
-                self.CacheAgent.boards_cache[cache_key] = {'result': result, 'timestamp': datetime.now()}
-                return result
-        except Exception:
-            pass
+                self.CacheAgent.set(cache_key, arquivos, ttl=SEARCH_CACHE_DURATION, namespace="search")
+            elif busca_completa:
+                self.CacheAgent.set(cache_key, [], ttl=SEARCH_NEGATIVE_CACHE_DURATION, namespace="search")
         
-        try:
-            # Estratégia 2: Interpretação AI (SEM LAMBDA!)
-            arquivos = await self._search_with_ai_interpretation(termo_busca)  # ✅ await direto
-            if arquivos:
-                result = self.Helper._format_search_results(user_id, termo_busca, arquivos)
-                self.CacheAgent.boards_cache[cache_key] = {'result': result, 'timestamp': datetime.now()}
-                return result
-        except Exception:
-            pass
-        
-        try:
-            # Estratégia 3: Variações
-            arquivos = self._search_with_variations(termo_busca)
-            if arquivos:
-                result = self.Helper._format_search_results(user_id, termo_busca, arquivos)
-                self.CacheAgent.boards_cache[cache_key] = {'result': result, 'timestamp': datetime.now()}
-                return result
-        except Exception:
-            pass
-        
-        try:
-            # Estratégia 4: Por palavras
-            arquivos = self._search_by_words(termo_busca)
-            if arquivos:
-                result = self.Helper._format_search_results(user_id, termo_busca, arquivos)
-                self.CacheAgent.boards_cache[cache_key] = {'result': result, 'timestamp': datetime.now()}
-                return result
-        except Exception:
-            pass
+        if arquivos:
+            return self.Helper._format_search_results(user_id, termo_busca, arquivos)
         
         return FILE_SEARCH_NO_RESULTS.format(termo_busca)
 
@@ -268,6 +249,68 @@ class GeneralHandler:
             re.IGNORECASE
         )
 
+    def _normalize_search_term(self, termo_busca: str) -> str:
+        """
+        Normaliza um termo de busca para uso como chave de cache.
+        Ignora maiusculas, acentos e trata espacos, '_' e '-' como equivalentes.
+        
+        args:
+            termo_busca: String do termo de busca original
+
+        retorna String do termo normalizado
+        """
+
+        termo = unicodedata.normalize("NFKD", termo_busca.casefold())
+        termo = "".join(c for c in termo if not unicodedata.combining(c))
+        return re.sub(r"[\s_\-]+", " ", termo).strip()
+
+    async def _search_files_with_fallbacks(self, termo_busca: str) -> tuple:
+        """
+        Busca arquivos no SharePoint aplicando as estrategias em ordem ate encontrar resultados.
+        
+        args:
+            termo_busca: String do termo de busca
+
+        retorna tupla (list de arquivos, bool indicando se todas as estrategias rodaram sem erro)
+        """
+
+        busca_completa = True
+        
+        try:
+            # Estratégia 1: Busca direta
+            with tracing.span("sharepoint.search_files"):
+                arquivos = self.Helper.sharepoint_service.search_files(termo_busca)
+            if arquivos:
+                return arquivos, True
+        except Exception:
+            busca_completa = False
+        
+        try:
+            # Estratégia 2: Interpretação AI
+            arquivos = await self._search_with_ai_interpretation(termo_busca)
+            if arquivos:
+                return arquivos, True
+        except Exception:
+            busca_completa = False
+        
+        try:
+            # Estratégia 3: Variações
+            arquivos = self._search_with_variations(termo_busca)
+            if arquivos:
+                return arquivos, True
+        except Exception:
+            busca_completa = False
+        
+        try:
+            # Estratégia 4: Por palavras
+            arquivos = self._search_by_words(termo_busca)
+            if arquivos:
+                return arquivos, True
+        except Exception:
+            busca_completa = False
+        
+        return [], busca_completa
+
     async def _handle_admin_commands(self, user_id: str, user_message: str = None) -> str:
         """
         Processando comandos administrativos.
@@ -286,9 +329,70 @@ class GeneralHandler:
         elif "testar busca" in message_lower:
             termo = user_message.replace("testar busca", "").strip()
             return await self.diagnose_complete_sharepoint(user_id, termo or "Manifesto_Tribo_Sonar_Labs")
+        elif "cache stats" in message_lower:
+            return self._format_cache_stats()
+        elif "limpar cache" in message_lower:
+            projeto = self._resolve_board_project(message_lower.replace("limpar cache", ""))
+            if not projeto:
+                return "⚠️ Informe o projeto. Ex.: `limpar cache sonar`"
+            removidas = self.CacheAgent.flush_project(projeto)
+            return f"🧹 Cache de **{projeto}** limpo ({removidas} entrada(s) removida(s))."
+        elif "aquecer cache" in message_lower:
+            projeto = self._resolve_board_project(message_lower.replace("aquecer cache", ""))
+            if not projeto:
+                return "⚠️ Informe o projeto. Ex.: `aquecer cache sonar`"
+            if await self.CacheAgent.warm_project(projeto):
+                return f"🔥 Cache de **{projeto}** carregado."
+            return f"❌ Não foi possível carregar o cache de **{projeto}**."
         
         return ADMIN_COMMAND_NOT_RECOGNIZED
 
+    def _format_cache_stats(self) -> str:
+        """
+        Formata as metricas do cache para exibicao.
+        
+        retorna String formatada com as metricas de cada namespace
+        """
+
+        stats = self.CacheAgent.get_stats()
+        linhas = ["📊 **Métricas do cache**"]
+        
+        for namespace, dados in stats.items():
+            if namespace == "single_flight":
+                continue
+            consultas = dados['hits'] + dados['stale_hits'] + dados['negative_hits'] + dados['misses']
+            taxa = (dados['hits'] + dados['stale_hits']) / consultas if consultas else 0.0
+            linhas.append(
+                f"• **{namespace}**: {dados['entries']} entrada(s), {dados['bytes'] / 1024 / 1024:.1f} MB | "
+                f"hits {dados['hits']}, obsoletos {dados['stale_hits']}, negativos {dados['negative_hits']}, "
+                f"misses {dados['misses']} "
+                f"({taxa:.0%}) | descartes {dados['evictions']}, expirações {dados['expirations']} | "
+                f"cargas {dados['fetches']} (média {dados['fetch_seconds_avg']:.2f}s, máx {dados['fetch_seconds_max']:.2f}s)"
+            )
+        
+        single_flight = stats['single_flight']
+        linhas.append(f"• **single-flight**: {single_flight['fetches']} busca(s), {single_flight['coalesced']} agrupada(s)")
+        return "\n".join(linhas)
+
+    def _resolve_board_project(self, texto: str):
+        """
+        Identifica o projeto de AzureBoards citado em um texto.
+        
+        args:
+            texto: String em minusculo contendo o nome ou apelido do projeto
+
+        retorna String do projeto ou None.
+        """
+
+        texto = texto.strip()
+        if not texto:
+            return None
+        
+        for keyword, project in BOARD_PROJECTS.items():
+            if keyword in texto or texto == project.lower():
+                return project
+        return None
+
     def _handle_learning(self, user_id: str, user_message: str) -> str:
         """
         Verificando se mensagem ativa apredizado manual, caso positivo, 
@@ -305,26 +409,28 @@ class GeneralHandler:
             return self.process_manual_learning(user_id, user_message)
         return LEARNING_ERROR_MESSAGE
 
-    def _handle_greetings(self, user_message: str) -> str:
+    def _handle_greetings(self, user_message: str, features: message_features.MessageFeatures = None) -> str:
         """
         Processa mensagem de saudacao.
         
         args:
             user_message: String de mensagem do usuario
+            features: MessageFeatures da mensagem (calculadas na hora se None)
         
         retorna String de resposta adequada
         """
 
-        message_lower = user_message.lower()
+        features = features or self.FeatureExtractor.extract(user_message)
         
-        if any(word in message_lower for word in GREETING_WORDS):
+        if features.has('GREETING_WORDS'):
             return GREETING_DEFAULT
-        elif any(phrase in message_lower for phrase in WELLBEING_PHRASES):
+        elif features.has('WELLBEING_PHRASES'):
             return GREETING_WELLBEING
         else:
             return GREETING_DEFAULT
 
-    async def _handle_general_questions(self, user_id: str, user_message: str, nome_usuario: str) -> str:
+    async def _handle_general_questions(self, user_id: str, user_message: str, nome_usuario: str,
+                                        features: message_features.MessageFeatures = None) -> str:
         """
         Processa mensagens gerais direcionando para o Handler adequado.
 
@@ -332,13 +438,15 @@ class GeneralHandler:
             user_id: ID de usuario da mensagem
             user_message: mensagem original do usuario
             nome_usuario: nome do usuario da mensagem
+            features: MessageFeatures da mensagem (calculadas na hora se None)
 
         retorna String de resposta apropriada a mensagem
         """
 
-        message_lower = user_message.lower()
+        features = features or self.FeatureExtractor.extract(user_message)
+        message_lower = features.lower
     
-        if self._is_courtesy_message(message_lower):
+        if self._is_courtesy_message(features):
             return COURTESY_RESPONSE
     
         if nome_usuario and "meu nome" in message_lower:
@@ -348,8 +456,8 @@ class GeneralHandler:
         if resposta_manual:
             return resposta_manual
     
-        is_casual = self._is_casual_conversation(message_lower)
-        has_file_intent = self._has_file_intent(message_lower)
+        is_casual = self._is_casual_conversation(features)
+        has_file_intent = self._has_file_intent(features)
     
         if not is_casual and has_file_intent:
             termo_busca = self._extract_search_term(user_message)
@@ -358,44 +466,41 @@ class GeneralHandler:
     
         return await self._process_with_openai(user_id, user_message)
 
-    def _is_courtesy_message(self, message_lower: str) -> bool:
+    def _is_courtesy_message(self, features: message_features.MessageFeatures) -> bool:
         """
         Classifica a mensagem como cortesia positiva e sem intencao com arquivos.
         
         args:
-            message_lower: String de mensagem em minusculo
+            features: MessageFeatures da mensagem
         
         retorna bool de classificacao como cortesia positiva apenas
         """
 
-        has_positive = any(word in message_lower for word in POSITIVE_WORDS)
-        has_file_context = any(word in message_lower for word in FILE_CONTEXT_WORDS)
-        
-        return has_positive and not has_file_context
+        return features.has('POSITIVE_WORDS') and not features.has('FILE_CONTEXT_WORDS')
     
-    def _is_casual_conversation(self, message_lower: str) -> bool:
+    def _is_casual_conversation(self, features: message_features.MessageFeatures) -> bool:
         """
         Classifica a mensagem como conversa casual.
         
         args:
-            message_lower: String de mensagem em minusculo
+            features: MessageFeatures da mensagem
         
         retorna bool de classificacao como conversa casual
         """
 
-        return any(indicator in message_lower for indicator in CASUAL_INDICATORS)
+        return features.has('CASUAL_INDICATORS')
     
-    def _has_file_intent(self, message_lower: str) -> bool:
+    def _has_file_intent(self, features: message_features.MessageFeatures) -> bool:
         """
         Verifica se a mensagem tem intencao relacionada a arquivos.
         
         args:
-            message_lower: String de mensagem em minusculo
+            features: MessageFeatures da mensagem
         
         retorna bool de intencao relacionada a arquivo (True se tem intencao com arquivo)
         """
 
-        return any(indicator in message_lower for indicator in FILE_INTENT_INDICATORS)
+        return features.has('FILE_INTENT_INDICATORS')
     
     def _test_sharepoint_endpoints(self) -> list:
         """
@@ -455,15 +560,14 @@ class GeneralHandler:
         args:
             termo_busca: String de termo de busca
 
-        retorna list de arquivos ou None.
+        retorna list de arquivos ou None (erros sao propagados para marcar a busca como incompleta).
         """
 
-        try:
+        with tracing.span("openai.interpretar_termo_busca"):
             termo_limpo = await self.Helper.openai_service.interpretar_termo_busca(termo_busca)
-            if termo_limpo != termo_busca:
+        if termo_limpo != termo_busca:
+            with tracing.span("sharepoint.search_files"):
                 return self.Helper.sharepoint_service.search_files(termo_limpo)
-        except Exception:
-            pass
         return None
 
     def _search_with_variations(self, termo_busca: str):
@@ -473,9 +577,10 @@ class GeneralHandler:
         args:
             termo_busca: String do termo de busca
 
-        retorna list de arquivos ou None.
+        retorna list de arquivos ou None (levanta o ultimo erro se nada foi encontrado e alguma busca falhou).
         """
 
+        erro = None
         variations = [
             termo_busca.replace(' ', '_'),
             termo_busca.replace(' ', '-'),
@@ -488,11 +593,14 @@ class GeneralHandler:
         for variation in variations:
             if variation != termo_busca:
                 try:
-                    arquivos = self.Helper.sharepoint_service.search_files(variation)
+                    with tracing.span("sharepoint.search_files"):
+                        arquivos = self.Helper.sharepoint_service.search_files(variation)
                     if arquivos:
                         return arquivos
-                except Exception:
-                    continue
+                except Exception as e:
+                    erro = e
+        if erro is not None:
+            raise erro
         return None
 
     def _search_by_words(self, termo_busca: str):
@@ -502,24 +610,28 @@ class GeneralHandler:
         args:
             termo_busca: String de termo de busca
 
-        retorna list de arquivos ou None.
+        retorna list de arquivos ou None (levanta o ultimo erro se nada foi encontrado e alguma busca falhou).
         """
 
+        erro = None
         words = [w.strip() for w in termo_busca.split() if len(w.strip()) > MIN_WORD_LENGTH]
         all_files = []
         
         for word in words:
             try:
-                files = self.Helper.sharepoint_service.search_files(word)
+                with tracing.span("sharepoint.search_files"):
+                    files = self.Helper.sharepoint_service.search_files(word)
                 if files:
                     all_files.extend(files)
-            except Exception:
-                continue
+            except Exception as e:
+                erro = e
         
         if all_files:
             unique_files = {f.get("name", ""): f for f in all_files if f.get("name")}
             return list(unique_files.values())
         
+        if erro is not None:
+            raise erro
         return None
     
     async def _process_with_openai(self, user_id: str, user_message: str) -> str:
@@ -534,18 +646,22 @@ class GeneralHandler:
         """
 
         try:
-            tom = await self.Helper.openai_service.classificar_tom_mensagem(user_message)
+            with tracing.span("openai.classificar_tom_mensagem"):
+                tom = await self.Helper.openai_service.classificar_tom_mensagem(user_message)
             print(f"🎨 [DEBUG] Tom detectado: {tom}")
 
-            system_prompt = self.PromptAgent.generate_system_prompt(tom=tom)
-            historico = self.Helper.conversation_history.format_for_prompt(user_id)
-
-            resposta = await self.Helper.openai_service.gerar_resposta_geral(
-                user_message=user_message,
-                system_prompt=system_prompt,
-                historico_formatado=historico,
-                tom=tom
-            )
+            with tracing.span("prompt.generate_system_prompt"):
+                system_prompt = self.PromptAgent.generate_system_prompt(tom=tom)
+            with tracing.span("history.format_for_prompt"):
+                historico = self.Helper.conversation_history.format_for_prompt(user_id)
+
+            with tracing.span("openai.gerar_resposta_geral"):
+                resposta = await self.Helper.openai_service.gerar_resposta_geral(
+                    user_message=user_message,
+                    system_prompt=system_prompt,
+                    historico_formatado=historico,
+                    tom=tom
+                )
 
             if resposta:
                 return resposta
@@ -0,0 +1,28 @@
+# 2. Importando blibliotecas de terceiros
+import pytest
+
+# 5. Importando modulos locais
+from core import cache
+
+
+class FakeClock:
+    """Relogio controlado pelos testes, no lugar do modulo time usado pelo cache."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    relogio = FakeClock()
+    monkeypatch.setattr(cache, "time", relogio)
+    return relogio
@@ -0,0 +1,127 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+from types import SimpleNamespace
+
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+
+# 4. Importando constantes
+from src.services.constants import BOARD_PROJECTS
+
+# 5. Importando modulos locais
+from core import cache, boards_sync
+from handlers import boards_handler, general_handler
+from utils.fake_boards import FakeAzureBoardsService, generate_work_items
+
+PROJETOS = sorted(set(BOARD_PROJECTS.values()))
+
+
+def _agentes():
+    servicos = {projeto: FakeAzureBoardsService(projeto, generate_work_items(30)) for projeto in PROJETOS}
+    agente = cache.CacheAgent()
+    sync = boards_sync.BoardsSyncAgent(service_factory=servicos.__getitem__)
+    boards = boards_handler.BoardsHandler(agente, sync)
+    geral = general_handler.GeneralHandler(agente, SimpleNamespace(), None)
+    return agente, sync, boards, geral
+
+
+def _comandos(*mensagens, aquecer=()):
+    agente, sync, boards, geral = _agentes()
+
+    async def cenario():
+        for projeto in aquecer:
+            await agente.warm_project(projeto)
+        respostas = [await geral._handle_admin_commands("admin", mensagem) for mensagem in mensagens]
+        await agente.stop()
+        await sync.fetcher.close()
+        return respostas
+
+    return asyncio.run(cenario()), agente, boards
+
+
+def test_project_names_and_nicknames_are_resolved():
+    _, _, _, geral = _agentes()
+
+    for keyword, projeto in BOARD_PROJECTS.items():
+        assert geral._resolve_board_project(keyword) == projeto
+        assert geral._resolve_board_project(f" {projeto.lower()} ") == projeto
+    assert geral._resolve_board_project("   ") is None
+    assert geral._resolve_board_project("projeto inexistente") is None
+
+
+def test_warm_command_loads_only_the_named_project():
+    projeto = PROJETOS[0]
+    (resposta,), agente, boards = _comandos(f"Aquecer cache {projeto}")
+
+    assert resposta == f"🔥 Cache de **{projeto}** carregado."
+    assert isinstance(agente.get(boards._boards_cache_key(projeto)), pd.DataFrame)
+    assert len(agente.boards_cache) == 1
+
+
+def test_warm_command_reports_failed_load():
+    agente = cache.CacheAgent()
+
+    def sem_servico(projeto):
+        raise ConnectionError("azure fora do ar")
+
+    sync = boards_sync.BoardsSyncAgent(service_factory=sem_servico)
+    boards = boards_handler.BoardsHandler(agente, sync)
+    geral = general_handler.GeneralHandler(agente, SimpleNamespace(), None)
+
+    async def cenario():
+        resposta = await geral._handle_admin_commands("admin", f"aquecer cache {PROJETOS[0]}")
+        await agente.stop()
+        await sync.fetcher.close()
+        return resposta
+
+    assert asyncio.run(cenario()) == f"❌ Não foi possível carregar o cache de **{PROJETOS[0]}**."
+    assert agente.get(boards._boards_cache_key(PROJETOS[0])) is None
+
+
+def test_flush_command_removes_only_the_named_project():
+    projeto = PROJETOS[0]
+    (resposta, repetida), agente, boards = _comandos(
+        f"limpar cache {projeto}", f"limpar cache {projeto}", aquecer=PROJETOS
+    )
+
+    assert resposta == f"🧹 Cache de **{projeto}** limpo (1 entrada(s) removida(s))."
+    assert repetida == f"🧹 Cache de **{projeto}** limpo (0 entrada(s) removida(s))."
+    assert agente.get(boards._boards_cache_key(projeto)) is None
+    assert all(agente.get(boards._boards_cache_key(outro)) is not None for outro in PROJETOS[1:])
+
+
+def test_commands_without_project_change_nothing():
+    respostas, agente, _ = _comandos("limpar cache", "aquecer cache", "limpar cache projeto inexistente",
+                                     aquecer=PROJETOS)
+
+    assert respostas == [
+        "⚠️ Informe o projeto. Ex.: `limpar cache sonar`",
+        "⚠️ Informe o projeto. Ex.: `aquecer cache sonar`",
+        "⚠️ Informe o projeto. Ex.: `limpar cache sonar`",
+    ]
+    assert len(agente.boards_cache) == len(PROJETOS)
+
+
+def test_cache_stats_reports_each_namespace():
+    projeto = PROJETOS[0]
+    agente, sync, boards, geral = _agentes()
+
+    async def cenario():
+        await agente.warm_project(projeto)
+        await boards._get_boards_data_cached(projeto)
+        agente.get("termo", namespace="search")
+        resposta = await geral._handle_admin_commands("admin", "cache stats")
+        await agente.stop()
+        await sync.fetcher.close()
+        return resposta
+
+    linhas = asyncio.run(cenario()).splitlines()
+
+    assert linhas[0] == "📊 **Métricas do cache**"
+    assert linhas[1].startswith("• **boards**: 1 entrada(s), ")
+    assert "hits 1, obsoletos 0, negativos 0, misses 1 (50%)" in linhas[1]
+    assert "cargas 1 " in linhas[1]
+    assert linhas[2].startswith("• **search**: 0 entrada(s), 0.0 MB")
+    assert "hits 0, obsoletos 0, negativos 0, misses 1 (0%)" in linhas[2]
+    assert linhas[3] == "• **single-flight**: 1 busca(s), 0 agrupada(s)"
+    assert agente.get_stats()['boards']['entries'] == 1
@@ -0,0 +1,112 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+import threading
+import time
+
+# 5. Importando modulos locais
+from core.boards_fetcher import AsyncBoardsFetcher
+from utils.fake_boards import FakeAzureBoardsService, generate_work_items
+
+
+class SlowBoardsService(FakeAzureBoardsService):
+    """Servico que demora para responder e registra as chamadas simultaneas e a thread usada."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.simultaneas = 0
+        self.maximo = 0
+        self.threads = set()
+        self.batch_sizes = []
+        self._lock = threading.Lock()
+
+    def buscar_work_items(self, batch_size: int = 100):
+        with self._lock:
+            self.simultaneas += 1
+            self.maximo = max(self.maximo, self.simultaneas)
+            self.threads.add(threading.current_thread().name)
+            self.batch_sizes.append(batch_size)
+        time.sleep(0.05)
+        with self._lock:
+            self.simultaneas -= 1
+        return super().buscar_work_items(batch_size)
+
+
+class FullOnlyBoardsService(FakeAzureBoardsService):
+    """Servico sem busca de itens alterados."""
+
+    buscar_work_items_alterados = None
+
+
+def test_service_called_in_worker_threads_with_batch_size():
+    servico = SlowBoardsService("Sonar", generate_work_items(10))
+    fetcher = AsyncBoardsFetcher(batch_size=50)
+
+    async def cenario():
+        ticks = 0
+
+        async def relogio():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        tarefa = asyncio.ensure_future(relogio())
+        itens = await fetcher.fetch_all(servico)
+        tarefa.cancel()
+        await fetcher.close()
+        return itens, ticks
+
+    itens, ticks = asyncio.run(cenario())
+
+    assert len(itens) == 10
+    assert servico.batch_sizes == [50]
+    assert threading.main_thread().name not in servico.threads
+    assert ticks > 2
+
+
+def test_limiter_bounds_concurrent_azure_calls():
+    servico = SlowBoardsService("Sonar", generate_work_items(10))
+    fetcher = AsyncBoardsFetcher(max_concurrency=2)
+
+    async def cenario():
+        resultados = await asyncio.gather(*(fetcher.fetch_all(servico) for _ in range(6)))
+        await fetcher.close()
+        return resultados
+
+    resultados = asyncio.run(cenario())
+
+    assert len(resultados) == 6
+    assert servico.maximo == 2
+    assert fetcher.stats['calls'] == 6
+    assert fetcher.stats['queued'] >= 1
+
+
+def test_changed_since_uses_service_query():
+    itens = generate_work_items(20)
+    servico = FakeAzureBoardsService("Sonar", itens)
+    desde = sorted(item['fields']['System.ChangedDate'] for item in itens)[9]
+    fetcher = AsyncBoardsFetcher()
+
+    async def cenario():
+        alterados = await fetcher.fetch_changed_since(servico, desde)
+        await fetcher.close()
+        return alterados
+
+    alterados = asyncio.run(cenario())
+
+    assert len(alterados) == 10
+    assert servico.chamadas == {'buscar_work_items': 0, 'buscar_work_items_alterados': 1}
+
+
+def test_changed_since_unsupported_returns_none_without_download():
+    servico = FullOnlyBoardsService("Sonar", generate_work_items(20))
+    fetcher = AsyncBoardsFetcher()
+
+    async def cenario():
+        alterados = await fetcher.fetch_changed_since(servico, "2026-01-01T00:00:00+00:00")
+        await fetcher.close()
+        return alterados
+
+    assert asyncio.run(cenario()) is None
+    assert not fetcher.supports_changed_since(servico)
+    assert servico.chamadas['buscar_work_items'] == 0
@@ -0,0 +1,53 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+from datetime import datetime, timezone
+
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+
+# 3. Importando aplicacoes locais
+from src.services.module.boards.processing import processar_work_items_df
+
+# 5. Importando modulos locais
+from benchmarks.boards_benchmark import BENCHMARK_QUERIES
+from core import cache, boards_frame
+from handlers import boards_handler
+from utils.fake_boards import generate_work_items
+
+AGORA = datetime(2026, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _frame(quantidade=400):
+    return asyncio.run(processar_work_items_df(generate_work_items(quantidade, agora=AGORA), projeto="Sonar"))
+
+
+def test_only_allow_listed_columns_are_converted():
+    df = _frame()
+    compactado, economizados = boards_frame.compact_boards_frame(df)
+
+    for coluna in df.columns:
+        if coluna in boards_frame.CATEGORY_COLUMNS:
+            assert isinstance(compactado[coluna].dtype, pd.CategoricalDtype)
+        elif coluna not in boards_frame.INT32_COLUMNS:
+            assert compactado[coluna].dtype == df[coluna].dtype, coluna
+    assert economizados > 0
+
+
+def test_already_compacted_frame_is_left_as_is():
+    compactado, _ = boards_frame.compact_boards_frame(_frame())
+    novamente, economizados = boards_frame.compact_boards_frame(compactado)
+
+    pd.testing.assert_frame_equal(novamente, compactado)
+    assert economizados == 0
+
+
+def test_answers_unchanged_on_compacted_frame():
+    df = _frame()
+    compactado, _ = boards_frame.compact_boards_frame(df)
+    original = boards_handler.BoardsHandler(cache.CacheAgent())
+    compacto = boards_handler.BoardsHandler(cache.CacheAgent())
+
+    for familia, pergunta in BENCHMARK_QUERIES.items():
+        esperado = original._process_boards_query("u", pergunta, df, "Sonar")
+        obtido = compacto._process_boards_query("u", pergunta, compactado, "Sonar")
+        assert obtido == esperado, familia
@@ -0,0 +1,161 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+# 2. Importando blibliotecas de terceiros
+import numpy as np
+import pandas as pd
+import pytest
+
+# 3. Importando aplicacoes locais
+from src.services.module.boards.processing import formatar_lista_tarefas, tarefas_em_atraso
+
+# 5. Importando modulos locais
+from core import cache, boards_sync, boards_index, boards_dates
+from handlers import boards_handler
+from utils.fake_boards import FakeAzureBoardsService, generate_work_items
+
+AGORA = datetime.now(timezone.utc)
+
+
+def _frame(quantidade=400, responsaveis=None):
+    itens = generate_work_items(quantidade, agora=AGORA)
+    for posicao, nome in enumerate(responsaveis or ()):
+        itens[posicao]['fields']['System.AssignedTo'] = nome
+    agente = boards_sync.BoardsSyncAgent()
+    return asyncio.run(agente._process(itens, "Sonar"))
+
+
+def _handler():
+    return boards_handler.BoardsHandler(cache.CacheAgent())
+
+
+def test_sync_adds_date_columns_from_azure_fields():
+    df = _frame()
+
+    assert df[boards_dates.DUE_DATE_COLUMN].notna().all()
+    assert df[boards_dates.CHANGED_DATE_COLUMN].notna().all()
+
+
+def test_recent_changes_question_is_not_read_as_collaborator(monkeypatch):
+    # Unica pessoa com sobrenome Dias no Board: "dias" sozinho identificaria a Ana Dias
+    df = _frame(40, responsaveis=["Ana Dias"] + ["Bruno Lima", "Carla Souza"] * 19)
+    handler = _handler()
+    pergunta = "sonar itens alterados nos últimos 7 dias"
+
+    esperado = handler._process_boards_query("u", pergunta, df, "Operações")
+    assert esperado.startswith("Itens alterados nos últimos 7 dias")
+
+    # Mesmo sem a lista de palavras comuns, "dias" do periodo nao e lido como sobrenome
+    monkeypatch.setattr(boards_index, "COMMON_SURNAME_WORDS", frozenset())
+    assert handler._process_boards_query("u", pergunta, df, "Operações") == esperado
+
+
+def test_collaborator_still_found_next_to_period():
+    df = _frame()
+    resposta = _handler()._process_boards_query("u", "tarefas da ana dias atrasadas", df, "Operações")
+
+    assert resposta.startswith("Tarefas de Ana Dias")
+
+
+def test_overdue_answer_reads_days_overdue():
+    df = _frame()
+    handler = _handler()
+    dates = boards_dates.BoardsDates(df, abertos=handler._open_mask(df))
+
+    obtido = handler._process_boards_query("u", "sonar tarefas atrasadas", df, "Operações", dates=dates)
+    sem_datas = handler._process_boards_query("u", "sonar tarefas atrasadas", df, "Operações")
+
+    prazos = pd.to_datetime(df[boards_dates.DUE_DATE_COLUMN]).dt.date
+    esperado = df[handler._open_mask(df) & (prazos < date.today())]
+    esperado = esperado.iloc[prazos[esperado.index].argsort(kind="stable")]
+    assert not esperado.empty
+    assert obtido == formatar_lista_tarefas(esperado, "Tarefas atrasadas do board Operações")
+    assert sem_datas == obtido
+
+
+def test_overdue_without_due_dates_uses_processing_function():
+    df = _frame().drop(columns=[boards_dates.DUE_DATE_COLUMN])
+
+    obtido = _handler()._process_boards_query("u", "sonar tarefas atrasadas", df, "Operações")
+
+    assert obtido == formatar_lista_tarefas(tarefas_em_atraso(df), "Tarefas atrasadas do board Operações")
+
+
+def test_days_overdue_follow_reference_day():
+    df = _frame(50)
+    dates = boards_dates.BoardsDates(df)
+    hoje = date.today()
+
+    dias = dates.days_overdue(hoje)
+    assert dates.days_overdue(hoje) is dias
+    amanha = dates.days_overdue(hoje + timedelta(days=1))
+    assert amanha is not dias
+    assert np.array_equal(amanha, dias + 1, equal_nan=True)
+
+
+@pytest.mark.parametrize("incremental", [True, False], ids=["delta", "completa"])
+def test_replaced_board_entry_drops_memoized_answers(incremental):
+    servico = FakeAzureBoardsService("Sonar", generate_work_items(60, agora=AGORA - timedelta(hours=1)))
+    agente = cache.CacheAgent()
+    sync = boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico, incremental=incremental)
+    handler = boards_handler.BoardsHandler(agente, sync)
+    renderizadas = []
+    renderizar = handler._render_boards_query
+
+    def contar(consulta, *args, **kwargs):
+        renderizadas.append(consulta)
+        return renderizar(consulta, *args, **kwargs)
+
+    handler._render_boards_query = contar
+
+    async def cenario():
+        antes = await handler.answer_with_boards("sonar tarefas a fazer")
+        memorizada = await handler.answer_with_boards("sonar tarefas a fazer")
+        renderizadas_antes = len(renderizadas)
+
+        servico.upsert_work_item(999, **{
+            'System.Title': "Tarefa nova 999", 'System.WorkItemType': "Task", 'System.State': "To Do",
+        })
+        assert await agente.warm_project("Sonar", refresh=True)
+        depois = await handler.answer_with_boards("sonar tarefas a fazer")
+
+        await agente.stop()
+        await sync.fetcher.close()
+        return antes, memorizada, renderizadas_antes, depois
+
+    antes, memorizada, renderizadas_antes, depois = asyncio.run(cenario())
+
+    assert memorizada == antes
+    assert renderizadas_antes == 1
+    assert len(renderizadas) == 2
+    assert "Tarefa nova 999" not in antes
+    assert "Tarefa nova 999" in depois
+    assert (sync.stats['full_syncs'], sync.stats['delta_syncs']) == ((1, 1) if incremental else (2, 0))
+
+
+def test_raw_items_live_in_the_cache_entry():
+    servico = FakeAzureBoardsService("Sonar", generate_work_items(60, agora=AGORA))
+    agente = cache.CacheAgent()
+    sync = boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico)
+    handler = boards_handler.BoardsHandler(agente, sync)
+    chave = handler._boards_cache_key("Sonar")
+
+    async def cenario():
+        df = await handler._get_boards_data_cached("Sonar")
+        entrada = agente.boards_cache.get_entry(chave)
+        itens = entrada['derived'][boards_handler.WORK_ITEMS_ARTIFACT]
+        tamanhos = (entrada['size'], cache.estimate_size(df), cache.estimate_size(itens), agente.boards_cache.total_bytes)
+        await handler.answer_with_boards("sonar atividade do cliente")
+        agente.flush_project("Sonar")
+        await agente.stop()
+        await sync.fetcher.close()
+        return df, itens, tamanhos
+
+    df, itens, (tamanho_entrada, tamanho_df, tamanho_itens, total) = asyncio.run(cenario())
+
+    assert sorted(itens) == sorted(df['id'].tolist())
+    assert tamanho_entrada == tamanho_df + tamanho_itens == total
+    assert servico.chamadas['buscar_work_items'] == 1
+    assert sync.stats['epic_enrichments'] == 1
+    assert agente.boards_cache.total_bytes == 0
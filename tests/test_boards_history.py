@@ -0,0 +1,136 @@
+# 1. Importando bibliotecas padrao
+from datetime import date, timedelta
+
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+import pytest
+
+# 5. Importando modulos locais
+from core import boards_history, cache
+from handlers import boards_handler
+
+PROJETO = "Sonar"
+ONTEM = date(2026, 1, 9)
+HOJE = date(2026, 1, 10)
+
+
+def _board():
+    return pd.DataFrame({
+        'id': [1, 2, 3, 4, 5],
+        'estado': ["To Do", "Doing", "Doing", "Done", "To Do"],
+        'tipo': ["Task", "Bug", "Task", "Task", "User Story"],
+        'responsavel': ["Ana Lima", "Bruno Dias", None, "Carla Souza", "Ana Lima"],
+    })
+
+
+def _alterado():
+    df = _board()
+    df.loc[df['id'] == 2, 'estado'] = "Done"
+    df.loc[df['id'] == 5, 'responsavel'] = "Bruno Dias"
+    df = df[df['id'] != 3]
+    novo = pd.DataFrame({'id': [6], 'estado': ["To Do"], 'tipo': ["Bug"], 'responsavel': ["Carla Souza"]})
+    return pd.concat([df, novo], ignore_index=True)
+
+
+def _abertos(df):
+    return df['estado'].isin(["To Do", "Doing"]).to_numpy()
+
+
+def _registrar(historico, *dias_e_boards):
+    for dia, df in dias_e_boards:
+        historico.record(PROJETO, df, dia=dia, abertos=_abertos(df))
+
+
+def test_changes_against_previous_day():
+    historico = boards_history.BoardsHistory()
+    _registrar(historico, (ONTEM, _board()), (HOJE, _alterado()))
+
+    mudancas = historico.changes(PROJETO)
+
+    assert mudancas['desde'] == ONTEM
+    assert mudancas['novos']['id'].tolist() == [6]
+    assert mudancas['removidos']['id'].tolist() == [3]
+    assert mudancas['estado'][['id', 'antes', 'depois']].values.tolist() == [[2, "Doing", "Done"]]
+    assert mudancas['responsavel'][['id', 'antes', 'depois']].values.tolist() == [[5, "Ana Lima", "Bruno Dias"]]
+
+
+def test_only_changed_rows_are_stored_per_day():
+    historico = boards_history.BoardsHistory()
+    _registrar(historico, (ONTEM, _board()), (HOJE, _alterado()), (HOJE + timedelta(days=1), _alterado()))
+
+    deltas = historico._history[PROJETO]['deltas']
+
+    assert sorted(deltas[HOJE]['id']) == [2, 3, 5, 6]
+    assert deltas[HOJE + timedelta(days=1)].empty
+    assert historico.days(PROJETO) == [ONTEM, HOJE, HOJE + timedelta(days=1)]
+
+
+def test_same_day_record_is_compared_with_previous_day():
+    historico = boards_history.BoardsHistory()
+    _registrar(historico, (ONTEM, _board()), (HOJE, _board()), (HOJE, _alterado()))
+
+    mudancas = historico.changes(PROJETO)
+
+    assert mudancas['desde'] == ONTEM
+    assert mudancas['estado']['id'].tolist() == [2]
+
+
+def test_counts_replayed_from_deltas():
+    historico = boards_history.BoardsHistory()
+    _registrar(historico, (ONTEM, _board()), (HOJE, _alterado()))
+
+    assert historico.open_counts(PROJETO, 7).to_dict() == {ONTEM: 4, HOJE: 3}
+    assert historico.throughput(PROJETO, 7).to_dict() == {HOJE: 1}
+
+
+def test_counts_are_recorded_without_replaying_deltas(monkeypatch):
+    historico = boards_history.BoardsHistory()
+    _registrar(historico, (ONTEM, _board()), (HOJE, _board()))
+
+    def replay(projeto):
+        raise AssertionError("deltas reaplicados para responder contagens")
+
+    monkeypatch.setattr(historico, "_iter_snapshots", replay)
+    # Registrar o mesmo dia de novo substitui a contagem do dia
+    _registrar(historico, (HOJE, _alterado()), (HOJE + timedelta(days=1), _alterado()))
+
+    assert historico.open_counts(PROJETO, 2).to_dict() == {HOJE: 3, HOJE + timedelta(days=1): 3}
+    assert historico.throughput(PROJETO, 7).to_dict() == {HOJE: 1, HOJE + timedelta(days=1): 0}
+
+
+def test_base_rolls_forward_after_retention():
+    historico = boards_history.BoardsHistory(retention_days=1)
+    depois = HOJE + timedelta(days=1)
+    _registrar(historico, (ONTEM, _board()), (HOJE, _alterado()), (depois, _alterado()))
+
+    assert historico.days(PROJETO) == [HOJE, depois]
+    assert historico.open_counts(PROJETO, 7).to_dict() == {HOJE: 3, depois: 3}
+
+
+@pytest.mark.skipif(boards_history.pa is None, reason="pyarrow não está instalado")
+def test_reloaded_history_gives_same_changes(tmp_path):
+    historico = boards_history.BoardsHistory(str(tmp_path))
+    for dia, df in ((ONTEM, _board()), (HOJE, _alterado())):
+        historico.record(PROJETO, df, dia=dia, abertos=_abertos(df))
+        assert historico.persist(PROJETO, dia)
+
+    recarregado = boards_history.BoardsHistory(str(tmp_path))
+    mudancas = recarregado.changes(PROJETO)
+
+    assert recarregado.days(PROJETO) == [ONTEM, HOJE]
+    assert mudancas['estado']['id'].tolist() == [2]
+    assert mudancas['removidos']['id'].tolist() == [3]
+    assert recarregado.open_counts(PROJETO, 7).to_dict() == {ONTEM: 4, HOJE: 3}
+
+
+def test_handler_reads_history_of_resolved_project():
+    historico = boards_history.BoardsHistory()
+    historico.record("Sonar Labs", _board(), dia=ONTEM, abertos=_abertos(_board()))
+    historico.record("Sonar Labs", _alterado(), dia=HOJE, abertos=_abertos(_alterado()))
+    handler = boards_handler.BoardsHandler(cache.CacheAgent(), History=historico)
+
+    resposta = handler._render_history_query(("mudancas",), "Sonar Labs", "Labs")
+
+    assert resposta.startswith("🔄 **Mudanças no board Labs desde 09/01**")
+    assert "#2: Doing → Done" in resposta
+    assert handler._render_history_query(("mudancas",), "Sonar", "Labs").startswith("❌")
@@ -0,0 +1,74 @@
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+
+# 5. Importando modulos locais
+from core.boards_index import CollaboratorIndex
+
+
+def _index(*nomes):
+    return CollaboratorIndex(pd.DataFrame({'responsavel': list(nomes) + [None]}))
+
+
+def test_full_name_matches():
+    index = _index("Ana Lima", "Ana Dias", "Bruno Dias")
+
+    assert index.match("tarefas da ana dias") == "Ana Dias"
+
+
+def test_full_name_beats_longer_name_with_same_tokens():
+    index = _index("Ana Dias Costa", "Ana Dias")
+
+    assert index.match("tarefas da ana dias") == "Ana Dias"
+
+
+def test_two_tokens_of_longer_name_match():
+    index = _index("Ana Maria Souza", "Ana Lima")
+
+    assert index.match("o que a ana souza está fazendo") == "Ana Maria Souza"
+
+
+def test_single_unique_token_matches():
+    index = _index("Heitor Rocha", "Ana Dias")
+
+    assert index.match("tarefas do heitor") == "Heitor Rocha"
+
+
+def test_single_token_shared_by_collaborators_is_ignored():
+    index = _index("Ana Lima", "Ana Dias")
+
+    assert index.match("tarefas da ana") is None
+
+
+def test_single_common_word_is_ignored():
+    index = _index("Ana Dias", "Bruno Lima")
+
+    assert index.match("itens alterados nos últimos 7 dias") is None
+
+
+def test_tie_between_collaborators_is_ambiguous():
+    index = _index("Ana Dias", "Ana Lima")
+
+    assert index.match("compare ana dias e ana lima") is None
+
+
+def test_accents_are_ignored():
+    index = _index("Fábio Mouro", "Ana Dias")
+
+    assert index.match("tarefas do fabio mouro") == "Fábio Mouro"
+
+
+def test_first_name_that_is_a_common_word_matches():
+    index = _index("Clara Souza", "Rosa Lima", "Vitória Campos", "Bento Ramos", "Ana Dias")
+
+    assert index.match("tarefas da clara") == "Clara Souza"
+    assert index.match("o que a rosa está fazendo") == "Rosa Lima"
+    assert index.match("tarefas da vitoria") == "Vitória Campos"
+    assert index.match("bugs do bento") == "Bento Ramos"
+
+
+def test_common_word_surname_alone_is_ignored():
+    index = _index("Vitória Campos", "Bruno Rosa")
+
+    assert index.match("tarefas dos campos obrigatórios") is None
+    assert index.match("etiqueta rosa") is None
+    assert index.match("tarefas do bruno rosa") == "Bruno Rosa"
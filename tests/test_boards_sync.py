@@ -0,0 +1,163 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+from datetime import datetime, timezone
+
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+import pytest
+
+# 5. Importando modulos locais
+from core import boards_sync
+from utils.fake_boards import FakeAzureBoardsService, generate_work_items
+
+PROJETO = "Sonar"
+AGORA = datetime(2026, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    """Relogio monotonico controlado pelos testes."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class FullOnlyBoardsService(FakeAzureBoardsService):
+    """Servico sem busca de itens alterados."""
+
+    buscar_work_items_alterados = None
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    relogio = FakeClock()
+    monkeypatch.setattr(boards_sync, "time", relogio)
+    return relogio
+
+
+def _marca(servico):
+    return max(pd.Timestamp(item['fields']['System.ChangedDate']) for item in servico.buscar_work_items())
+
+
+def _sincronizar(agente, *passos):
+    async def cenario():
+        resultados = []
+        df = None
+        for passo in passos:
+            passo()
+            df = await agente.sync(PROJETO, df)
+            resultados.append(df)
+        await agente.fetcher.close()
+        return resultados
+
+    return asyncio.run(cenario())
+
+
+def test_delta_picks_up_change_in_same_second_as_mark(clock):
+    servico = FakeAzureBoardsService(PROJETO, generate_work_items(30, agora=AGORA))
+    marca = _marca(servico)
+    agente = boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico)
+
+    def alterar_na_marca():
+        servico.upsert_work_item(999, **{'System.Title': "Novo", 'System.State': "To Do"})
+        servico._work_items[999]['fields']['System.ChangedDate'] = marca.isoformat()
+
+    completo, delta, sem_mudancas = _sincronizar(agente, lambda: None, alterar_na_marca, lambda: None)
+
+    assert 999 not in completo['id'].values
+    assert 999 in delta['id'].values
+    assert len(delta) == len(completo) + 1
+    assert sem_mudancas is delta
+    assert agente.stats['full_syncs'] == 1
+    assert agente.stats['delta_syncs'] == 2
+    assert agente.stats['delta_items'] == 1
+
+
+def test_deleted_item_removed_only_by_full_reconcile(clock):
+    servico = FakeAzureBoardsService(PROJETO, generate_work_items(30, agora=AGORA))
+    agente = boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico, full_reconcile_interval=3600)
+
+    def remover():
+        servico.remove_work_item(3)
+
+    def passar_intervalo():
+        clock.now += 3600
+
+    completo, delta, reconciliado = _sincronizar(agente, lambda: None, remover, passar_intervalo)
+
+    assert 3 in completo['id'].values
+    assert 3 in delta['id'].values
+    assert 3 not in reconciliado['id'].values
+    assert agente.stats['full_syncs'] == 2
+    assert agente.stats['delta_syncs'] == 1
+
+
+def test_service_without_changed_query_always_syncs_fully(clock):
+    servico = FullOnlyBoardsService(PROJETO, generate_work_items(30, agora=AGORA))
+    agente = boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico)
+
+    _sincronizar(agente, lambda: None, lambda: servico.remove_work_item(3))
+
+    assert agente.stats['full_syncs'] == 2
+    assert agente.stats['delta_syncs'] == 0
+    assert servico.chamadas['buscar_work_items'] == 2
+
+
+def test_epic_enrichment_reuses_synced_items(clock):
+    servico = FakeAzureBoardsService(PROJETO, generate_work_items(30, agora=AGORA))
+    agente = boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico)
+
+    async def cenario():
+        df, itens = await agente.sync_with_items(PROJETO)
+        enriquecido = await agente.enrich_epics(PROJETO, df, itens)
+        depois = await agente.sync_with_items(PROJETO)
+        await agente.fetcher.close()
+        return df, itens, enriquecido, depois
+
+    df, itens, enriquecido, depois = asyncio.run(cenario())
+
+    assert sorted(itens) == df['id'].tolist()
+    assert servico.chamadas['buscar_work_items'] == 2
+    assert enriquecido['id'].tolist() == df['id'].tolist()
+    assert agente.stats['epic_enrichments'] == 1
+    assert depois[1] is None
+    assert not hasattr(agente, "_work_items")
+
+
+def test_delta_sync_updates_a_copy_of_the_items(clock):
+    servico = FakeAzureBoardsService(PROJETO, generate_work_items(30, agora=AGORA))
+    agente = boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico)
+
+    async def cenario():
+        df, itens = await agente.sync_with_items(PROJETO)
+        servico.upsert_work_item(999, **{'System.Title': "Nova", 'System.WorkItemType': "Task"})
+        delta_df, delta_itens = await agente.sync_with_items(PROJETO, df, itens)
+        _, desconhecidos = await agente.sync_with_items(PROJETO, delta_df)
+        await agente.fetcher.close()
+        return itens, delta_itens, desconhecidos
+
+    itens, delta_itens, desconhecidos = asyncio.run(cenario())
+
+    assert agente.stats['delta_syncs'] == 2
+    assert 999 not in itens
+    assert sorted(delta_itens) == sorted(itens) + [999]
+    assert desconhecidos is None
+
+
+def test_epic_enrichment_downloads_board_not_synced_here(clock):
+    servico = FakeAzureBoardsService(PROJETO, generate_work_items(30, agora=AGORA))
+    df = _sincronizar(boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico), lambda: None)[0]
+    agente = boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico)
+
+    async def cenario():
+        enriquecido = await agente.enrich_epics(PROJETO, df)
+        await agente.enrich_epics(PROJETO, df)
+        await agente.fetcher.close()
+        return enriquecido
+
+    enriquecido = asyncio.run(cenario())
+
+    assert servico.chamadas['buscar_work_items'] == 2
+    assert len(enriquecido) == len(df)
@@ -0,0 +1,88 @@
+# 1. Importando bibliotecas padrao
+import sys
+
+# 5. Importando modulos locais
+from core import cache
+
+
+def test_entry_expires_after_ttl(clock):
+    store = cache.CacheStore(ttl=10)
+    store.set("a", "valor")
+
+    clock.advance(9.9)
+    assert store.get("a") == "valor"
+
+    clock.advance(0.1)
+    assert store.get("a") is None
+    assert store.get_entry("a") is None
+    assert store.stats['expirations'] == 1
+
+
+def test_expired_entry_kept_within_stale_limit(clock):
+    store = cache.CacheStore(ttl=10)
+    store.set("a", "valor", stale_ttl=5)
+
+    clock.advance(12)
+    assert store.get("a") is None
+    assert store.get_entry("a")['value'] == "valor"
+
+    clock.advance(3)
+    assert store.get_entry("a") is None
+
+
+def test_cleanup_expired_removes_only_expired(clock):
+    store = cache.CacheStore(ttl=10)
+    store.set("curta", 1, ttl=1)
+    store.set("longa", 2, ttl=100)
+
+    clock.advance(5)
+    assert store.cleanup_expired() == 1
+    assert len(store) == 1
+    assert store.get("longa") == 2
+
+
+def test_lru_eviction_by_bytes(clock):
+    valor = "x" * 1000
+    tamanho = sys.getsizeof(valor)
+    store = cache.CacheStore(ttl=60, max_entries=100, max_bytes=3 * tamanho)
+
+    for key in ("a", "b", "c"):
+        store.set(key, "x" * 1000)
+    assert store.total_bytes == 3 * tamanho
+
+    store.get("a")
+    store.set("d", "x" * 1000)
+
+    assert store.get_entry("b") is None
+    assert all(store.get_entry(key) is not None for key in ("a", "c", "d"))
+    assert store.total_bytes == 3 * tamanho
+    assert store.stats['evictions'] == 1
+
+
+def test_value_larger_than_limit_is_not_stored(clock):
+    store = cache.CacheStore(ttl=60, max_bytes=100)
+    store.set("grande", "x" * 1000)
+
+    assert len(store) == 0
+    assert store.total_bytes == 0
+
+
+def test_attached_artifact_is_counted_and_evicted_with_entry(clock):
+    valor = "x" * 1000
+    tamanho = sys.getsizeof(valor)
+    store = cache.CacheStore(ttl=60, max_bytes=3 * tamanho + 10)
+    store.set("a", valor)
+    store.set("b", "y" * 1000)
+
+    assert store.attach("a", valor, "artefato", "z" * 1000)
+    assert not store.attach("a", "outro valor", "artefato2", "w" * 1000)
+    assert store.get_entry("a")['size'] == 2 * tamanho
+    assert store.total_bytes == 3 * tamanho
+
+    store.get("a")
+    store.attach("a", valor, "maior", "k" * 1000)
+    assert store.get_entry("b") is None
+    assert store.total_bytes == 3 * tamanho
+
+    store.delete("a")
+    assert store.total_bytes == 0
@@ -0,0 +1,91 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+import pytest
+
+# 5. Importando modulos locais
+from core import cache
+from core.cache_backends import FileStoreClient, SharedCacheBackend
+
+
+@pytest.fixture
+def workers(tmp_path):
+    return (
+        SharedCacheBackend(FileStoreClient(str(tmp_path)), ttl=60),
+        SharedCacheBackend(FileStoreClient(str(tmp_path)), ttl=60),
+    )
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        cache.CacheBackend(60)
+
+
+def test_two_workers_share_an_entry(workers):
+    a, b = workers
+    df = pd.DataFrame({'id': [1, 2], 'estado': ["Doing", "Done"]})
+
+    a.set("boards_Sonar", df)
+
+    pd.testing.assert_frame_equal(b.get("boards_Sonar"), df)
+    assert len(b) == 1
+
+
+def test_local_copy_revalidated_by_token(workers):
+    a, b = workers
+    a.set("boards_Sonar", {'versao': 1})
+
+    primeira = b.get("boards_Sonar")
+    assert b.get("boards_Sonar") is primeira
+
+    a.set("boards_Sonar", {'versao': 2})
+    assert b.get("boards_Sonar") == {'versao': 2}
+
+    a.delete("boards_Sonar")
+    assert b.get("boards_Sonar") is None
+    assert len(b) == 0
+
+
+def test_clear_removes_entries_of_every_worker_in_prefix(tmp_path, workers):
+    a, b = workers
+    outro = SharedCacheBackend(FileStoreClient(str(tmp_path)), ttl=60, prefix="outro:")
+    a.set("boards_Sonar", [1])
+    b.set("boards_Labs", [2])
+    outro.set("boards_Sonar", [3])
+
+    a.clear()
+
+    assert a.get("boards_Sonar") is None
+    assert b.get("boards_Labs") is None
+    assert outro.get("boards_Sonar") == [3]
+
+
+def test_negative_result_survives_serialization(workers):
+    a, b = workers
+    a.set("boards_Sonar", cache.NEGATIVE_RESULT, ttl=30)
+
+    assert b.get_entry("boards_Sonar")['value'] is cache.NEGATIVE_RESULT
+    assert b.get("boards_Sonar") is None
+
+
+def test_second_worker_reuses_load_of_first(workers):
+    a, b = workers
+    chamadas = []
+
+    async def loader():
+        chamadas.append(1)
+        return pd.DataFrame({'id': [1, 2, 3]})
+
+    async def cenario():
+        agentes = [cache.CacheAgent(boards_backend=backend) for backend in (a, b)]
+        resultados = [await agente.get_or_load("boards_Sonar", loader) for agente in agentes]
+        for agente in agentes:
+            await agente.stop()
+        return resultados
+
+    primeiro, segundo = asyncio.run(cenario())
+
+    assert len(chamadas) == 1
+    pd.testing.assert_frame_equal(primeiro, segundo)
@@ -0,0 +1,177 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+import threading
+import time
+
+# 2. Importando blibliotecas de terceiros
+import pytest
+
+# 5. Importando modulos locais
+from core import cache, cache_warmer, boards_fetcher, boards_sync
+from handlers import boards_handler
+from utils.fake_boards import FakeAzureBoardsService, generate_work_items
+
+
+class FakeClock:
+    """Relogio monotonico controlado pelos testes."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    relogio = FakeClock()
+    monkeypatch.setattr(cache_warmer, "time", relogio)
+    return relogio
+
+
+class SharedBudgetBoardsService(FakeAzureBoardsService):
+    """Servico lento que registra quantas chamadas ao Azure rodam ao mesmo tempo, somando todos os projetos."""
+
+    simultaneas = 0
+    maximo = 0
+    lock = threading.Lock()
+
+    def buscar_work_items(self, batch_size: int = 100):
+        with self.lock:
+            SharedBudgetBoardsService.simultaneas += 1
+            SharedBudgetBoardsService.maximo = max(self.maximo, self.simultaneas)
+        time.sleep(0.05)
+        with self.lock:
+            SharedBudgetBoardsService.simultaneas -= 1
+        return super().buscar_work_items(batch_size)
+
+
+def _agente(carregados, liberar=None):
+    agente = cache.CacheAgent()
+
+    async def aquecer(projeto, refresh):
+        if liberar is not None:
+            await liberar.wait()
+        carregados.append((projeto, refresh))
+        return True
+
+    agente.register_project_hooks(aquecer, lambda projeto: 0)
+    return agente
+
+
+def test_start_does_not_wait_for_prefetch():
+    async def cenario():
+        carregados, liberar = [], asyncio.Event()
+        agente = _agente(carregados, liberar)
+        warmer = cache_warmer.CacheWarmer(agente, projetos=["Sonar", "Labs"], tick=3600)
+
+        await warmer.start()
+        antes = list(carregados)
+        liberar.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        depois = list(carregados)
+
+        await warmer.stop()
+        await agente.stop()
+        return antes, depois, warmer.stats
+
+    antes, depois, stats = asyncio.run(cenario())
+
+    assert antes == []
+    assert sorted(depois) == [("Labs", False), ("Sonar", False)]
+    assert stats['prefetches'] == 2
+
+
+def test_refresh_interval_follows_popularity():
+    agente = cache.CacheAgent()
+    warmer = cache_warmer.CacheWarmer(agente, projetos=[], interval=100, max_interval=1000, hot_queries=10)
+    agente.project_access.update({
+        'Popular': {'count': 25, 'last_access': 0.0},
+        'Medio': {'count': 4, 'last_access': 0.0},
+        'Raro': {'count': 0.5, 'last_access': 0.0},
+    })
+
+    assert warmer.refresh_interval('Popular') == 100
+    assert warmer.refresh_interval('Medio') == 250
+    assert warmer.refresh_interval('Raro') == 1000
+    assert warmer.refresh_interval('Desconhecido') == 1000
+
+
+def test_refresh_cycle_refreshes_only_due_projects(clock):
+    async def cenario():
+        carregados = []
+        agente = _agente(carregados)
+        warmer = cache_warmer.CacheWarmer(agente, projetos=[], interval=100, max_interval=10_000, hot_queries=10)
+        agente.project_access.update({
+            'Popular': {'count': 20, 'last_access': clock.now},
+            'Raro': {'count': 1, 'last_access': clock.now},
+        })
+
+        await warmer._refresh_cycle()
+        inicio = list(carregados)
+
+        clock.now += 100
+        await warmer._refresh_cycle()
+        apos_intervalo_curto = list(carregados)
+
+        clock.now += 1900
+        agente.project_access['Popular']['last_access'] = clock.now
+        agente.project_access['Raro']['last_access'] = clock.now
+        await warmer._refresh_cycle()
+        await agente.stop()
+        return inicio, apos_intervalo_curto, carregados
+
+    inicio, apos_intervalo_curto, final = asyncio.run(cenario())
+
+    assert inicio == []
+    assert apos_intervalo_curto == [("Popular", True)]
+    assert ("Raro", True) in final
+
+
+def test_idle_project_is_dropped(clock):
+    async def cenario():
+        carregados = []
+        agente = _agente(carregados)
+        warmer = cache_warmer.CacheWarmer(agente, projetos=[], interval=100, idle_after=600)
+        agente.project_access['Sonar'] = {'count': 20, 'last_access': clock.now}
+
+        await warmer._refresh_cycle()
+        clock.now += 601
+        await warmer._refresh_cycle()
+        await agente.stop()
+        return carregados, warmer
+
+    carregados, warmer = asyncio.run(cenario())
+
+    assert carregados == []
+    assert warmer.stats['dropped'] == 1
+    assert warmer.get_stats()['hot_projects'] == {}
+
+
+def test_warmer_and_user_requests_share_azure_budget():
+    servicos = {projeto: SharedBudgetBoardsService(projeto, generate_work_items(50)) for projeto in ("Sonar", "Labs")}
+
+    async def cenario():
+        agente = cache.CacheAgent()
+        fetcher = boards_fetcher.AsyncBoardsFetcher(max_concurrency=1)
+        handler = boards_handler.BoardsHandler(
+            agente, boards_sync.BoardsSyncAgent(service_factory=servicos.__getitem__, fetcher=fetcher)
+        )
+        warmer = cache_warmer.CacheWarmer(agente, projetos=["Labs"], tick=3600)
+
+        await warmer.start()
+        resposta = await handler.answer_with_boards("sonar visão geral")
+        while warmer.stats['prefetches'] < 1:
+            await asyncio.sleep(0.01)
+
+        await warmer.stop()
+        await agente.stop()
+        await fetcher.close()
+        return resposta, fetcher.stats
+
+    resposta, stats = asyncio.run(cenario())
+
+    assert resposta
+    assert stats['calls'] == 2
+    assert SharedBudgetBoardsService.maximo == 1
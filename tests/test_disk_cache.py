@@ -0,0 +1,27 @@
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+import pytest
+
+# 5. Importando modulos locais
+from core import disk_cache
+
+pytestmark = pytest.mark.skipif(disk_cache.pa is None, reason="pyarrow não está instalado")
+
+
+def test_round_trip_keeps_frame_and_age(tmp_path):
+    camada = disk_cache.DiskCacheTier(str(tmp_path))
+    df = pd.DataFrame({'id': [1, 2, 3], 'estado': pd.Categorical(["Doing", "Done", "Doing"])})
+
+    assert camada.save("boards_Sonar", df)
+    carregado, idade = camada.load("boards_Sonar")
+
+    pd.testing.assert_frame_equal(carregado, df)
+    assert 0 <= idade < 60
+
+
+def test_other_format_version_is_ignored(tmp_path, monkeypatch):
+    camada = disk_cache.DiskCacheTier(str(tmp_path))
+    camada.save("boards_Sonar", pd.DataFrame({'id': [1]}))
+
+    monkeypatch.setattr(disk_cache, "DISK_CACHE_FORMAT_VERSION", "0")
+    assert camada.load("boards_Sonar") is None
@@ -0,0 +1,95 @@
+# 1. Importando bibliotecas padrao
+import re
+from types import SimpleNamespace
+
+# 4. Importando constantes
+from src.services.constants import FILE_KEYWORDS, ACTION_KEYWORDS, CASUAL_WORDS, REGEX_PATTERNS
+
+# 5. Importando modulos locais
+from benchmarks.intent_benchmark import generate_messages
+from benchmarks.intent_regression import compare, load_corpus
+from core import intent_router
+
+FILE_EXTENSION = re.compile(REGEX_PATTERNS['file_extension'], re.IGNORECASE)
+FILE_NAMING = re.compile(REGEX_PATTERNS['file_naming'])
+
+
+def _score_original(message):
+    # Formula anterior ao FileScorer (IntentRouter._calculate_file_score com lru_cache)
+    message_lower = message.lower()
+    score = 0.0
+
+    if FILE_EXTENSION.search(message):
+        score += 0.5
+
+    score += sum(0.2 for keyword in FILE_KEYWORDS if keyword in message_lower)
+    score += sum(0.15 for keyword in ACTION_KEYWORDS if keyword in message_lower)
+
+    if FILE_NAMING.search(message):
+        score += 0.2
+
+    score -= sum(0.2 for word in CASUAL_WORDS if word in message_lower)
+
+    return max(min(score, 1.0), 0.0)
+
+
+def _mensagens():
+    mensagens = [exemplo['message'] for exemplo in load_corpus()]
+    # Variacoes de espaco e caixa, que nao podem ser normalizadas antes do calculo
+    mensagens += [m.replace(" ", "  ") for m in mensagens] + [m.upper() for m in mensagens]
+    mensagens += [" ".join(FILE_KEYWORDS[:3] + ACTION_KEYWORDS[:2] + CASUAL_WORDS[:1]) + " Relatorio_Final.pdf"]
+    return mensagens
+
+
+def test_scores_match_original_formula_on_corpus():
+    scorer = intent_router.FileScorer()
+
+    for mensagem in _mensagens():
+        assert scorer.score(mensagem) == _score_original(mensagem), mensagem
+
+
+def test_cache_is_keyed_on_raw_message():
+    scorer = intent_router.FileScorer()
+    scorer.score("me envie o relatório")
+    scorer.score("me  envie o relatório")
+
+    assert scorer.get_stats()['misses'] == 2
+    assert scorer.score("me envie o relatório") == _score_original("me envie o relatório")
+    assert scorer.get_stats()['hits'] == 1
+
+
+def test_router_features_are_reused_by_scorer(monkeypatch):
+    scorer = intent_router.FileScorer()
+    router = intent_router.IntentRouter(SimpleNamespace(modo_analise_boards={}),
+                                        SimpleNamespace(aprendizado_manual_ativo={}), file_scorer=scorer)
+
+    def nova_busca(message):
+        raise AssertionError("mensagem buscada de novo pelo FileScorer")
+
+    monkeypatch.setattr(scorer._extractor, "extract", nova_busca)
+    for mensagem in _mensagens():
+        features = router.FeatureExtractor.extract(mensagem)
+        assert router._calculate_file_score(mensagem, features) == _score_original(mensagem), mensagem
+        router._detect_intent(mensagem, "u", features)
+
+
+def test_batch_equals_per_message_on_corpus_without_repeats():
+    mensagens, user_ids = generate_messages(500, 20, seed=7, repetidas=False)
+    sessao = SimpleNamespace(modo_analise_boards={"user-3": True})
+    router = intent_router.IntentRouter(sessao, SimpleNamespace(aprendizado_manual_ativo={"user-5": True}),
+                                        file_scorer=intent_router.FileScorer())
+
+    assert len(set(mensagens)) == len(mensagens)
+    assert router.classify_batch(mensagens, user_ids) == [
+        router._detect_intent(mensagem, user_id) for mensagem, user_id in zip(mensagens, user_ids)
+    ]
+
+
+def test_regression_compares_timing_only_when_measured():
+    intents = {'file': {'precision': 1.0, 'recall': 1.0, 'support': 5}}
+    baseline = {'intents': intents, 'messages_per_second': 70000.0, 'p99_us': 30.0}
+    lento = {'intents': intents, 'messages_per_second': 100.0, 'p99_us': 900.0}
+
+    assert compare(dict(lento, messages_per_second=None, p99_us=None), baseline) == []
+    assert compare(lento, {'intents': intents}) == []
+    assert len(compare(lento, baseline)) == 2
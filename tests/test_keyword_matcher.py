@@ -0,0 +1,71 @@
+# 1. Importando bibliotecas padrao
+import random
+
+# 5. Importando modulos locais
+from core import cache
+from core.keyword_matcher import KeywordMatcher
+from handlers import boards_handler
+from handlers.boards_handler import (
+    BOARDS_KEYWORDS, BOARDS_KEYWORD_MATCHER, BURNDOWN_KEYWORDS, THROUGHPUT_KEYWORDS,
+    CHANGES_SINCE_YESTERDAY_KEYWORDS, DUE_THIS_WEEK_KEYWORDS,
+)
+
+CATEGORIAS = {
+    'SOBREPOSTAS': ["abc", "bcd", "cd", "b", "abcd"],
+    'PREFIXOS': ["burn", "burndown", "burn down", "down"],
+    'METACARACTERES': ["c++", "(x)", "a.b", "[x]", "?", r"\d", "$", "a|b", "^"],
+    'REPETIDAS': ["abc", "down", "vazão"],
+    'VAZIA': [""],
+}
+
+
+def _esperado(categorias, texto):
+    # Definicao do matcher: 'palavra in texto' para cada palavra de cada categoria
+    encontrados = {categoria: {palavra for palavra in palavras if palavra in texto}
+                   for categoria, palavras in categorias.items()}
+    return {categoria: palavras for categoria, palavras in encontrados.items() if palavras}
+
+
+def _textos(categorias, quantidade=500, seed=3):
+    gerador = random.Random(seed)
+    palavras = [palavra for lista in categorias.values() for palavra in lista]
+    pedacos = palavras + ["a", "c", "d", "x", " ", "ab", "1", "sonar", "ã"]
+    return [
+        "".join(gerador.choice(pedacos) for _ in range(gerador.randint(0, 12)))
+        for _ in range(quantidade)
+    ]
+
+
+def test_match_equals_substring_search():
+    matcher = KeywordMatcher(CATEGORIAS)
+
+    for texto in _textos(CATEGORIAS):
+        assert matcher.match(texto) == _esperado(CATEGORIAS, texto), texto
+
+
+def test_overlapping_and_prefix_keywords_are_all_found():
+    matcher = KeywordMatcher(CATEGORIAS)
+
+    assert matcher.match("abcd")['SOBREPOSTAS'] == {"abc", "bcd", "cd", "b", "abcd"}
+    assert matcher.match("burndown")['PREFIXOS'] == {"burn", "burndown", "down"}
+    assert matcher.match("a.b")['METACARACTERES'] == {"a.b"}
+    assert 'METACARACTERES' not in matcher.match("axb 5")
+
+
+def test_boards_keywords_equal_substring_search():
+    for texto in _textos(BOARDS_KEYWORDS, seed=11):
+        assert BOARDS_KEYWORD_MATCHER.match(texto) == _esperado(BOARDS_KEYWORDS, texto), texto
+
+
+def test_query_precedence_is_unchanged():
+    handler = boards_handler.BoardsHandler(cache.CacheAgent())
+    perguntas = _textos(BOARDS_KEYWORDS, seed=5) + [
+        f"{BURNDOWN_KEYWORDS[0]} e {THROUGHPUT_KEYWORDS[0]}",
+        f"{THROUGHPUT_KEYWORDS[0]} {CHANGES_SINCE_YESTERDAY_KEYWORDS[0]} {DUE_THIS_WEEK_KEYWORDS[0]}",
+    ]
+
+    for pergunta in perguntas:
+        assert handler._resolve_general_query(pergunta, BOARDS_KEYWORD_MATCHER.match(pergunta)) == \
+            handler._resolve_general_query(pergunta, _esperado(BOARDS_KEYWORDS, pergunta)), pergunta
+    assert handler._resolve_general_query(perguntas[-2], BOARDS_KEYWORD_MATCHER.match(perguntas[-2]))[0] == "burndown"
+    assert handler._resolve_general_query(perguntas[-1], BOARDS_KEYWORD_MATCHER.match(perguntas[-1]))[0] == "throughput"
@@ -0,0 +1,168 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+from types import SimpleNamespace
+
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+import pytest
+
+# 4. Importando constantes
+from src.services.constants import FILE_SEARCH_NO_RESULTS
+
+# 5. Importando modulos locais
+from core import cache
+from core.cache import SEARCH_NEGATIVE_CACHE_DURATION
+from handlers import general_handler
+
+
+def test_empty_result_is_not_cached():
+    async def cenario():
+        agente = cache.CacheAgent()
+        chamadas = []
+
+        async def loader():
+            chamadas.append(1)
+            return pd.DataFrame()
+
+        primeiro = await agente.get_or_load("k", loader)
+        await agente.get_or_load("k", loader)
+        await agente.stop()
+        return primeiro, chamadas, agente
+
+    primeiro, chamadas, agente = asyncio.run(cenario())
+
+    assert primeiro.empty
+    assert len(chamadas) == 2
+    assert agente.boards_cache.get_entry("k") is None
+
+
+def test_failed_load_is_cached_as_negative_result(clock):
+    async def cenario():
+        agente = cache.CacheAgent()
+        chamadas = []
+
+        async def loader():
+            chamadas.append(1)
+            if len(chamadas) == 1:
+                raise ConnectionError("azure fora do ar")
+            return "dados"
+
+        with pytest.raises(ConnectionError):
+            await agente.get_or_load("k", loader, negative_ttl=30)
+        dentro_da_janela = await agente.get_or_load("k", loader, negative_ttl=30)
+        chamadas_na_janela = len(chamadas)
+
+        clock.advance(30)
+        depois = await agente.get_or_load("k", loader, negative_ttl=30)
+        await agente.stop()
+        return dentro_da_janela, chamadas_na_janela, depois, agente
+
+    dentro_da_janela, chamadas_na_janela, depois, agente = asyncio.run(cenario())
+
+    assert dentro_da_janela is None
+    assert chamadas_na_janela == 1
+    assert depois == "dados"
+    assert agente.boards_cache.stats['negative_hits'] == 1
+
+
+def test_explicit_negative_result_is_cached():
+    async def cenario():
+        agente = cache.CacheAgent()
+        chamadas = []
+
+        async def loader():
+            chamadas.append(1)
+            return cache.NEGATIVE_RESULT
+
+        resultados = [await agente.get_or_load("k", loader) for _ in range(3)]
+        await agente.stop()
+        return resultados, chamadas, agente
+
+    resultados, chamadas, agente = asyncio.run(cenario())
+
+    assert resultados == [None, None, None]
+    assert len(chamadas) == 1
+    assert agente.get("k") is None
+
+
+class FakeSharePoint:
+    """SharePoint falso que registra os termos buscados."""
+
+    def __init__(self, resposta=None, erro=None) -> None:
+        self.resposta = resposta or []
+        self.erro = erro
+        self.buscas = []
+
+    def search_files(self, termo):
+        self.buscas.append(termo)
+        if self.erro is not None:
+            raise self.erro
+        return self.resposta
+
+
+def _handler(sharepoint):
+    async def interpretar_termo_busca(termo):
+        return termo
+
+    helper = SimpleNamespace(
+        sharepoint_service=sharepoint,
+        openai_service=SimpleNamespace(interpretar_termo_busca=interpretar_termo_busca),
+        _format_search_results=lambda user_id, termo, arquivos: [arquivo['name'] for arquivo in arquivos],
+    )
+    return general_handler.GeneralHandler(cache.CacheAgent(), helper, None)
+
+
+def test_normalize_search_term_ignores_case_accents_and_separators():
+    handler = _handler(FakeSharePoint())
+    chaves = {handler._normalize_search_term(termo) for termo in (
+        "Relatório Final", "relatorio_final", "  RELATÓRIO--final ", "Relatorio \t_ Final",
+    )}
+
+    assert chaves == {"relatorio final"}
+    assert handler._normalize_search_term("Relatório Final 2024") != "relatorio final"
+    assert handler._normalize_search_term("Ação_Çedilha") == "acao cedilha"
+
+
+def test_search_without_results_is_cached_until_negative_ttl(clock):
+    sharepoint = FakeSharePoint()
+    handler = _handler(sharepoint)
+
+    async def cenario():
+        primeira = await handler.search_sharepoint_files("u", "Relatório Final")
+        buscas_iniciais = len(sharepoint.buscas)
+        clock.advance(SEARCH_NEGATIVE_CACHE_DURATION - 1)
+        dentro_da_janela = await handler.search_sharepoint_files("u", "relatorio_final")
+        buscas_na_janela = len(sharepoint.buscas)
+        clock.advance(1)
+        await handler.search_sharepoint_files("u", "Relatório Final")
+        await handler.CacheAgent.stop()
+        return primeira, buscas_iniciais, dentro_da_janela, buscas_na_janela
+
+    primeira, buscas_iniciais, dentro_da_janela, buscas_na_janela = asyncio.run(cenario())
+
+    assert primeira == FILE_SEARCH_NO_RESULTS.format("Relatório Final")
+    assert dentro_da_janela == FILE_SEARCH_NO_RESULTS.format("relatorio_final")
+    assert buscas_iniciais > 0
+    assert buscas_na_janela == buscas_iniciais
+    assert len(sharepoint.buscas) == 2 * buscas_iniciais
+    assert handler.CacheAgent.stores["search"].stats['expirations'] == 1
+
+
+def test_failed_search_is_not_cached_as_no_result(clock):
+    sharepoint = FakeSharePoint(erro=ConnectionError("sharepoint fora do ar"))
+    handler = _handler(sharepoint)
+
+    async def cenario():
+        await handler.search_sharepoint_files("u", "Relatório Final")
+        buscas_iniciais = len(sharepoint.buscas)
+        sharepoint.erro = None
+        sharepoint.resposta = [{'name': "Relatorio_Final.pdf"}]
+        encontrados = await handler.search_sharepoint_files("u", "relatorio final")
+        await handler.CacheAgent.stop()
+        return buscas_iniciais, encontrados
+
+    buscas_iniciais, encontrados = asyncio.run(cenario())
+
+    assert encontrados == ["Relatorio_Final.pdf"]
+    assert len(sharepoint.buscas) == buscas_iniciais + 1
+    assert handler.CacheAgent.get("relatorio final", namespace="search") == [{'name': "Relatorio_Final.pdf"}]
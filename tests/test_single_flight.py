@@ -0,0 +1,55 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+
+# 5. Importando modulos locais
+from core import cache
+
+
+def test_concurrent_callers_share_one_load():
+    async def cenario():
+        agente = cache.CacheAgent()
+        liberar = asyncio.Event()
+        chamadas = []
+
+        async def loader():
+            chamadas.append(1)
+            await liberar.wait()
+            return "dados"
+
+        tarefas = [asyncio.ensure_future(agente.get_or_load("k", loader)) for _ in range(10)]
+        await asyncio.sleep(0)
+        liberar.set()
+        resultados = await asyncio.gather(*tarefas)
+        await agente.stop()
+        return chamadas, resultados, agente
+
+    chamadas, resultados, agente = asyncio.run(cenario())
+
+    assert len(chamadas) == 1
+    assert resultados == ["dados"] * 10
+    assert agente.single_flight.stats == {'fetches': 1, 'coalesced': 9}
+
+
+def test_loader_exception_reaches_every_waiter():
+    async def cenario():
+        agente = cache.CacheAgent()
+        liberar = asyncio.Event()
+        chamadas = []
+
+        async def loader():
+            chamadas.append(1)
+            await liberar.wait()
+            raise ConnectionError("azure fora do ar")
+
+        tarefas = [asyncio.ensure_future(agente.get_or_load("k", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        liberar.set()
+        resultados = await asyncio.gather(*tarefas, return_exceptions=True)
+        await agente.stop()
+        return chamadas, resultados
+
+    chamadas, resultados = asyncio.run(cenario())
+
+    assert len(chamadas) == 1
+    assert len(resultados) == 5
+    assert all(isinstance(resultado, ConnectionError) for resultado in resultados)
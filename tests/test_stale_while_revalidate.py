@@ -0,0 +1,68 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+
+# 5. Importando modulos locais
+from core import cache
+
+
+def test_stale_value_served_while_one_refresh_runs(clock):
+    async def cenario():
+        agente = cache.CacheAgent(hard_stale_limit=60)
+        versoes = iter(["v1", "v2"])
+        liberar = asyncio.Event()
+        chamadas = []
+
+        async def loader():
+            chamadas.append(1)
+            versao = next(versoes)
+            if versao == "v2":
+                await liberar.wait()
+            return versao
+
+        primeiro = await agente.get_or_load("k", loader, ttl=10, stale_while_revalidate=True)
+        clock.advance(15)
+
+        servidos = await asyncio.gather(*[
+            agente.get_or_load("k", loader, ttl=10, stale_while_revalidate=True) for _ in range(5)
+        ])
+        atualizacoes = len(agente._refresh_tasks)
+
+        liberar.set()
+        await asyncio.gather(*list(agente._refresh_tasks))
+        depois = await agente.get_or_load("k", loader, ttl=10, stale_while_revalidate=True)
+        await agente.stop()
+        return primeiro, servidos, atualizacoes, chamadas, depois, agente
+
+    primeiro, servidos, atualizacoes, chamadas, depois, agente = asyncio.run(cenario())
+
+    assert primeiro == "v1"
+    assert servidos == ["v1"] * 5
+    assert atualizacoes == 1
+    assert len(chamadas) == 2
+    assert depois == "v2"
+    assert agente.boards_cache.stats['stale_hits'] == 5
+
+
+def test_failed_refresh_keeps_stale_value(clock):
+    async def cenario():
+        agente = cache.CacheAgent(hard_stale_limit=60)
+        respostas = iter(["v1", ConnectionError("azure fora do ar")])
+
+        async def loader():
+            resposta = next(respostas)
+            if isinstance(resposta, Exception):
+                raise resposta
+            return resposta
+
+        await agente.get_or_load("k", loader, ttl=10, stale_while_revalidate=True)
+        clock.advance(15)
+        servido = await agente.get_or_load("k", loader, ttl=10, stale_while_revalidate=True)
+        await asyncio.gather(*list(agente._refresh_tasks), return_exceptions=True)
+        entrada = agente.boards_cache.get_entry("k")
+        await agente.stop()
+        return servido, entrada
+
+    servido, entrada = asyncio.run(cenario())
+
+    assert servido == "v1"
+    assert entrada['value'] == "v1"
@@ -0,0 +1,95 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+
+# 5. Importando modulos locais
+from core import cache, boards_sync, tracing
+from handlers import boards_handler
+from utils.fake_boards import FakeAzureBoardsService, generate_work_items
+
+
+def test_background_refresh_does_not_join_request_trace():
+    tracer = tracing.Tracer()
+
+    async def cenario():
+        agente = cache.CacheAgent(hard_stale_limit=60)
+        liberar = asyncio.Event()
+        versoes = iter(["v1", "v2"])
+
+        async def loader():
+            versao = next(versoes)
+            if versao == "v2":
+                await liberar.wait()
+            with tracing.span("azure_boards.sync"):
+                return versao
+
+        await agente.get_or_load("k", loader, ttl=0.01, stale_while_revalidate=True)
+        await asyncio.sleep(0.02)
+
+        with tracer.trace() as rastro:
+            tracing.set_intent("boards")
+            servido = await agente.get_or_load("k", loader, ttl=0.01, stale_while_revalidate=True)
+            atualizacoes = list(agente._refresh_tasks)
+
+        liberar.set()
+        await asyncio.gather(*atualizacoes)
+        await agente.stop()
+        return rastro, servido, atualizacoes
+
+    rastro, servido, atualizacoes = asyncio.run(cenario())
+
+    assert servido == "v1"
+    assert len(atualizacoes) == 1
+    assert [registro['name'] for registro in rastro.spans] == ["answer"]
+    assert set(tracer.histograms["boards"]) == {"answer"}
+
+
+def test_foreground_cold_miss_records_boards_load():
+    tracer = tracing.Tracer()
+    servico = FakeAzureBoardsService("Sonar", generate_work_items(30))
+    agente = cache.CacheAgent()
+    sync = boards_sync.BoardsSyncAgent(service_factory=lambda projeto: servico)
+    handler = boards_handler.BoardsHandler(agente, sync)
+
+    async def cenario():
+        rastros = []
+        for _ in range(2):
+            with tracer.trace() as rastro:
+                tracing.set_intent("boards")
+                await handler._get_boards_data_cached("Sonar")
+            rastros.append(rastro)
+        await agente.stop()
+        await sync.fetcher.close()
+        return rastros
+
+    frio, quente = asyncio.run(cenario())
+
+    assert [registro['name'] for registro in frio.spans] == ["azure_boards.load", "answer"]
+    assert [registro['name'] for registro in quente.spans] == ["answer"]
+    assert servico.chamadas['buscar_work_items'] == 1
+
+
+def test_span_ignores_finished_trace():
+    tracer = tracing.Tracer()
+
+    async def cenario():
+        liberar = asyncio.Event()
+
+        async def tarefa_atrasada():
+            await liberar.wait()
+            with tracing.span("tarde"):
+                pass
+
+        with tracer.trace() as rastro:
+            with tracing.span("cedo"):
+                pass
+            # Tarefa criada dentro do rastro herda o contexto da requisicao
+            tarefa = asyncio.ensure_future(tarefa_atrasada())
+
+        liberar.set()
+        await tarefa
+        return rastro
+
+    rastro = asyncio.run(cenario())
+
+    assert rastro.finished
+    assert [registro['name'] for registro in rastro.spans] == ["cedo", "answer"]
@@ -0,0 +1,100 @@
+# 1. Importando bibliotecas padrao
+import asyncio
+from datetime import datetime, timezone
+
+# 2. Importando blibliotecas de terceiros
+import pandas as pd
+
+# 3. Importando aplicacoes locais
+from src.services.module.boards.processing import processar_work_items_df
+
+# 5. Importando modulos locais
+from core import cache, boards_frame
+from handlers import boards_handler
+from utils.fake_boards import generate_work_items
+
+AGORA = datetime(2026, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _hierarquia_original(df):
+    # Renderizacao anterior a vetorizacao (iterrows aninhado), sem paginacao
+    user_stories = df[df['tipo'].str.lower() == "user story"]
+    tasks = df[df['tipo'].str.lower() == "task"]
+
+    if user_stories.empty:
+        return "❌ Nenhuma User Story encontrada no board."
+
+    linhas = []
+    for _, us in user_stories.iterrows():
+        linhas.append(f"🔹 **{us['titulo']}** (#{us['id']})")
+        tarefas_us = tasks[tasks["area"] == us["area"]]
+        if tarefas_us.empty:
+            linhas.append("   • _(sem tasks registradas)_")
+        else:
+            for _, t in tarefas_us.iterrows():
+                linhas.append(f"   • {t['titulo']} (#{t['id']})")
+
+    return "\n".join(linhas)
+
+
+def _frame(quantidade=600):
+    return asyncio.run(processar_work_items_df(generate_work_items(quantidade, agora=AGORA), projeto="Sonar"))
+
+
+def _board_pequeno():
+    return pd.DataFrame({
+        'id': [1, 2, 3, 4, 5, 6, 7],
+        'titulo': ["Login", "Tela", "API", "Relatório", "Deploy", "Órfã", "Sem área"],
+        'tipo': ["User Story", "Task", "Task", "User Story", "Task", "Task", "User Story"],
+        'area': ["Sonar\\Web", "Sonar\\Web", "Sonar\\Web", "Sonar\\Dados", "Sonar\\Infra", "Sonar\\Infra", None],
+    })
+
+
+def _handler():
+    return boards_handler.BoardsHandler(cache.CacheAgent())
+
+
+def test_hierarchy_matches_original_renderer():
+    handler = _handler()
+
+    for df in (_board_pequeno(), _frame(), boards_frame.compact_boards_frame(_frame())[0]):
+        assert handler._format_user_story_hierarchy(df, por_pagina=None) == _hierarquia_original(df)
+
+
+def test_board_without_user_stories():
+    df = _board_pequeno()
+    df = df[df['tipo'] == "Task"]
+
+    assert _handler()._format_user_story_hierarchy(df) == _hierarquia_original(df)
+
+
+def test_pages_split_between_parents():
+    df = _board_pequeno()
+    df = pd.concat([df] * 3, ignore_index=True)
+    df['id'] = range(1, len(df) + 1)
+    handler = _handler()
+    completo = handler._format_user_story_hierarchy(df, por_pagina=None)
+
+    partes = list(handler.iter_user_story_hierarchy(df, tamanho_lote=4))
+    paginas = [handler._format_user_story_hierarchy(df, pagina=pagina, por_pagina=4) for pagina in (1, 2, 3)]
+
+    assert len(partes) == 3
+    assert "\n".join(partes) == completo
+    assert all(parte.startswith("🔹 **") for parte in partes)
+    assert [parte.count("🔹") for parte in partes] == [4, 4, 1]
+    for parte, pagina, numero in zip(partes, paginas, (1, 2, 3)):
+        assert pagina == (
+            f"{parte}\n\n📄 Página {numero} de 3 (9 User Stories). "
+            "Inclua \"página N\" na pergunta para ver as demais."
+        )
+
+
+def test_page_number_is_clamped():
+    df = _frame()
+    handler = _handler()
+    total = len(list(handler.iter_user_story_hierarchy(df, tamanho_lote=10)))
+
+    assert handler._format_user_story_hierarchy(df, pagina=0, por_pagina=10) == \
+        handler._format_user_story_hierarchy(df, pagina=1, por_pagina=10)
+    assert handler._format_user_story_hierarchy(df, pagina=total + 5, por_pagina=10) == \
+        handler._format_user_story_hierarchy(df, pagina=total, por_pagina=10)
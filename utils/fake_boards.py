@@ -0,0 +1,132 @@
+# 1. Importando bibliotecas padrao
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, List
+
+# Parametros do gerador de Boards sinteticos
+SYNTHETIC_TYPES = (("Task", 0.55), ("Bug", 0.2), ("User Story", 0.2), ("Epic", 0.05))
+SYNTHETIC_STATES = ("To Do", "Doing", "Done", "Closed")
+SYNTHETIC_FIRST_NAMES = ("Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Gabriela", "Heitor", "Isabela", "João")
+SYNTHETIC_LAST_NAMES = ("Souza", "Lima", "Dias", "Mouro", "Costa", "Alves", "Rocha", "Pereira")
+SYNTHETIC_CLIENTS = ("Cliente Alfa", "Cliente Beta", "Cliente Gama", "Cliente Delta", "Cliente Ômega")
+
+
+def generate_work_items(quantidade: int, seed: int = 42,
+                        agora: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Gera itens brutos de AzureBoards deterministicos (mesma semente -> mesmos itens), para benchmarks.
+
+    args:
+        quantidade: int de itens gerados
+        seed: int da semente aleatoria
+        agora: datetime de referencia das datas (padrao agora, em UTC)
+
+    retorna list de itens brutos no formato da API do Azure ('id' e 'fields')
+    """
+
+    gerador = random.Random(seed)
+    agora = agora or datetime.now(timezone.utc)
+
+    tipos, pesos = zip(*SYNTHETIC_TYPES)
+    pessoas = [f"{nome} {sobrenome}" for nome in SYNTHETIC_FIRST_NAMES for sobrenome in SYNTHETIC_LAST_NAMES]
+    areas = [f"{cliente}\\Sprint {n}" for cliente in SYNTHETIC_CLIENTS for n in range(1, max(2, quantidade // 500) + 1)]
+
+    work_items = []
+    for item_id in range(1, quantidade + 1):
+        tipo = gerador.choices(tipos, pesos)[0]
+        alterado = agora - timedelta(minutes=gerador.randint(0, 60 * 24 * 90))
+        prazo = agora + timedelta(days=gerador.randint(-30, 30))
+        work_items.append({
+            'id': item_id,
+            'fields': {
+                'System.Title': f"{tipo} {item_id} - {gerador.choice(SYNTHETIC_CLIENTS)}",
+                'System.WorkItemType': tipo,
+                'System.State': gerador.choice(SYNTHETIC_STATES),
+                'System.AssignedTo': gerador.choice(pessoas) if gerador.random() > 0.05 else None,
+                'System.AreaPath': gerador.choice(areas),
+                'System.ChangedDate': alterado.isoformat(),
+                'Microsoft.VSTS.Scheduling.TargetDate': prazo.date().isoformat(),
+            },
+        })
+    return work_items
+
+
+class FakeAzureBoardsService:
+    """Servico local de AzureBoards em memoria, para testes sem acesso ao Azure."""
+
+    def __init__(self, projeto: str, work_items: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Construtor do servico falso.
+
+        args:
+            projeto: String de identificacao do projeto
+            work_items: list de itens brutos no formato da API do Azure ('id' e 'fields')
+
+        """
+
+        self.projeto = projeto
+        self.chamadas = {'buscar_work_items': 0, 'buscar_work_items_alterados': 0}
+
+        self._work_items = {item['id']: item for item in work_items or []}
+
+    ###################
+    # Funcoes publicas
+    ###################
+
+    def buscar_work_items(self, batch_size: int = 100) -> List[Dict[str, Any]]:
+        """
+        Retorna todos os itens do Board.
+
+        args:
+            batch_size: int de tamanho do lote (ignorado)
+
+        retorna list de itens brutos
+        """
+
+        self.chamadas['buscar_work_items'] += 1
+        return list(self._work_items.values())
+
+    def buscar_work_items_alterados(self, desde: str, batch_size: int = 100) -> List[Dict[str, Any]]:
+        """
+        Retorna os itens alterados apos uma data.
+
+        args:
+            desde: String de data ISO da ultima alteracao conhecida
+            batch_size: int de tamanho do lote (ignorado)
+
+        retorna list de itens brutos alterados
+        """
+
+        self.chamadas['buscar_work_items_alterados'] += 1
+        limite = datetime.fromisoformat(desde.replace("Z", "+00:00"))
+        return [
+            item for item in self._work_items.values()
+            if datetime.fromisoformat(item['fields']['System.ChangedDate'].replace("Z", "+00:00")) > limite
+        ]
+
+    def upsert_work_item(self, item_id: int, **fields: Any) -> Dict[str, Any]:
+        """
+        Cria ou altera um item, atualizando sua data de alteracao.
+
+        args:
+            item_id: int de identificacao do item
+            fields: campos do Azure a serem gravados (ex.: **{'System.State': 'Done'})
+
+        retorna dict do item gravado
+        """
+
+        item = self._work_items.setdefault(item_id, {'id': item_id, 'fields': {}})
+        item['fields'].update(fields)
+        item['fields']['System.ChangedDate'] = datetime.now(timezone.utc).isoformat()
+        return item
+
+    def remove_work_item(self, item_id: int) -> None:
+        """
+        Remove um item do Board.
+
+        args:
+            item_id: int de identificacao do item
+
+        """
+
+        self._work_items.pop(item_id, None)